@@ -39,14 +39,16 @@ class ImbalanceDetector:
         if len(levels) < 2:
             return signals
 
-        for i in range(1, len(levels)):
-            current = levels[i]
-            below = levels[i - 1]
+        threshold = self.threshold
+        min_volume = self.min_volume
 
+        # Walk (below, current, above) triples; the top level has no level
+        # above it, so it can only be a buy imbalance
+        for below, current, above in zip(levels, levels[1:], levels[2:] + [None]):
             # Buy imbalance: aggressive buying lifting offers
-            if below.bid_volume > 0 and current.ask_volume >= self.min_volume:
+            if below.bid_volume > 0 and current.ask_volume >= min_volume:
                 ratio = current.ask_volume / below.bid_volume
-                if ratio >= self.threshold:
+                if ratio >= threshold:
                     signals.append(Signal(
                         timestamp=bar.end_time,
                         symbol=bar.symbol,
@@ -63,25 +65,23 @@ class ImbalanceDetector:
                     ))
 
             # Sell imbalance: aggressive selling hitting bids
-            if i < len(levels) - 1:
-                above = levels[i + 1]
-                if above.ask_volume > 0 and current.bid_volume >= self.min_volume:
-                    ratio = current.bid_volume / above.ask_volume
-                    if ratio >= self.threshold:
-                        signals.append(Signal(
-                            timestamp=bar.end_time,
-                            symbol=bar.symbol,
-                            pattern=SignalPattern.SELL_IMBALANCE,
-                            direction="SHORT",
-                            strength=min(ratio / 10, 1.0),
-                            price=current.price,
-                            details={
-                                "ratio": round(ratio, 2),
-                                "bid_volume": current.bid_volume,
-                                "ask_volume_above": above.ask_volume,
-                                "price_above": above.price,
-                            }
-                        ))
+            if above is not None and above.ask_volume > 0 and current.bid_volume >= min_volume:
+                ratio = current.bid_volume / above.ask_volume
+                if ratio >= threshold:
+                    signals.append(Signal(
+                        timestamp=bar.end_time,
+                        symbol=bar.symbol,
+                        pattern=SignalPattern.SELL_IMBALANCE,
+                        direction="SHORT",
+                        strength=min(ratio / 10, 1.0),
+                        price=current.price,
+                        details={
+                            "ratio": round(ratio, 2),
+                            "bid_volume": current.bid_volume,
+                            "ask_volume_above": above.ask_volume,
+                            "price_above": above.price,
+                        }
+                    ))
 
         return signals
 
@@ -2,6 +2,8 @@
 
 from typing import Callable, Dict, List, Any
 
+import numpy as np
+
 from src.core.types import Tick, FootprintBar, Signal
 from src.core.config import get_config
 from src.core.constants import get_symbol_profile
@@ -91,6 +93,30 @@ class OrderFlowEngine:
         self.tick_count += 1
         self.aggregator.process_tick(tick)
 
+    def process_ticks(
+        self,
+        ts_ns: np.ndarray,
+        prices: np.ndarray,
+        volumes: np.ndarray,
+        sides: np.ndarray,
+        symbol: str,
+    ) -> None:
+        """
+        Process a batch of ticks given as parallel arrays.
+
+        Produces the same bars, callbacks and signals as calling process_tick
+        for each tick, without building Tick objects.
+
+        Args:
+            ts_ns: int64 UTC timestamps in nanoseconds
+            prices: Trade prices
+            volumes: Trade sizes
+            sides: Nonzero for ASK (buy aggressor) trades, zero for BID
+            symbol: Symbol of the ticks
+        """
+        self.tick_count += len(ts_ns)
+        self.aggregator.process_arrays(ts_ns, prices, volumes, sides, symbol)
+
     def _on_bar_complete(self, bar: FootprintBar) -> None:
         """Handle bar completion - run analysis."""
         self.bar_count += 1
@@ -0,0 +1,42 @@
+"""
+Optional Numba JIT support.
+
+numba is not a required dependency. ``njit`` compiles with numba when it is
+installed and otherwise returns the function unchanged, so kernels still run
+as plain Python. Set NUMBA_DISABLE_JIT=1 to force the Python path with numba
+installed. A compiled kernel keeps the original function on ``.py_func``.
+
+Kernels are compiled eagerly from their signatures and cached on disk, so
+only the first run after a change pays for LLVM. The cache lives under
+~/.cache/tradebot/numba unless NUMBA_CACHE_DIR is set; run
+``python -m src.execution.kernels`` to build it ahead of time.
+"""
+
+import os
+
+# Must be set before numba is imported; keeps the cache usable when the
+# source tree is read-only
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "tradebot", "numba")
+)
+
+try:
+    from numba import njit as _numba_njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def njit(*args, **kwargs):
+    """numba.njit when available, else a no-op decorator."""
+    if HAS_NUMBA:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
+
+
+def py_func(kernel):
+    """Get the pure-Python version of a kernel."""
+    return getattr(kernel, "py_func", kernel)
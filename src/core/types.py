@@ -2,11 +2,13 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Literal, Optional, Any
+from typing import Dict, List, Literal, Optional, Any, Tuple
 from enum import Enum
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Tick:
     """Single trade execution from the exchange."""
     timestamp: datetime
@@ -16,7 +18,7 @@ class Tick:
     symbol: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceLevel:
     """Aggregated volume at a single price within a bar."""
     price: float
@@ -33,7 +35,7 @@ class PriceLevel:
         return self.ask_volume - self.bid_volume
 
 
-@dataclass
+@dataclass(slots=True)
 class FootprintBar:
     """A time-based bar containing volume at each price level."""
     symbol: str
@@ -69,6 +71,21 @@ class FootprintBar:
         """Get price levels sorted by price."""
         return sorted(self.levels.values(), key=lambda x: x.price, reverse=not ascending)
 
+    def level_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the price levels as parallel arrays sorted by ascending price.
+
+        Returns (prices, bid_volumes, ask_volumes) as float64, int64, int64
+        arrays, for detectors that scan every level of a bar.
+        """
+        n = len(self.levels)
+        levels = self.levels.values()
+        prices = np.fromiter((level.price for level in levels), dtype=np.float64, count=n)
+        bid = np.fromiter((level.bid_volume for level in levels), dtype=np.int64, count=n)
+        ask = np.fromiter((level.ask_volume for level in levels), dtype=np.int64, count=n)
+        order = np.argsort(prices, kind="stable")
+        return prices[order], bid[order], ask[order]
+
 
 class SignalPattern(Enum):
     """All detectable order flow patterns."""
@@ -87,7 +104,7 @@ class SignalPattern(Enum):
     UNFINISHED_REVISITED = "UNFINISHED_REVISITED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     """Output from pattern detection."""
     timestamp: datetime
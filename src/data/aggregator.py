@@ -1,10 +1,12 @@
 """Footprint bar aggregation and volume tracking."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from src.core.types import Tick, PriceLevel, FootprintBar
-from src.core.constants import normalize_price
+from src.core.constants import TICK_SIZES, normalize_price
 
 
 class FootprintAggregator:
@@ -44,6 +46,81 @@ class FootprintAggregator:
         self._add_tick_to_bar(tick)
         return None
 
+    def process_arrays(
+        self,
+        ts_ns: np.ndarray,
+        prices: np.ndarray,
+        volumes: np.ndarray,
+        sides: np.ndarray,
+        symbol: str,
+    ) -> List[FootprintBar]:
+        """
+        Process a run of ticks given as parallel arrays.
+
+        Equivalent to calling process_tick for each tick in order: bars close
+        on the first tick of the next bar, and callbacks fire at that point.
+        Timestamps are int64 UTC nanoseconds; a nonzero side is an ASK
+        (buy aggressor) trade.
+
+        Returns the bars completed by this batch.
+        """
+        completed_bars = []
+        if len(ts_ns) == 0:
+            return completed_bars
+
+        tick_size = TICK_SIZES.get(symbol[:3], TICK_SIZES.get(symbol[:2], 0.25))
+        norm = np.round(prices / tick_size) * tick_size
+        bar_starts = (ts_ns // 1_000_000_000) // self.timeframe * self.timeframe
+        bounds = np.flatnonzero(np.diff(bar_starts)) + 1
+        edges = [0, *bounds.tolist(), len(ts_ns)]
+
+        for lo, hi in zip(edges[:-1], edges[1:]):
+            bar_start = datetime.fromtimestamp(int(bar_starts[lo]), tz=timezone.utc)
+
+            if self.current_bar is not None and bar_start <= self.current_bar.start_time:
+                self._add_arrays_to_bar(norm[lo:hi], volumes[lo:hi], sides[lo:hi])
+                continue
+
+            completed = self.current_bar
+            self.current_bar = self._new_bar(symbol, bar_start, float(norm[lo]))
+            self._add_arrays_to_bar(norm[lo:lo + 1], volumes[lo:lo + 1], sides[lo:lo + 1])
+            if completed is not None:
+                self.completed_bars.append(completed)
+                completed_bars.append(completed)
+                self._notify_bar_complete(completed)
+            self._add_arrays_to_bar(norm[lo + 1:hi], volumes[lo + 1:hi], sides[lo + 1:hi])
+
+        return completed_bars
+
+    def _add_arrays_to_bar(self, prices: np.ndarray, volumes: np.ndarray, sides: np.ndarray) -> None:
+        """Add normalized-price tick arrays to the current bar."""
+        if len(prices) == 0:
+            return
+
+        bar = self.current_bar
+        bar.high_price = max(bar.high_price, float(prices.max()))
+        bar.low_price = min(bar.low_price, float(prices.min()))
+        bar.close_price = float(prices[-1])
+
+        # Aggregate per price, keeping first-seen level order like process_tick
+        uniq, first, inverse = np.unique(prices, return_index=True, return_inverse=True)
+        is_ask = sides != 0
+        ask = np.bincount(inverse[is_ask], weights=volumes[is_ask], minlength=len(uniq))
+        bid = np.bincount(inverse[~is_ask], weights=volumes[~is_ask], minlength=len(uniq))
+        order = np.argsort(first, kind="stable")
+
+        levels = bar.levels
+        for price, ask_volume, bid_volume in zip(
+            uniq[order].tolist(),
+            ask[order].astype(np.int64).tolist(),
+            bid[order].astype(np.int64).tolist(),
+        ):
+            level = levels.get(price)
+            if level is None:
+                level = levels[price] = PriceLevel(price=price)
+            level.ask_volume += ask_volume
+            level.bid_volume += bid_volume
+
     def _add_tick_to_bar(self, tick: Tick) -> None:
         """Add tick volume to appropriate price level."""
         bar = self.current_bar
@@ -75,8 +152,12 @@ class FootprintAggregator:
     def _create_new_bar(self, tick: Tick, bar_start: datetime) -> FootprintBar:
         """Create a new footprint bar."""
         price = normalize_price(tick.price, tick.symbol)
+        return self._new_bar(tick.symbol, bar_start, price)
+
+    def _new_bar(self, symbol: str, bar_start: datetime, price: float) -> FootprintBar:
+        """Create an empty footprint bar opening at price."""
         return FootprintBar(
-            symbol=tick.symbol,
+            symbol=symbol,
             start_time=bar_start,
             end_time=bar_start + timedelta(seconds=self.timeframe),
             timeframe=self.timeframe,
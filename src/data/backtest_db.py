@@ -11,7 +11,9 @@ DB_PATH = os.path.join(os.path.dirname(__file__), "../../data/backtests.db")
 def get_connection() -> sqlite3.Connection:
     """Get database connection, creating tables if needed."""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    # Batch backtests log from several processes at once; wait out their
+    # short write transactions instead of failing after the default 5 s
+    conn = sqlite3.connect(DB_PATH, timeout=30)
     conn.row_factory = sqlite3.Row
     _create_tables(conn)
     _migrate_tables(conn)
@@ -114,6 +116,9 @@ def _create_tables(conn: sqlite3.Connection) -> None:
             FOREIGN KEY (backtest_id) REFERENCES backtests(id)
         )
     """)
+
+    # Date range lookups (e.g. picking a week of dates to replay)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_backtests_date ON backtests(date)")
     conn.commit()
 
 
@@ -202,6 +207,17 @@ def update_backtest(
     conn.close()
 
 
+_INSERT_TRADE_SQL = """
+    INSERT INTO trades (
+        backtest_id, trade_num, entry_time, exit_time, pattern, direction,
+        regime, regime_score, signal_strength, entry_price, exit_price,
+        stop_price, target_price, size, pnl, pnl_ticks, exit_reason, running_equity,
+        tier_index, tier_name, instrument, stacked_count, win_streak, loss_streak,
+        balance_before, balance_after
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def log_trade(
     backtest_id: int,
     trade_num: int,
@@ -232,15 +248,7 @@ def log_trade(
 ) -> int:
     """Log an individual trade to the database."""
     conn = get_connection()
-    cursor = conn.execute("""
-        INSERT INTO trades (
-            backtest_id, trade_num, entry_time, exit_time, pattern, direction,
-            regime, regime_score, signal_strength, entry_price, exit_price,
-            stop_price, target_price, size, pnl, pnl_ticks, exit_reason, running_equity,
-            tier_index, tier_name, instrument, stacked_count, win_streak, loss_streak,
-            balance_before, balance_after
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
+    cursor = conn.execute(_INSERT_TRADE_SQL, (
         backtest_id, trade_num, entry_time.isoformat() if entry_time else None,
         exit_time.isoformat() if exit_time else None, pattern, direction,
         regime, regime_score, signal_strength, entry_price, exit_price,
@@ -254,6 +262,36 @@ def log_trade(
     return trade_id
 
 
+def log_trades(trades: List[Dict]) -> None:
+    """
+    Log several trades in one transaction.
+
+    Each dict takes the same keys as log_trade's arguments.
+    """
+    if not trades:
+        return
+
+    rows = []
+    for t in trades:
+        entry_time = t["entry_time"]
+        exit_time = t.get("exit_time")
+        rows.append((
+            t["backtest_id"], t["trade_num"], entry_time.isoformat() if entry_time else None,
+            exit_time.isoformat() if exit_time else None, t["pattern"], t["direction"],
+            t.get("regime"), t.get("regime_score"), t.get("signal_strength", 0),
+            t["entry_price"], t.get("exit_price"), t.get("stop_price"), t.get("target_price"),
+            t.get("size", 1), t.get("pnl", 0), t.get("pnl_ticks", 0), t.get("exit_reason"),
+            t.get("running_equity", 0), t.get("tier_index"), t.get("tier_name"),
+            t.get("instrument"), t.get("stacked_count", 1), t.get("win_streak", 0),
+            t.get("loss_streak", 0), t.get("balance_before"), t.get("balance_after"),
+        ))
+
+    conn = get_connection()
+    conn.executemany(_INSERT_TRADE_SQL, rows)
+    conn.commit()
+    conn.close()
+
+
 def update_trade_exit(
     trade_id: int,
     exit_time: datetime,
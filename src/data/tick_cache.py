@@ -0,0 +1,344 @@
+"""Tick cache serialization.
+
+Cached sessions are stored as a JSON list of tick records so every backtest
+script can share them. orjson is used when installed; the on-disk format is
+identical either way.
+
+Backtests that only need columns can load a session as TickArrays instead.
+Those are kept in a ``.npz`` sidecar next to the JSON file, rebuilt from the
+JSON whenever the sidecar is missing or stale. Timestamps are int64
+nanoseconds since the epoch (UTC).
+
+Single-session replays can instead memory-map a fixed-width ``.bin`` copy
+of the session (see ensure_binary_cache), so repeat runs read straight from
+the page cache without parsing or copying.
+"""
+
+import mmap
+import os
+from bisect import bisect_left
+from datetime import datetime, time, timedelta, timezone
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from src.core.types import Tick
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    HAS_ORJSON = False
+
+
+def read_json(path: str) -> Any:
+    """Read a JSON document from disk."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: str, data: Any) -> None:
+    """Write a JSON document to disk."""
+    if HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+
+def ticks_to_records(ticks: Iterable[Tick]) -> List[Dict]:
+    """Convert ticks to cache records."""
+    return [
+        {
+            "timestamp": t.timestamp.isoformat(),
+            "price": t.price,
+            "volume": t.volume,
+            "side": t.side,
+            "symbol": t.symbol,
+        }
+        for t in ticks
+    ]
+
+
+def records_to_ticks(records: Iterable[Dict]) -> List[Tick]:
+    """Convert cache records back to ticks."""
+    # Positional construction with hoisted lookups; this runs per tick
+    make_tick = Tick
+    fromiso = datetime.fromisoformat
+    return [
+        make_tick(fromiso(d["timestamp"]), d["price"], d["volume"], d["side"], d["symbol"])
+        for d in records
+    ]
+
+
+def index_at_time(ticks: Sequence[Tick], at: time) -> int:
+    """
+    Index of the first tick at or after a time of day.
+
+    The cutoff is taken on the first tick's date and clock, so for a
+    time-ordered single-day session this matches a per-tick
+    ``tick.timestamp.time() >= at`` check. Returns len(ticks) if no tick
+    reaches it.
+    """
+    if not ticks:
+        return 0
+    first = ticks[0].timestamp
+    cutoff = datetime.combine(first.date(), at, tzinfo=first.tzinfo)
+    return bisect_left(ticks, cutoff, key=attrgetter("timestamp"))
+
+
+# Side encoding used in TickArrays
+SIDE_BID = 0
+SIDE_ASK = 1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SIDE_NAMES = ("BID", "ASK")
+
+
+class TickArrays(NamedTuple):
+    """A session of ticks stored column-wise."""
+    ts_ns: np.ndarray    # int64 nanoseconds since epoch (UTC)
+    price: np.ndarray    # float64
+    volume: np.ndarray   # int64
+    side: np.ndarray     # int8, SIDE_BID / SIDE_ASK
+    symbol: str
+
+
+def datetime_to_ns(dt: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch."""
+    if dt.tzinfo is None:
+        return int(dt.timestamp() * 1_000_000) * 1000
+    return (dt - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def ns_to_datetime(ts_ns: int) -> datetime:
+    """Convert integer nanoseconds since the epoch to a UTC datetime."""
+    return _EPOCH + timedelta(microseconds=int(ts_ns) // 1000)
+
+
+def _utc_offset_ns(suffix: str) -> Optional[int]:
+    """Offset of a "+HH:MM" / "-HH:MM" ISO suffix in ns, or None if it isn't one."""
+    if len(suffix) != 6 or suffix[0] not in "+-" or suffix[3] != ":":
+        return None
+    try:
+        minutes = int(suffix[1:3]) * 60 + int(suffix[4:])
+    except ValueError:
+        return None
+    return (-minutes if suffix[0] == "-" else minutes) * 60_000_000_000
+
+
+def _iso_to_ns(stamps: List[str]) -> np.ndarray:
+    # numpy only parses naive ISO strings, so strip the UTC offset, parse the
+    # whole column in one call and shift each distinct offset back to UTC
+    offsets = {suffix: _utc_offset_ns(suffix) for suffix in {s[-6:] for s in stamps}}
+    if None not in offsets.values():
+        local = np.array([s[:-6] for s in stamps], dtype="datetime64[ns]").view(np.int64)
+        if len(offsets) == 1:
+            return local - next(iter(offsets.values()))
+        return local - np.array([offsets[s[-6:]] for s in stamps], dtype=np.int64)
+
+    fromiso = datetime.fromisoformat
+    return np.array([datetime_to_ns(fromiso(s)) for s in stamps], dtype=np.int64)
+
+
+def records_to_arrays(records: List[Dict]) -> TickArrays:
+    """Convert cache records to TickArrays."""
+    return TickArrays(
+        ts_ns=_iso_to_ns([d["timestamp"] for d in records]),
+        price=np.array([d["price"] for d in records], dtype=np.float64),
+        volume=np.array([d["volume"] for d in records], dtype=np.int64),
+        side=np.array([d["side"] == "ASK" for d in records], dtype=np.int8),
+        symbol=records[0]["symbol"] if records else "",
+    )
+
+
+def ticks_to_arrays(ticks: List[Tick]) -> TickArrays:
+    """Convert ticks to TickArrays."""
+    return TickArrays(
+        ts_ns=np.array([datetime_to_ns(t.timestamp) for t in ticks], dtype=np.int64),
+        price=np.array([t.price for t in ticks], dtype=np.float64),
+        volume=np.array([t.volume for t in ticks], dtype=np.int64),
+        side=np.array([t.side == "ASK" for t in ticks], dtype=np.int8),
+        symbol=ticks[0].symbol if ticks else "",
+    )
+
+
+def iter_ticks(arrays: TickArrays, start: int = 0, stop: Optional[int] = None) -> Iterator[Tick]:
+    """Yield Tick objects for a slice of TickArrays."""
+    symbol = arrays.symbol
+    ts_ns = arrays.ts_ns[start:stop].tolist()
+    prices = arrays.price[start:stop].tolist()
+    volumes = arrays.volume[start:stop].tolist()
+    sides = arrays.side[start:stop].tolist()
+    for ts, price, volume, side in zip(ts_ns, prices, volumes, sides):
+        yield Tick(
+            timestamp=_EPOCH + timedelta(microseconds=ts // 1000),
+            price=price,
+            volume=volume,
+            side=_SIDE_NAMES[side],
+            symbol=symbol,
+        )
+
+
+def tick_at(arrays: TickArrays, index: int) -> Tick:
+    """Build the Tick at one index of TickArrays."""
+    return Tick(
+        timestamp=_EPOCH + timedelta(microseconds=int(arrays.ts_ns[index]) // 1000),
+        price=float(arrays.price[index]),
+        volume=int(arrays.volume[index]),
+        side=_SIDE_NAMES[arrays.side[index]],
+        symbol=arrays.symbol,
+    )
+
+
+def sidecar_path(json_path: str) -> str:
+    """Path of the array sidecar for a JSON cache file."""
+    return os.path.splitext(json_path)[0] + ".npz"
+
+
+def save_tick_arrays(arrays: TickArrays, json_path: str) -> None:
+    """Write the array sidecar for a JSON cache file."""
+    np.savez(
+        sidecar_path(json_path),
+        ts_ns=arrays.ts_ns,
+        price=arrays.price,
+        volume=arrays.volume,
+        side=arrays.side,
+        symbol=np.array(arrays.symbol),
+    )
+
+
+def load_tick_arrays(json_path: str) -> Optional[TickArrays]:
+    """
+    Load a cached session as TickArrays.
+
+    Uses the sidecar when it is at least as new as the JSON file, otherwise
+    parses the JSON and (re)writes the sidecar. Returns None if the session
+    is not cached.
+    """
+    if not os.path.exists(json_path):
+        return None
+
+    npz_path = sidecar_path(json_path)
+    if os.path.exists(npz_path) and os.path.getmtime(npz_path) >= os.path.getmtime(json_path):
+        with np.load(npz_path) as data:
+            return TickArrays(
+                ts_ns=data["ts_ns"],
+                price=data["price"],
+                volume=data["volume"],
+                side=data["side"],
+                symbol=str(data["symbol"]),
+            )
+
+    arrays = records_to_arrays(read_json(json_path))
+    try:
+        save_tick_arrays(arrays, json_path)
+    except OSError:
+        pass  # Read-only cache dir; parse the JSON again next time
+    return arrays
+
+
+# Fixed-width record layout of the .bin cache
+TICK_DTYPE = np.dtype([
+    ("ts_ns", "<i8"),
+    ("price", "<f8"),
+    ("volume", "<i4"),
+    ("side", "i1"),
+])
+
+# The .bin file starts with the symbol, NUL-padded to this many bytes
+_BIN_HEADER_SIZE = 16
+
+
+def binary_path(json_path: str) -> str:
+    """Path of the memory-mappable copy of a JSON cache file."""
+    return os.path.splitext(json_path)[0] + ".bin"
+
+
+def ensure_binary_cache(json_path: str) -> str:
+    """
+    Make sure a current .bin copy of a JSON cache file exists.
+
+    The JSON is parsed and the .bin rewritten only when the .bin is missing
+    or older than the JSON. Returns the .bin path.
+    """
+    bin_path = binary_path(json_path)
+    if os.path.exists(bin_path) and os.path.getmtime(bin_path) >= os.path.getmtime(json_path):
+        return bin_path
+
+    arrays = records_to_arrays(read_json(json_path))
+    records = np.empty(len(arrays.ts_ns), dtype=TICK_DTYPE)
+    records["ts_ns"] = arrays.ts_ns
+    records["price"] = arrays.price
+    records["volume"] = arrays.volume
+    records["side"] = arrays.side
+
+    # Write under a temporary name so a reader never maps a partial file
+    tmp_path = bin_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(arrays.symbol.encode()[:_BIN_HEADER_SIZE].ljust(_BIN_HEADER_SIZE, b"\0"))
+        records.tofile(f)
+    os.replace(tmp_path, bin_path)
+    return bin_path
+
+
+def prefetch_sessions(json_paths: Iterable[str]) -> None:
+    """
+    Start reading cached sessions into the page cache ahead of use.
+
+    Each session's .bin copy (or its JSON if there is no current .bin) is
+    advised with POSIX_FADV_WILLNEED, which queues the read and returns at
+    once, so cold sessions load concurrently instead of one per replay.
+    A no-op where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for json_path in json_paths:
+        path = binary_path(json_path)
+        if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(json_path):
+            path = json_path
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue  # Not cached
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+
+def map_tick_arrays(json_path: str) -> Optional[TickArrays]:
+    """
+    Memory-map a cached session as TickArrays.
+
+    The columns are read-only views into the mapped .bin file (built on
+    first use by ensure_binary_cache). Returns None if the session is not
+    cached.
+    """
+    if not os.path.exists(json_path):
+        return None
+
+    bin_path = ensure_binary_cache(json_path)
+    with open(bin_path, "rb") as f:
+        header = f.read(_BIN_HEADER_SIZE)
+        if os.fstat(f.fileno()).st_size == _BIN_HEADER_SIZE:
+            records = np.empty(0, dtype=TICK_DTYPE)  # mmap rejects empty mappings
+        else:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                buf.madvise(mmap.MADV_SEQUENTIAL)
+            records = np.frombuffer(buf, dtype=TICK_DTYPE, offset=_BIN_HEADER_SIZE)
+
+    return TickArrays(
+        ts_ns=records["ts_ns"],
+        price=records["price"],
+        volume=records["volume"],
+        side=records["side"],
+        symbol=header.rstrip(b"\0").decode(),
+    )
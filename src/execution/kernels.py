@@ -0,0 +1,202 @@
+"""
+Numeric kernels for tick-level backtest simulation.
+
+Each kernel is declared with an explicit signature, so it is compiled (or
+loaded from numba's on-disk cache) when this module is imported rather
+than on first call. Run ``python -m src.execution.kernels`` once after an
+install or upgrade to build the cache ahead of a backtest.
+"""
+
+import numpy as np
+
+from src.core.jit import HAS_NUMBA, njit
+
+
+# Read-only "A" layout so memory-mapped (strided, read-only) price columns
+# are accepted as well as ordinary arrays
+@njit("i8(Array(f8, 1, 'A', readonly=True), i8, i8, f8, f8)", cache=True)
+def first_band_cross(prices: np.ndarray, start: int, stop: int, low: float, high: float) -> int:
+    """
+    Find the first tick at or beyond a price band.
+
+    Returns the first index in [start, stop) whose price is <= low or
+    >= high, or stop if every price stays strictly inside the band.
+    """
+    for i in range(start, stop):
+        price = prices[i]
+        if price <= low or price >= high:
+            return i
+    return stop
+
+
+def first_band_cross_np(prices: np.ndarray, start: int, stop: int, low: float, high: float) -> int:
+    """
+    NumPy version of first_band_cross, for running without numba.
+
+    Scans in doubling windows so an exit a few ticks away doesn't pay for
+    a mask over the rest of the session.
+    """
+    window = 1024
+    lo = start
+    while lo < stop:
+        hi = min(lo + window, stop)
+        chunk = prices[lo:hi]
+        hit = (chunk <= low) | (chunk >= high)
+        offset = int(hit.argmax())
+        if hit[offset]:
+            return lo + offset
+        lo = hi
+        window *= 2
+    return stop
+
+
+# Exit reasons returned by simulate_brackets
+EXIT_STOP = 0
+EXIT_TARGET = 1
+EXIT_END = 2
+
+
+@njit(
+    "Tuple((i8[:, :], f8[:, :]))(Array(f8, 1, 'A', readonly=True), Array(i8, 1, 'A', readonly=True), "
+    "Array(i1, 1, 'A', readonly=True), f8, f8, f8)",
+    cache=True,
+)
+def simulate_brackets(
+    prices: np.ndarray,
+    signal_idx: np.ndarray,
+    signal_dir: np.ndarray,
+    slippage: float,
+    stop_dist: float,
+    target_dist: float,
+) -> tuple:
+    """
+    Simulate one bracket trade at a time, entered on signals.
+
+    A signal at tick i (direction +1 long, -1 short) is taken if no trade is
+    open. It fills at prices[i] moved against it by slippage, with a stop
+    and target at fixed distances from the fill. Exits are checked from the
+    next tick on, stop before target; a trade still open at the last tick
+    exits there. Exits are checked before a tick's signals, so a trade that
+    exits at tick e frees the slot for signals at e.
+
+    Trades never overlap, so the exit scans visit each tick at most once
+    and a day costs O(n) however many signals it has. A price-level or
+    range-min/max index would cost a pass of its own to build and can't
+    beat that.
+
+    Returns (ints, floats) with one row per trade: ints holds (signal
+    number, exit tick, EXIT_* reason) and floats holds (entry, stop,
+    target, exit price).
+    """
+    n = len(prices)
+    ints = np.empty((len(signal_idx), 3), dtype=np.int64)
+    floats = np.empty((len(signal_idx), 4), dtype=np.float64)
+    k = 0
+    free_from = 0
+    for j in range(len(signal_idx)):
+        i = signal_idx[j]
+        if i < free_from:
+            continue
+
+        if signal_dir[j] > 0:
+            entry = prices[i] + slippage
+            stop = entry - stop_dist
+            target = entry + target_dist
+            e = first_band_cross(prices, i + 1, n, stop, target)
+            hit_stop = e < n and prices[e] <= stop
+        else:
+            entry = prices[i] - slippage
+            stop = entry + stop_dist
+            target = entry - target_dist
+            e = first_band_cross(prices, i + 1, n, target, stop)
+            hit_stop = e < n and prices[e] >= stop
+
+        floats[k, 0] = entry
+        floats[k, 1] = stop
+        floats[k, 2] = target
+        ints[k, 0] = j
+        if e == n:
+            ints[k, 1] = n - 1
+            ints[k, 2] = EXIT_END
+            floats[k, 3] = prices[n - 1]
+            k += 1
+            break
+        ints[k, 1] = e
+        if hit_stop:
+            ints[k, 2] = EXIT_STOP
+            floats[k, 3] = stop
+        else:
+            ints[k, 2] = EXIT_TARGET
+            floats[k, 3] = target
+        k += 1
+        free_from = e
+
+    return ints[:k], floats[:k]
+
+
+def simulate_brackets_np(
+    prices: np.ndarray,
+    signal_idx: np.ndarray,
+    signal_dir: np.ndarray,
+    slippage: float,
+    stop_dist: float,
+    target_dist: float,
+) -> tuple:
+    """NumPy version of simulate_brackets, for running without numba."""
+    n = len(prices)
+    ints = []
+    floats = []
+    free_from = 0
+    for j, (i, direction) in enumerate(zip(signal_idx.tolist(), signal_dir.tolist())):
+        if i < free_from:
+            continue
+
+        price = float(prices[i])
+        if direction > 0:
+            entry = price + slippage
+            stop = entry - stop_dist
+            target = entry + target_dist
+            e = first_band_cross_np(prices, i + 1, n, stop, target)
+            hit_stop = e < n and prices[e] <= stop
+        else:
+            entry = price - slippage
+            stop = entry + stop_dist
+            target = entry - target_dist
+            e = first_band_cross_np(prices, i + 1, n, target, stop)
+            hit_stop = e < n and prices[e] >= stop
+
+        if e == n:
+            ints.append((j, n - 1, EXIT_END))
+            floats.append((entry, stop, target, float(prices[n - 1])))
+            break
+        ints.append((j, e, EXIT_STOP if hit_stop else EXIT_TARGET))
+        floats.append((entry, stop, target, stop if hit_stop else target))
+        free_from = e
+
+    return (
+        np.array(ints, dtype=np.int64).reshape(-1, 3),
+        np.array(floats, dtype=np.float64).reshape(-1, 4),
+    )
+
+
+# Compiled kernels, for cache reporting
+KERNELS = (first_band_cross, simulate_brackets)
+
+
+def compiled_on_import() -> int:
+    """Number of kernel signatures compiled (rather than loaded from cache) on import."""
+    if not HAS_NUMBA:
+        return 0
+    return sum(sum(kernel.stats.cache_misses.values()) for kernel in KERNELS)
+
+
+if __name__ == "__main__":
+    if not HAS_NUMBA:
+        print("numba not installed; kernels run as Python/NumPy")
+    else:
+        for kernel in KERNELS:
+            stats = kernel.stats
+            state = "compiled and cached" if sum(stats.cache_misses.values()) else "loaded from cache"
+            for sig in kernel.signatures:
+                print(f"{kernel.__name__}{sig}: {state}")
+            print(f"  cache: {stats.cache_path}")
@@ -2,7 +2,7 @@
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 import logging
 
 from src.core.types import Signal
@@ -276,6 +276,27 @@ class ExecutionManager:
                     if current_price <= position.target_price:
                         self._close_position(position, position.target_price, "TARGET")
 
+    def get_exit_band(self) -> Tuple[float, float]:
+        """
+        Get the price band inside which update_prices closes nothing.
+
+        Returns (low, high): a price strictly between them cannot hit any
+        open position's stop or target, so backtests can skip update_prices
+        for such ticks. Returns (-inf, inf) when no bracket is set.
+        """
+        low = float("-inf")
+        high = float("inf")
+        for position in self.open_positions:
+            if position.side == "LONG":
+                below, above = position.stop_price, position.target_price
+            else:
+                below, above = position.target_price, position.stop_price
+            if below is not None:
+                low = max(low, below)
+            if above is not None:
+                high = min(high, above)
+        return low, high
+
     def _close_position(
         self,
         position: Position,
@@ -347,11 +368,19 @@ class ExecutionManager:
 
         return trade
 
-    def close_all_positions(self, current_price: float, reason: str = "MANUAL") -> List[Trade]:
-        """Close all open positions."""
+    def close_all_positions(self, current_price: Optional[float] = None, reason: str = "MANUAL") -> List[Trade]:
+        """
+        Close all open positions.
+
+        With no current_price, each position closes at its own last mark
+        (or its entry price if it was never marked).
+        """
         trades = []
         for position in list(self.open_positions):
-            trade = self._close_position(position, current_price, reason)
+            price = current_price
+            if price is None:
+                price = position.current_price or position.entry_price
+            trade = self._close_position(position, price, reason)
             trades.append(trade)
         return trades
 
@@ -191,3 +191,4 @@ class RegimeInputsCalculator:
         """Reset the calculator state."""
         self.bars.clear()
         self.ohlc_cache.clear()
+        self._last_bar_time = None
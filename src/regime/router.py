@@ -93,6 +93,18 @@ STRATEGY_REGIME_MAP: Dict[Regime, Dict[str, Any]] = {
 }
 
 
+# Per-regime lookup table built from STRATEGY_REGIME_MAP:
+# (enabled patterns or None for "any", disabled patterns, bias)
+_REGIME_RULES = {
+    regime: (
+        frozenset(config["enabled_patterns"]) if config.get("enabled_patterns") else None,
+        frozenset(config.get("disabled_patterns", [])),
+        config.get("bias"),
+    )
+    for regime, config in STRATEGY_REGIME_MAP.items()
+}
+
+
 class StrategyRouter:
     """
     Routes signals through regime filter and applies position sizing.
@@ -125,6 +137,16 @@ class StrategyRouter:
         inputs = self.inputs_calculator.calculate()
         self.current_regime, self.regime_confidence = self.regime_detector.classify(inputs)
 
+    @property
+    def min_signal_strength(self) -> float:
+        """Minimum signal strength for approval."""
+        return self.config.get("min_signal_strength", 0.5)
+
+    @property
+    def min_regime_confidence(self) -> float:
+        """Minimum regime confidence for approval."""
+        return self.config.get("min_regime_confidence", 0.6)
+
     def evaluate_signal(self, signal: Signal) -> Signal:
         """
         Evaluate a signal against current regime.
@@ -143,8 +165,8 @@ class StrategyRouter:
         self.signals_evaluated += 1
         signal.regime = self.current_regime.value
 
-        regime_config = STRATEGY_REGIME_MAP.get(self.current_regime)
-        if not regime_config:
+        rules = _REGIME_RULES.get(self.current_regime)
+        if not rules:
             signal.approved = False
             signal.rejection_reason = "Unknown regime"
             self.signals_rejected += 1
@@ -157,23 +179,23 @@ class StrategyRouter:
             self.signals_rejected += 1
             return signal
 
+        enabled, disabled, bias = rules
+
         # Check if pattern is explicitly disabled
-        if signal.pattern in regime_config.get("disabled_patterns", []):
+        if signal.pattern in disabled:
             signal.approved = False
             signal.rejection_reason = f"Pattern disabled in {self.current_regime.value}"
             self.signals_rejected += 1
             return signal
 
         # Check if pattern is in enabled list (if list exists)
-        enabled = regime_config.get("enabled_patterns")
-        if enabled and signal.pattern not in enabled:
+        if enabled is not None and signal.pattern not in enabled:
             signal.approved = False
             signal.rejection_reason = f"Pattern not enabled for {self.current_regime.value}"
             self.signals_rejected += 1
             return signal
 
         # Check bias alignment
-        bias = regime_config.get("bias")
         if bias and signal.direction != bias:
             signal.approved = False
             signal.rejection_reason = f"Direction {signal.direction} conflicts with {bias} bias"
@@ -181,7 +203,7 @@ class StrategyRouter:
             return signal
 
         # Check minimum signal strength
-        min_strength = self.config.get("min_signal_strength", 0.5)
+        min_strength = self.min_signal_strength
         if signal.strength < min_strength:
             signal.approved = False
             signal.rejection_reason = f"Strength {signal.strength:.2f} below minimum {min_strength}"
@@ -189,7 +211,7 @@ class StrategyRouter:
             return signal
 
         # Check regime confidence
-        min_confidence = self.config.get("min_regime_confidence", 0.6)
+        min_confidence = self.min_regime_confidence
         if self.regime_confidence < min_confidence:
             signal.approved = False
             signal.rejection_reason = f"Regime confidence {self.regime_confidence:.2f} below minimum"
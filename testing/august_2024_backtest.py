@@ -548,14 +548,20 @@ class August2024Backtester:
 
         logger.info(f"Processing {len(ticks):,} ticks...")
 
+        # Hoisted for the tick loop; open_positions is only mutated in place
+        process_tick = self.engine.process_tick
+        manager = self.manager
+        open_positions = manager.open_positions
+        update_prices = manager.update_prices
+
         for i, tick in enumerate(ticks):
-            self.engine.process_tick(tick)
+            process_tick(tick)
 
-            if self.manager and self.manager.open_positions:
-                self.manager.update_prices(tick.price)
+            if open_positions:
+                update_prices(tick.price)
 
-            if self.manager.is_halted:
-                logger.info(f"Session halted: {self.manager.halt_reason}")
+            if manager.is_halted:
+                logger.info(f"Session halted: {manager.halt_reason}")
                 break
 
             if i > 0 and i % 100000 == 0:
@@ -32,6 +32,7 @@ from src.regime.router import StrategyRouter
 from src.execution.manager import ExecutionManager
 from src.execution.session import TradingSession
 from src.data.adapters.databento import DatabentoAdapter
+from src.data.tick_cache import index_at_time
 
 # Cache directory for tick data
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "../data/tick_cache")
@@ -479,33 +480,29 @@ class August2024BarLevelBacktester:
 
         logger.info(f"Processing {len(ticks):,} ticks (BAR-LEVEL stop checking)...")
 
-        flatten_time = time(15, 55)
-        flattened = False
-
-        for i, tick in enumerate(ticks):
-            tick_time = tick.timestamp.time() if hasattr(tick.timestamp, 'time') else None
-            if tick_time and tick_time >= flatten_time and not flattened:
-                if self.manager and self.manager.open_positions:
-                    logger.info(f"Flattening at 3:55 PM ET")
-                    self.manager.close_all_positions(tick.price, "FLATTEN")
-                flattened = True
-
-            if flattened:
-                continue
+        # Ticks are time-ordered, so find the 3:55 PM cutoff once up front
+        flatten_idx = index_at_time(ticks, time(15, 55))
+        process_tick = self.engine.process_tick
+        manager = self.manager
 
+        for i in range(flatten_idx):
             # Process tick through engine (builds bars, detects signals)
-            self.engine.process_tick(tick)
+            process_tick(ticks[i])
 
             # KEY DIFFERENCE: We do NOT call update_prices on every tick!
             # Stops are only checked in _on_bar when bars complete.
 
-            if self.manager.is_halted:
-                logger.info(f"Session halted: {self.manager.halt_reason}")
+            if manager.is_halted:
+                logger.info(f"Session halted: {manager.halt_reason}")
                 break
 
             if i > 0 and i % 100000 == 0:
                 pct = i / len(ticks) * 100
                 logger.info(f"  Progress: {pct:.0f}%")
+        else:
+            if flatten_idx < len(ticks) and manager.open_positions:
+                logger.info(f"Flattening at 3:55 PM ET")
+                manager.close_all_positions(ticks[flatten_idx].price, "FLATTEN")
 
         return self._end_day(date)
 
@@ -273,11 +273,17 @@ class BlindBacktester:
 
         logger.info(f"Day {date} | {tier_config['tier_name']} | {symbol} ({contract}) | ${tier_config['balance']:,.2f} | {len(ticks):,} ticks")
 
+        # Hoisted for the tick loop; open_positions is only mutated in place
+        process_tick = self.engine.process_tick
+        manager = self.manager
+        open_positions = manager.open_positions
+        update_prices = manager.update_prices
+
         for tick in ticks:
-            self.engine.process_tick(tick)
-            if self.manager and self.manager.open_positions:
-                self.manager.update_prices(tick.price)
-            if self.manager.is_halted:
+            process_tick(tick)
+            if open_positions:
+                update_prices(tick.price)
+            if manager.is_halted:
                 break
 
         # Close any open positions
@@ -11,25 +11,34 @@ Usage:
 
 import argparse
 import asyncio
-import json
 import logging
 import os
 import sys
-from datetime import datetime, time
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import numpy as np
 from dotenv import load_dotenv
 load_dotenv()
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.core.types import Tick, Signal, FootprintBar
+from src.core.types import Signal, FootprintBar
 from src.core.capital import TierManager, TIERS
 from src.analysis.engine import OrderFlowEngine
 from src.regime.router import StrategyRouter
 from src.execution.manager import ExecutionManager
 from src.execution.session import TradingSession
+from src.execution.kernels import first_band_cross, first_band_cross_np
+from src.core.jit import HAS_NUMBA
+from src.data.tick_cache import (
+    TickArrays, map_tick_arrays,
+)
+
+# Flatten cutoff as an offset from midnight on the tick clock
+NS_PER_DAY = 86_400 * 1_000_000_000
+FLATTEN_OFFSET_NS = (15 * 3600 + 55 * 60) * 1_000_000_000
 
 # Directory containing this script
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -42,34 +51,24 @@ logging.basicConfig(
 logger = logging.getLogger("databento_comparison")
 
 
-def load_databento_ticks(date: str) -> List[Tick]:
-    """Load ticks from Databento JSON cache."""
+def load_databento_ticks(date: str) -> Optional[TickArrays]:
+    """Load ticks from Databento JSON cache as column arrays."""
     # Find the file
     pattern = f"databento_MES*_{date}_0930_1600.json"
     files = list(Path(SCRIPT_DIR).glob(pattern))
 
     if not files:
         logger.error(f"No Databento tick file found matching {pattern}")
-        return []
+        return None
 
     tick_file = files[0]
     logger.info(f"Loading ticks from {tick_file}")
 
-    with open(tick_file) as f:
-        data = json.load(f)
+    # Memory-map the session; the JSON is only parsed on first use
+    arrays = map_tick_arrays(str(tick_file))
 
-    ticks = []
-    for d in data:
-        ticks.append(Tick(
-            timestamp=datetime.fromisoformat(d["timestamp"]),
-            price=d["price"],
-            volume=d["volume"],
-            side=d["side"],
-            symbol=d["symbol"]
-        ))
-
-    logger.info(f"Loaded {len(ticks):,} ticks from Databento")
-    return ticks
+    logger.info(f"Loaded {len(arrays.ts_ns):,} ticks from Databento")
+    return arrays
 
 
 def load_warmup_bars(db_path: str, symbol: str, before_time: str, limit: int = 50) -> List[FootprintBar]:
@@ -133,8 +132,8 @@ class ComparisonBacktest:
         self.manager: Optional[ExecutionManager] = None
         self.tier_manager: Optional[TierManager] = None
 
-        # Signal stacking
-        self._current_bar_signals: List[Signal] = []
+        # Signal stacking: signals seen this bar, by direction
+        self._bar_dir_counts: Dict[str, int] = {}
 
     def setup(self, symbol: str = "MES", warmup_bars: List[FootprintBar] = None):
         """Initialize all components."""
@@ -186,11 +185,11 @@ class ComparisonBacktest:
         self.engine.on_bar(self._on_bar)
         self.engine.on_signal(self._on_signal)
 
-        self._current_bar_signals = []
+        self._bar_dir_counts = {}
 
     def _on_bar(self, bar: FootprintBar):
         """Handle completed bar."""
-        self._current_bar_signals = []
+        self._bar_dir_counts = {}
 
         if self.router:
             self.router.on_bar(bar)
@@ -204,17 +203,14 @@ class ComparisonBacktest:
             return
 
         self.signals_detected.append(signal)
-        self._current_bar_signals.append(signal)
+        self._bar_dir_counts[signal.direction] = self._bar_dir_counts.get(signal.direction, 0) + 1
 
         signal = self.router.evaluate_signal(signal)
 
         if signal.approved:
             self.signals_approved.append(signal)
 
-            stacked_count = sum(
-                1 for s in self._current_bar_signals
-                if s.direction == signal.direction
-            )
+            stacked_count = self._bar_dir_counts[signal.direction]
 
             current_regime = self.router.current_regime if self.router else "UNKNOWN"
             position_size = self.tier_manager.get_position_size(
@@ -253,45 +249,75 @@ class ComparisonBacktest:
             f"P&L: {emoji}${trade.pnl:.2f} ({trade.exit_reason})"
         )
 
-    def run(self, ticks: List[Tick]) -> dict:
-        """Run backtest on ticks."""
-
-        # Flatten time: 3:55 PM ET (match Bishop)
-        flatten_time = time(15, 55)
-        flattened = False
-
-        for i, tick in enumerate(ticks):
-            # Check for flatten
-            tick_time = tick.timestamp.time() if hasattr(tick.timestamp, 'time') else None
-            if tick_time and tick_time >= flatten_time and not flattened:
-                if self.manager and self.manager.open_positions:
-                    logger.info("Flattening at 3:55 PM ET")
-                    self.manager.close_all_positions(tick.price, "AUTO_FLATTEN")
-                flattened = True
-
-            if flattened:
-                continue
-
-            # Process tick
-            self.engine.process_tick(tick)
-
-            # Update prices
-            if self.manager and self.manager.open_positions:
-                self.manager.update_prices(tick.price)
-
-            # Check halt
+    def _check_exits(self, scan, prices: np.ndarray, start: int, stop: int) -> bool:
+        """
+        Update positions on each tick in [start, stop) that leaves the exit band.
+
+        Returns True if the session halted.
+        """
+        i = start
+        while i < stop and self.manager.open_positions:
+            low, high = self.manager.get_exit_band()
+            i = scan(prices, i, stop, low, high)
+            if i == stop:
+                break
+            self.manager.update_prices(float(prices[i]))
             if self.manager.is_halted:
+                return True
+            i += 1
+        return False
+
+    def run(self, arrays: TickArrays, use_jit: bool = True) -> dict:
+        """Run backtest on a session of ticks."""
+        ts_ns = arrays.ts_ns
+        prices = arrays.price
+        n = len(ts_ns)
+        scan = first_band_cross if use_jit and HAS_NUMBA else first_band_cross_np
+
+        # Flatten time: 3:55 PM (match Bishop), compared on the tick clock.
+        # Ticks are time-ordered, so the cutoff is a single binary search
+        flatten_idx = n
+        if n:
+            flatten_ns = ts_ns[0] // NS_PER_DAY * NS_PER_DAY + FLATTEN_OFFSET_NS
+            flatten_idx = int(np.searchsorted(ts_ns, flatten_ns))
+
+        # The engine is fed one bar segment at a time: only a segment's first
+        # tick can close a bar (and so open positions), after which only ticks
+        # that leave the open positions' exit band can change anything
+        bar_ns = self.engine.timeframe * 1_000_000_000
+        bounds = (np.flatnonzero(np.diff(ts_ns[:flatten_idx] // bar_ns)) + 1).tolist()
+        halted = False
+        next_progress = 50000
+
+        for lo, hi in zip([0, *bounds], [*bounds, flatten_idx]):
+            self.engine.process_ticks(
+                ts_ns[lo:hi], prices[lo:hi], arrays.volume[lo:hi], arrays.side[lo:hi],
+                arrays.symbol,
+            )
+
+            # The segment's first tick is checked on its own: the bar close it
+            # triggered may have opened positions or halted the session
+            halted = self._check_exits(scan, prices, lo, lo + 1) or self.manager.is_halted
+            if not halted:
+                halted = self._check_exits(scan, prices, lo + 1, hi)
+            if halted:
                 logger.info(f"Session halted: {self.manager.halt_reason}")
                 break
 
             # Progress
-            if i > 0 and i % 50000 == 0:
-                pct = i / len(ticks) * 100
-                logger.info(f"Progress: {pct:.0f}% ({i:,}/{len(ticks):,} ticks)")
+            if hi > next_progress:
+                pct = hi / n * 100
+                logger.info(f"Progress: {pct:.0f}% ({hi:,}/{n:,} ticks)")
+                next_progress = (hi // 50000 + 1) * 50000
+
+        if not halted and flatten_idx < n:
+            if self.manager and self.manager.open_positions:
+                logger.info("Flattening at 3:55 PM ET")
+                self.manager.close_all_positions(float(prices[flatten_idx]), "AUTO_FLATTEN")
 
         # Close any remaining positions
         if self.manager.open_positions:
-            last_price = ticks[-1].price if ticks else 0
+            last_price = float(prices[-1]) if n else 0
             self.manager.close_all_positions(last_price, "END_OF_DAY")
 
         # Results
@@ -300,7 +326,7 @@ class ComparisonBacktest:
         losses = len(self.trades) - wins
 
         return {
-            "ticks": len(ticks),
+            "ticks": n,
             "trades": len(self.trades),
             "wins": wins,
             "losses": losses,
@@ -318,11 +344,13 @@ async def main():
     parser.add_argument("--warmup-db", type=str, help="Path to warmup bars.db")
     parser.add_argument("--warmup-before", type=str, default="2025-12-03T14:34:00",
                         help="Only load warmup bars before this time")
+    parser.add_argument("--no-jit", action="store_true",
+                        help="Use the NumPy tick kernels instead of numba")
     args = parser.parse_args()
 
     # Load Databento ticks
     ticks = load_databento_ticks(args.date)
-    if not ticks:
+    if ticks is None or not len(ticks.ts_ns):
         print("No ticks found!")
         return
 
@@ -335,7 +363,7 @@ async def main():
     backtest = ComparisonBacktest(starting_balance=args.balance)
     backtest.setup(symbol="MES", warmup_bars=warmup_bars)
 
-    results = backtest.run(ticks)
+    results = backtest.run(ticks, use_jit=not args.no_jit)
 
     # Print results
     print("\n" + "=" * 60)
@@ -33,6 +33,7 @@ from src.core.capital import TierManager, TIERS
 from src.analysis.engine import OrderFlowEngine
 from src.regime.router import StrategyRouter
 from src.data.adapters.databento import DatabentoAdapter
+from src.data.tick_cache import index_at_time
 
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "../data/tick_cache")
 
@@ -419,28 +420,22 @@ class LimitOrderBacktester:
 
         logger.info(f"Processing {len(ticks):,} ticks...")
 
-        # Flatten time
-        flatten_time = time(15, 55)
-        flattened = False
+        # Flatten time: ticks are time-ordered, so find the cutoff once
+        flatten_idx = index_at_time(ticks, time(15, 55))
+        process_tick = self._process_tick
 
-        for tick in ticks:
-            tick_time = tick.timestamp.time() if hasattr(tick.timestamp, 'time') else None
+        for i in range(flatten_idx):
+            process_tick(ticks[i])
 
-            if tick_time and tick_time >= flatten_time and not flattened:
-                if self.open_position:
-                    self._close_position(tick.price, "FLATTEN", tick.timestamp)
-                # Expire pending orders
-                for order in self.pending_orders:
-                    self.expired_orders += 1
-                    self.pattern_stats[order.pattern]["expired"] += 1
-                self.pending_orders = []
-                flattened = True
-                continue
-
-            if flattened:
-                continue
-
-            self._process_tick(tick)
+        if flatten_idx < len(ticks):
+            tick = ticks[flatten_idx]
+            if self.open_position:
+                self._close_position(tick.price, "FLATTEN", tick.timestamp)
+            # Expire pending orders
+            for order in self.pending_orders:
+                self.expired_orders += 1
+                self.pattern_stats[order.pattern]["expired"] += 1
+            self.pending_orders = []
 
         return self._end_day(date)
 
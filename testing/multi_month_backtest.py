@@ -12,16 +12,18 @@ All tests use ES (Tier 2+) with limit orders at signal price.
 """
 
 import asyncio
-import json
+import io
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, time
+from datetime import datetime, timedelta, time, timezone
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from collections import defaultdict
 
+import numpy as np
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -31,8 +33,33 @@ from src.core.types import Tick, Signal, FootprintBar
 from src.analysis.engine import OrderFlowEngine
 from src.regime.router import StrategyRouter
 from src.data.adapters.databento import DatabentoAdapter
+from src.data.tick_cache import (
+    write_json,
+    ticks_to_records,
+    ticks_to_arrays,
+    save_tick_arrays,
+    load_tick_arrays,
+    iter_ticks,
+    tick_at,
+    TickArrays,
+    datetime_to_ns,
+    ns_to_datetime,
+)
 
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "../data/tick_cache")
+FLATTEN_TIME = time(15, 55)
+# Databento downloads in flight per month process; the months run in parallel
+MAX_CONCURRENT_FETCHES = 2
+
+# Per-pattern counters, one row per interned pattern id
+PATTERN_STATS_DTYPE = np.dtype([
+    ("signals", np.int64),
+    ("filled", np.int64),
+    ("expired", np.int64),
+    ("wins", np.int64),
+    ("losses", np.int64),
+    ("pnl", np.float64),
+])
 
 logging.basicConfig(
     level=logging.INFO,
@@ -42,7 +69,7 @@ logging.basicConfig(
 logger = logging.getLogger("multi_month")
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingOrder:
     """A limit order waiting to be filled."""
     signal: Signal
@@ -52,11 +79,11 @@ class PendingOrder:
     stop_price: float
     target_price: float
     created_at: datetime
-    pattern: str
+    pattern_id: int
     _created_bar: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """An open position."""
     direction: str
@@ -65,10 +92,10 @@ class Position:
     entry_time: datetime
     stop_price: float
     target_price: float
-    pattern: str
+    pattern_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     """Completed trade."""
     direction: str
@@ -108,6 +135,7 @@ class MonthBacktester:
         self.pending_orders: List[PendingOrder] = []
         self.open_position: Optional[Position] = None
         self.completed_trades: List[TradeResult] = []
+        self._trades_by_date: Dict[str, List[TradeResult]] = defaultdict(list)
         self.expired_orders: int = 0
         self.filled_orders: int = 0
 
@@ -117,16 +145,36 @@ class MonthBacktester:
         self._current_bar_close: Optional[float] = None
         self._current_bar_count: int = 0
         self._current_date: str = ""
-
-        self.pattern_stats: Dict[str, Dict] = defaultdict(
-            lambda: {"signals": 0, "filled": 0, "expired": 0, "wins": 0, "losses": 0, "pnl": 0.0}
-        )
+        self._flatten_ns: int = 0
+        self._session_last_time: Optional[datetime] = None
+
+        # Price bands for the per-tick fast path: a tick can only fill a
+        # pending order at or beyond a limit band, and can only exit the
+        # open position at or beyond its stop/target band
+        self._long_limit: float = float("-inf")
+        self._short_limit: float = float("inf")
+        self._exit_low: float = float("-inf")
+        self._exit_high: float = float("inf")
+
+        # Patterns are interned to small ids; pattern_stats rows are indexed by id
+        self._pattern_ids: Dict[str, int] = {}
+        self._pattern_names: List[str] = []
+        self.pattern_stats: np.ndarray = np.zeros(16, dtype=PATTERN_STATS_DTYPE)
         self.daily_results: List[Dict] = []
 
     def _setup_day(self, date: str, symbol: str) -> None:
         self._current_date = date
+        self._flatten_ns = get_flatten_ns(date)
+        self._session_last_time = None
         self._current_bar_count = 0
         self.pending_orders = []
+        self._refresh_limit_band()
+
+        # Reuse the engine and router across days; rebuild only on a new symbol
+        if self.engine is not None and self.engine.symbol == symbol:
+            self.engine.reset()
+            self.router.reset()
+            return
 
         self.engine = OrderFlowEngine({"symbol": symbol, "timeframe": 300})
         self.router = StrategyRouter({})
@@ -163,6 +211,7 @@ class MonthBacktester:
             target_price = limit_price - (self.target_ticks * self.tick_size)
 
         pattern = signal.pattern.value if hasattr(signal.pattern, 'value') else str(signal.pattern)
+        pid = self._pattern_id(pattern)
 
         order = PendingOrder(
             signal=signal,
@@ -172,12 +221,25 @@ class MonthBacktester:
             stop_price=stop_price,
             target_price=target_price,
             created_at=signal.timestamp,
-            pattern=pattern,
+            pattern_id=pid,
             _created_bar=self._current_bar_count,
         )
 
         self.pending_orders.append(order)
-        self.pattern_stats[pattern]["signals"] += 1
+        self._refresh_limit_band()
+        self.pattern_stats["signals"][pid] += 1
+
+    def _pattern_id(self, pattern: str) -> int:
+        """Get the id for a pattern name, assigning one on first sight."""
+        pid = self._pattern_ids.get(pattern)
+        if pid is None:
+            pid = self._pattern_ids[pattern] = len(self._pattern_names)
+            self._pattern_names.append(pattern)
+            if pid == len(self.pattern_stats):
+                grown = np.zeros(2 * pid, dtype=PATTERN_STATS_DTYPE)
+                grown[:pid] = self.pattern_stats
+                self.pattern_stats = grown
+        return pid
 
     def _expire_old_orders(self) -> None:
         expired = []
@@ -186,22 +248,109 @@ class MonthBacktester:
             if bars_pending >= self.max_pending_bars:
                 expired.append(order)
                 self.expired_orders += 1
-                self.pattern_stats[order.pattern]["expired"] += 1
+                self.pattern_stats["expired"][order.pattern_id] += 1
 
         for order in expired:
             self.pending_orders.remove(order)
+        if expired:
+            self._refresh_limit_band()
+
+    def _refresh_limit_band(self) -> None:
+        """Recompute the fill thresholds of the pending orders."""
+        long_limit = float("-inf")
+        short_limit = float("inf")
+        for order in self.pending_orders:
+            if order.direction == "LONG":
+                long_limit = max(long_limit, order.limit_price)
+            else:
+                short_limit = min(short_limit, order.limit_price)
+        self._long_limit = long_limit
+        self._short_limit = short_limit
 
     def _process_tick(self, tick: Tick) -> None:
+        self._check_tick(tick)
+
+        if self.engine:
+            self.engine.process_tick(tick)
+
+    def _check_tick(self, tick: Tick) -> None:
+        """Check a tick against pending orders and the open position."""
         price = tick.price
 
-        if not self.open_position and self.pending_orders:
-            self._check_limit_fills(tick)
+        if self.open_position is None:
+            if self.pending_orders and (price <= self._long_limit or price >= self._short_limit):
+                self._check_limit_fills(tick)
+
+        if self.open_position is not None:
+            if price <= self._exit_low or price >= self._exit_high:
+                self._check_position_exit(tick)
+
+    def _run_session(self, arrays: TickArrays) -> None:
+        """Process a day's ticks up to the flatten cutoff, then flatten."""
+        ts_ns = arrays.ts_ns
+        flatten_idx = int(np.searchsorted(ts_ns, self._flatten_ns))
+
+        if flatten_idx > 0:
+            self._process_tick_range(arrays, 0, flatten_idx)
+            self._session_last_time = ns_to_datetime(ts_ns[flatten_idx - 1])
+
+        # Flatten on the first tick at or after the cutoff
+        if flatten_idx < len(ts_ns):
+            if self.open_position:
+                self._close_position(
+                    float(arrays.price[flatten_idx]),
+                    "FLATTEN",
+                    ns_to_datetime(ts_ns[flatten_idx]),
+                )
+            self._expire_pending_orders()
 
-        if self.open_position:
-            self._check_position_exit(tick)
+    def _expire_pending_orders(self) -> None:
+        """Expire every pending order."""
+        for order in self.pending_orders:
+            self.expired_orders += 1
+            self.pattern_stats["expired"][order.pattern_id] += 1
+        self.pending_orders = []
 
-        if self.engine:
-            self.engine.process_tick(tick)
+    def _process_tick_range(self, arrays: TickArrays, start: int, stop: int) -> None:
+        """
+        Process ticks [start, stop) from column arrays.
+
+        The engine is fed one bar segment at a time. Only the first tick of a
+        segment can close a bar (and so create orders), so the rest of the
+        segment is scanned for fill/exit events against fixed order state.
+        """
+        ts_ns = arrays.ts_ns
+        bar_ns = self.engine.timeframe * 1_000_000_000
+        bar_ids = ts_ns[start:stop] // bar_ns
+        bounds = (np.flatnonzero(np.diff(bar_ids)) + 1 + start).tolist()
+
+        for lo, hi in zip([start, *bounds], [*bounds, stop]):
+            self._check_tick(tick_at(arrays, lo))
+            self.engine.process_ticks(
+                ts_ns[lo:hi], arrays.price[lo:hi], arrays.volume[lo:hi], arrays.side[lo:hi],
+                arrays.symbol,
+            )
+            self._scan_events(arrays, lo + 1, hi)
+
+    def _scan_events(self, arrays: TickArrays, start: int, stop: int) -> None:
+        """Handle every tick in [start, stop) that crosses a fill or exit band."""
+        prices = arrays.price
+        i = start
+        while i < stop:
+            segment = prices[i:stop]
+            if self.open_position is not None:
+                hits = np.flatnonzero((segment <= self._exit_low) | (segment >= self._exit_high))
+            elif self.pending_orders:
+                hits = np.flatnonzero((segment <= self._long_limit) | (segment >= self._short_limit))
+            else:
+                return
+
+            if len(hits) == 0:
+                return
+
+            i += int(hits[0])
+            self._check_tick(tick_at(arrays, i))
+            i += 1
 
     def _check_limit_fills(self, tick: Tick) -> None:
         price = tick.price
@@ -233,17 +382,19 @@ class MonthBacktester:
                     entry_time=tick.timestamp,
                     stop_price=stop,
                     target_price=target,
-                    pattern=order.pattern,
+                    pattern_id=order.pattern_id,
                 )
+                self._exit_low = min(stop, target)
+                self._exit_high = max(stop, target)
 
                 self.pending_orders.remove(order)
                 for other in self.pending_orders:
-                    self.pattern_stats[other.pattern]["expired"] += 1
+                    self.pattern_stats["expired"][other.pattern_id] += 1
                     self.expired_orders += 1
                 self.pending_orders = []
 
                 self.filled_orders += 1
-                self.pattern_stats[order.pattern]["filled"] += 1
+                self.pattern_stats["filled"][order.pattern_id] += 1
                 break
 
     def _check_position_exit(self, tick: Tick) -> None:
@@ -295,30 +446,33 @@ class MonthBacktester:
             exit_reason=reason,
             pnl=pnl,
             pnl_ticks=pnl_ticks,
-            pattern=pos.pattern,
+            pattern=self._pattern_names[pos.pattern_id],
             date=self._current_date,
         )
 
         self.completed_trades.append(trade)
+        self._trades_by_date[self._current_date].append(trade)
 
         if pnl > 0:
-            self.pattern_stats[pos.pattern]["wins"] += 1
+            self.pattern_stats["wins"][pos.pattern_id] += 1
         else:
-            self.pattern_stats[pos.pattern]["losses"] += 1
-        self.pattern_stats[pos.pattern]["pnl"] += pnl
+            self.pattern_stats["losses"][pos.pattern_id] += 1
+        self.pattern_stats["pnl"][pos.pattern_id] += pnl
 
         self.open_position = None
 
     def _end_day(self, date: str) -> Dict:
         if self.open_position and self._current_bar_close:
-            self._close_position(self._current_bar_close, "FLATTEN", datetime.now())
+            # Stamp with the last tick processed so reruns are reproducible
+            self._close_position(
+                self._current_bar_close,
+                "FLATTEN",
+                self._session_last_time or self.open_position.entry_time,
+            )
 
-        for order in self.pending_orders:
-            self.expired_orders += 1
-            self.pattern_stats[order.pattern]["expired"] += 1
-        self.pending_orders = []
+        self._expire_pending_orders()
 
-        day_trades = [t for t in self.completed_trades if t.date == date]
+        day_trades = self._trades_by_date.get(date, [])
         day_pnl = sum(t.pnl for t in day_trades)
         day_wins = sum(1 for t in day_trades if t.pnl > 0)
 
@@ -335,13 +489,29 @@ class MonthBacktester:
 
     def get_summary(self) -> Dict:
         """Get summary statistics."""
-        total_signals = sum(s["signals"] for s in self.pattern_stats.values())
-        total_filled = sum(s["filled"] for s in self.pattern_stats.values())
+        stats = self.pattern_stats[:len(self._pattern_names)]
+        total_signals = int(stats["signals"].sum())
+        total_filled = int(stats["filled"].sum())
         total_trades = len(self.completed_trades)
-        wins = sum(1 for t in self.completed_trades if t.pnl > 0)
-        gross_pnl = sum(t.pnl for t in self.completed_trades)
-        gross_profit = sum(t.pnl for t in self.completed_trades if t.pnl > 0)
-        gross_loss = abs(sum(t.pnl for t in self.completed_trades if t.pnl < 0))
+
+        wins = 0
+        gross_profit = 0.0
+        gross_loss = 0.0
+        for t in self.completed_trades:
+            pnl = t.pnl
+            if pnl > 0:
+                wins += 1
+                gross_profit += pnl
+            elif pnl < 0:
+                gross_loss -= pnl
+        gross_pnl = gross_profit - gross_loss
+
+        winning_days = losing_days = 0
+        for d in self.daily_results:
+            if d["pnl"] > 0:
+                winning_days += 1
+            elif d["pnl"] < 0:
+                losing_days += 1
 
         return {
             "signals": total_signals,
@@ -355,12 +525,26 @@ class MonthBacktester:
             "gross_profit": gross_profit,
             "gross_loss": gross_loss,
             "profit_factor": gross_profit / gross_loss if gross_loss > 0 else 0,
-            "winning_days": sum(1 for d in self.daily_results if d["pnl"] > 0),
-            "losing_days": sum(1 for d in self.daily_results if d["pnl"] < 0),
-            "pattern_stats": dict(self.pattern_stats),
+            "winning_days": winning_days,
+            "losing_days": losing_days,
+            "pattern_stats": {
+                name: dict(zip(PATTERN_STATS_DTYPE.names, row.tolist()))
+                for name, row in zip(self._pattern_names, stats)
+            },
         }
 
 
+def get_flatten_ns(date: str) -> int:
+    """
+    Flatten cutoff for a session, in nanoseconds on the tick clock.
+
+    Cached tick timestamps are UTC, and the cutoff is compared against their
+    wall-clock time as the per-tick check always has been.
+    """
+    day = datetime.strptime(date, "%Y-%m-%d").date()
+    return datetime_to_ns(datetime.combine(day, FLATTEN_TIME, tzinfo=timezone.utc))
+
+
 def get_trading_days(start_date: str, num_days: int) -> List[str]:
     """Generate trading days (skip weekends)."""
     days = []
@@ -372,48 +556,68 @@ def get_trading_days(start_date: str, num_days: int) -> List[str]:
     return days
 
 
-def load_cached_ticks(contract: str, date: str):
-    """Load ticks from cache."""
-    from src.core.types import Tick
+def get_cache_path(contract: str, date: str) -> str:
+    """Get cache file path for a session."""
+    return os.path.join(CACHE_DIR, f"{contract}_{date}_0930_1600.json")
 
-    cache_path = os.path.join(CACHE_DIR, f"{contract}_{date}_0930_1600.json")
 
-    if not os.path.exists(cache_path):
-        return None
+def load_cached_ticks_arrays(contract: str, date: str) -> Optional[TickArrays]:
+    """Load a cached session as column arrays (backtest fast path)."""
+    return load_tick_arrays(get_cache_path(contract, date))
 
-    with open(cache_path) as f:
-        data = json.load(f)
 
-    ticks = []
-    for d in data:
-        ticks.append(Tick(
-            timestamp=datetime.fromisoformat(d["timestamp"]),
-            price=d["price"],
-            volume=d["volume"],
-            side=d["side"],
-            symbol=d["symbol"]
-        ))
-    return ticks
+def load_cached_ticks(contract: str, date: str) -> Optional[List[Tick]]:
+    """Load ticks from cache as Tick objects."""
+    arrays = load_cached_ticks_arrays(contract, date)
+    if arrays is None:
+        return None
+    return list(iter_ticks(arrays))
 
 
 def save_ticks_to_cache(ticks, contract: str, date: str):
-    """Save ticks to cache."""
+    """Save ticks to cache (JSON plus array sidecar)."""
     os.makedirs(CACHE_DIR, exist_ok=True)
-    cache_path = os.path.join(CACHE_DIR, f"{contract}_{date}_0930_1600.json")
-
-    data = [
-        {
-            "timestamp": t.timestamp.isoformat(),
-            "price": t.price,
-            "volume": t.volume,
-            "side": t.side,
-            "symbol": t.symbol
-        }
-        for t in ticks
-    ]
-
-    with open(cache_path, "w") as f:
-        json.dump(data, f)
+    cache_path = get_cache_path(contract, date)
+    write_json(cache_path, ticks_to_records(ticks))
+    save_tick_arrays(ticks_to_arrays(ticks), cache_path)
+
+
+async def prefetch_sessions(contract: str, dates: List[str]) -> None:
+    """Fetch uncached sessions a few at a time and write them to the cache."""
+    missing = [d for d in dates if not os.path.exists(get_cache_path(contract, d))]
+    if not missing:
+        return
+
+    logger.info(f"Fetching {len(missing)} uncached {contract} sessions...")
+    try:
+        adapter = DatabentoAdapter()
+    except Exception as e:
+        logger.warning(f"Failed to create Databento adapter: {e}")
+        return
+
+    fetch_slots = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def fetch(date: str):
+        async with fetch_slots:
+            return await asyncio.to_thread(
+                adapter.get_session_ticks,
+                contract=contract,
+                date=date,
+                start_time="09:30",
+                end_time="16:00",
+            )
+
+    results = await asyncio.gather(*[fetch(date) for date in missing], return_exceptions=True)
+
+    failed = 0
+    for date, ticks in zip(missing, results):
+        if isinstance(ticks, Exception):
+            failed += 1
+            logger.warning(f"Failed to fetch {date}: {ticks}")
+        elif ticks:
+            save_ticks_to_cache(ticks, contract, date)
+    if failed:
+        logger.warning(f"{failed} of {len(missing)} {contract} sessions failed to fetch and will be skipped")
 
 
 async def run_month(month_name: str, start_date: str, num_days: int, contract: str) -> Dict:
@@ -426,54 +630,20 @@ async def run_month(month_name: str, start_date: str, num_days: int, contract: s
     backtester = MonthBacktester()
     trading_days = get_trading_days(start_date, num_days)
 
+    await prefetch_sessions(contract, trading_days)
+
     for date in trading_days:
         backtester._setup_day(date, "ES")
 
-        ticks = load_cached_ticks(contract, date)
-        if not ticks:
-            logger.info(f"Fetching {contract} {date}...")
-            try:
-                adapter = DatabentoAdapter()
-                ticks = adapter.get_session_ticks(
-                    contract=contract,
-                    date=date,
-                    start_time="09:30",
-                    end_time="16:00",
-                )
-                if ticks:
-                    save_ticks_to_cache(ticks, contract, date)
-            except Exception as e:
-                logger.warning(f"Failed to fetch {date}: {e}")
-                backtester._end_day(date)
-                continue
-
-        if not ticks:
+        arrays = load_cached_ticks_arrays(contract, date)
+        if arrays is None or len(arrays.ts_ns) == 0:
             logger.warning(f"No data for {date}")
             backtester._end_day(date)
             continue
 
-        logger.info(f"{date}: {len(ticks):,} ticks")
-
-        flatten_time = time(15, 55)
-        flattened = False
-
-        for tick in ticks:
-            tick_time = tick.timestamp.time() if hasattr(tick.timestamp, 'time') else None
-
-            if tick_time and tick_time >= flatten_time and not flattened:
-                if backtester.open_position:
-                    backtester._close_position(tick.price, "FLATTEN", tick.timestamp)
-                for order in backtester.pending_orders:
-                    backtester.expired_orders += 1
-                    backtester.pattern_stats[order.pattern]["expired"] += 1
-                backtester.pending_orders = []
-                flattened = True
-                continue
+        logger.info(f"{date}: {len(arrays.ts_ns):,} ticks")
 
-            if flattened:
-                continue
-
-            backtester._process_tick(tick)
+        backtester._run_session(arrays)
 
         result = backtester._end_day(date)
         pnl_str = f"+${result['pnl']:.2f}" if result['pnl'] >= 0 else f"${result['pnl']:.2f}"
@@ -489,218 +659,260 @@ async def run_month(month_name: str, start_date: str, num_days: int, contract: s
     return summary
 
 
+def run_month_sync(month_name: str, start_date: str, num_days: int, contract: str) -> Dict:
+    """Run a single month in its own event loop (process pool entry point)."""
+    return asyncio.run(run_month(month_name, start_date, num_days, contract))
+
+
+PATTERN_MONTH_HEADER = (
+    "| Month | Signals | Filled | Win% | P&L |\n"
+    "|-------|---------|--------|------|-----|\n"
+)
+
+
 def generate_markdown_report(results: List[Dict], output_path: str):
     """Generate comprehensive markdown report."""
 
-    with open(output_path, "w") as f:
-        f.write("# Multi-Month Limit Order Backtest Analysis\n\n")
-        f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        f.write("**Strategy:** Limit orders at signal price (bar.low for longs, bar.high for shorts)\n")
-        f.write("**Instrument:** ES (E-mini S&P 500) - $12.50 per tick\n")
-        f.write("**Stop:** 16 ticks (4 points) | **Target:** 24 ticks (6 points)\n")
-        f.write("**Order Expiry:** 6 bars (30 minutes)\n\n")
+    buf = io.StringIO()
+    buf.write("# Multi-Month Limit Order Backtest Analysis\n\n")
+    buf.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    buf.write("**Strategy:** Limit orders at signal price (bar.low for longs, bar.high for shorts)\n")
+    buf.write("**Instrument:** ES (E-mini S&P 500) - $12.50 per tick\n")
+    buf.write("**Stop:** 16 ticks (4 points) | **Target:** 24 ticks (6 points)\n")
+    buf.write("**Order Expiry:** 6 bars (30 minutes)\n\n")
 
-        f.write("---\n\n")
+    buf.write("---\n\n")
 
-        # Executive Summary
-        f.write("## Executive Summary\n\n")
-        f.write("| Month | Trades | Win Rate | Gross P&L | After Comm | Profit Factor |\n")
-        f.write("|-------|--------|----------|-----------|------------|---------------|\n")
+    # Executive Summary
+    buf.write("## Executive Summary\n\n")
+    buf.write("| Month | Trades | Win Rate | Gross P&L | After Comm | Profit Factor |\n")
+    buf.write("|-------|--------|----------|-----------|------------|---------------|\n")
 
-        total_trades = 0
-        total_wins = 0
-        total_pnl = 0
+    total_trades = 0
+    total_wins = 0
+    total_pnl = 0
 
-        for r in results:
-            commission = r["trades"] * 4.50
-            net_pnl = r["gross_pnl"] - commission
-            total_trades += r["trades"]
-            total_wins += r["wins"]
-            total_pnl += r["gross_pnl"]
+    for r in results:
+        commission = r["trades"] * 4.50
+        net_pnl = r["gross_pnl"] - commission
+        total_trades += r["trades"]
+        total_wins += r["wins"]
+        total_pnl += r["gross_pnl"]
+
+        buf.write(f"| {r['month']} | {r['trades']} | {r['win_rate']:.1f}% | ${r['gross_pnl']:+,.2f}")
+        buf.write(f" | ${net_pnl:+,.2f} | {r['profit_factor']:.2f} |\n")
 
-            f.write(f"| {r['month']} | {r['trades']} | {r['win_rate']:.1f}% | ${r['gross_pnl']:+,.2f}")
-            f.write(f" | ${net_pnl:+,.2f} | {r['profit_factor']:.2f} |\n")
+    total_commission = total_trades * 4.50
+    total_net = total_pnl - total_commission
+    total_wr = total_wins / total_trades * 100 if total_trades > 0 else 0
 
-        total_commission = total_trades * 4.50
-        total_net = total_pnl - total_commission
-        total_wr = total_wins / total_trades * 100 if total_trades > 0 else 0
+    buf.write(f"| **TOTAL** | **{total_trades}** | **{total_wr:.1f}%** | **${total_pnl:+,.2f}**")
+    buf.write(f" | **${total_net:+,.2f}** | - |\n\n")
 
-        f.write(f"| **TOTAL** | **{total_trades}** | **{total_wr:.1f}%** | **${total_pnl:+,.2f}**")
-        f.write(f" | **${total_net:+,.2f}** | - |\n\n")
+    buf.write("---\n\n")
 
-        f.write("---\n\n")
+    # Pattern Analysis Across All Months
+    buf.write("## Pattern Performance Across All Months\n\n")
 
-        # Pattern Analysis Across All Months
-        f.write("## Pattern Performance Across All Months\n\n")
+    # Aggregate pattern stats
+    pattern_totals = defaultdict(lambda: {
+        "signals": 0, "filled": 0, "expired": 0,
+        "wins": 0, "losses": 0, "pnl": 0.0,
+        "by_month": {}
+    })
 
-        # Aggregate pattern stats
-        pattern_totals = defaultdict(lambda: {
-            "signals": 0, "filled": 0, "expired": 0,
-            "wins": 0, "losses": 0, "pnl": 0.0,
-            "by_month": {}
-        })
+    for r in results:
+        month = r["month"]
+        for pattern, stats in r["pattern_stats"].items():
+            pattern_totals[pattern]["signals"] += stats["signals"]
+            pattern_totals[pattern]["filled"] += stats["filled"]
+            pattern_totals[pattern]["expired"] += stats["expired"]
+            pattern_totals[pattern]["wins"] += stats["wins"]
+            pattern_totals[pattern]["losses"] += stats["losses"]
+            pattern_totals[pattern]["pnl"] += stats["pnl"]
+            pattern_totals[pattern]["by_month"][month] = stats
+
+    buf.write("### Aggregate Performance\n\n")
+    buf.write("| Pattern | Signals | Fill% | Trades | Win% | Gross P&L | After Comm |\n")
+    buf.write("|---------|---------|-------|--------|------|-----------|------------|\n")
+
+    sorted_patterns = sorted(pattern_totals.items(), key=lambda x: x[1]["pnl"], reverse=True)
+
+    for pattern, stats in sorted_patterns:
+        trades = stats["wins"] + stats["losses"]
+        fill_rate = stats["filled"] / stats["signals"] * 100 if stats["signals"] > 0 else 0
+        win_rate = stats["wins"] / trades * 100 if trades > 0 else 0
+        commission = trades * 4.50
+        net_pnl = stats["pnl"] - commission
+
+        buf.write(f"| {pattern} | {stats['signals']} | {fill_rate:.0f}% | {trades}")
+        buf.write(f" | {win_rate:.0f}% | ${stats['pnl']:+,.2f} | ${net_pnl:+,.2f} |\n")
+
+    buf.write("\n")
+
+    # Pattern by Month Breakdown
+    buf.write("### Pattern Performance By Month\n\n")
+
+    for pattern, stats in sorted_patterns:
+        buf.write(f"#### {pattern}\n\n")
+        buf.write(PATTERN_MONTH_HEADER)
 
         for r in results:
             month = r["month"]
-            for pattern, stats in r["pattern_stats"].items():
-                pattern_totals[pattern]["signals"] += stats["signals"]
-                pattern_totals[pattern]["filled"] += stats["filled"]
-                pattern_totals[pattern]["expired"] += stats["expired"]
-                pattern_totals[pattern]["wins"] += stats["wins"]
-                pattern_totals[pattern]["losses"] += stats["losses"]
-                pattern_totals[pattern]["pnl"] += stats["pnl"]
-                pattern_totals[pattern]["by_month"][month] = stats
-
-        f.write("### Aggregate Performance\n\n")
-        f.write("| Pattern | Signals | Fill% | Trades | Win% | Gross P&L | After Comm |\n")
-        f.write("|---------|---------|-------|--------|------|-----------|------------|\n")
-
-        sorted_patterns = sorted(pattern_totals.items(), key=lambda x: x[1]["pnl"], reverse=True)
-
-        for pattern, stats in sorted_patterns:
-            trades = stats["wins"] + stats["losses"]
-            fill_rate = stats["filled"] / stats["signals"] * 100 if stats["signals"] > 0 else 0
-            win_rate = stats["wins"] / trades * 100 if trades > 0 else 0
-            commission = trades * 4.50
-            net_pnl = stats["pnl"] - commission
-
-            f.write(f"| {pattern} | {stats['signals']} | {fill_rate:.0f}% | {trades}")
-            f.write(f" | {win_rate:.0f}% | ${stats['pnl']:+,.2f} | ${net_pnl:+,.2f} |\n")
-
-        f.write("\n")
-
-        # Pattern by Month Breakdown
-        f.write("### Pattern Performance By Month\n\n")
-
-        for pattern, stats in sorted_patterns:
-            f.write(f"#### {pattern}\n\n")
-            f.write("| Month | Signals | Filled | Win% | P&L |\n")
-            f.write("|-------|---------|--------|------|-----|\n")
-
-            for r in results:
-                month = r["month"]
-                if month in stats["by_month"]:
-                    ms = stats["by_month"][month]
-                    trades = ms["wins"] + ms["losses"]
-                    wr = ms["wins"] / trades * 100 if trades > 0 else 0
-                    f.write(f"| {month} | {ms['signals']} | {ms['filled']} | {wr:.0f}% | ${ms['pnl']:+,.2f} |\n")
-                else:
-                    f.write(f"| {month} | 0 | 0 | - | $0.00 |\n")
+            if month in stats["by_month"]:
+                ms = stats["by_month"][month]
+                trades = ms["wins"] + ms["losses"]
+                wr = ms["wins"] / trades * 100 if trades > 0 else 0
+                buf.write(f"| {month} | {ms['signals']} | {ms['filled']} | {wr:.0f}% | ${ms['pnl']:+,.2f} |\n")
+            else:
+                buf.write(f"| {month} | 0 | 0 | - | $0.00 |\n")
 
-            f.write("\n")
+        buf.write("\n")
 
-        f.write("---\n\n")
+    buf.write("---\n\n")
 
-        # Consistency Analysis
-        f.write("## Pattern Consistency Analysis\n\n")
-        f.write("Patterns are rated on consistency across all 4 months:\n\n")
+    # Consistency Analysis
+    buf.write("## Pattern Consistency Analysis\n\n")
+    buf.write("Patterns are rated on consistency across all 4 months:\n\n")
 
-        f.write("| Pattern | Profitable Months | Avg Win% | Verdict |\n")
-        f.write("|---------|-------------------|----------|----------|\n")
+    buf.write("| Pattern | Profitable Months | Avg Win% | Verdict |\n")
+    buf.write("|---------|-------------------|----------|----------|\n")
 
-        for pattern, stats in sorted_patterns:
-            profitable_months = 0
-            win_rates = []
+    for pattern, stats in sorted_patterns:
+        profitable_months = 0
+        win_rates = []
 
-            for month, ms in stats["by_month"].items():
-                trades = ms["wins"] + ms["losses"]
-                if trades > 0:
-                    if ms["pnl"] > 0:
-                        profitable_months += 1
-                    win_rates.append(ms["wins"] / trades * 100)
+        for month, ms in stats["by_month"].items():
+            trades = ms["wins"] + ms["losses"]
+            if trades > 0:
+                if ms["pnl"] > 0:
+                    profitable_months += 1
+                win_rates.append(ms["wins"] / trades * 100)
 
-            avg_wr = sum(win_rates) / len(win_rates) if win_rates else 0
+        avg_wr = sum(win_rates) / len(win_rates) if win_rates else 0
 
-            if profitable_months >= 3 and avg_wr >= 50:
-                verdict = "✅ KEEP"
-            elif profitable_months >= 2 and avg_wr >= 45:
-                verdict = "⚠️ FILTER"
-            else:
-                verdict = "❌ DISABLE"
+        if profitable_months >= 3 and avg_wr >= 50:
+            verdict = "✅ KEEP"
+        elif profitable_months >= 2 and avg_wr >= 45:
+            verdict = "⚠️ FILTER"
+        else:
+            verdict = "❌ DISABLE"
 
-            f.write(f"| {pattern} | {profitable_months}/4 | {avg_wr:.0f}% | {verdict} |\n")
+        buf.write(f"| {pattern} | {profitable_months}/4 | {avg_wr:.0f}% | {verdict} |\n")
 
-        f.write("\n---\n\n")
+    buf.write("\n---\n\n")
 
-        # Monthly Details
-        f.write("## Monthly Details\n\n")
+    # Monthly Details
+    buf.write("## Monthly Details\n\n")
 
-        for r in results:
-            f.write(f"### {r['month']}\n\n")
-            f.write(f"**Contract:** {r['contract']} | **Period:** {r['start_date']} ({r['num_days']} days)\n\n")
-
-            f.write("| Metric | Value |\n")
-            f.write("|--------|-------|\n")
-            f.write(f"| Signals | {r['signals']} |\n")
-            f.write(f"| Fill Rate | {r['fill_rate']:.1f}% |\n")
-            f.write(f"| Trades | {r['trades']} |\n")
-            f.write(f"| Win Rate | {r['win_rate']:.1f}% |\n")
-            f.write(f"| Gross P&L | ${r['gross_pnl']:+,.2f} |\n")
-            commission = r['trades'] * 4.50
-            f.write(f"| Commissions | ${commission:.2f} |\n")
-            f.write(f"| Net P&L | ${r['gross_pnl'] - commission:+,.2f} |\n")
-            f.write(f"| Profit Factor | {r['profit_factor']:.2f} |\n")
-            f.write(f"| Winning Days | {r['winning_days']} |\n")
-            f.write(f"| Losing Days | {r['losing_days']} |\n")
-            f.write("\n")
-
-            f.write("**Daily Breakdown:**\n\n")
-            f.write("| Date | Trades | W/L | P&L |\n")
-            f.write("|------|--------|-----|-----|\n")
-            for d in r["daily_results"]:
-                pnl_str = f"+${d['pnl']:.2f}" if d['pnl'] >= 0 else f"${d['pnl']:.2f}"
-                f.write(f"| {d['date']} | {d['trades']} | {d['wins']}/{d['losses']} | {pnl_str} |\n")
-            f.write("\n")
-
-        f.write("---\n\n")
-
-        # Recommendations
-        f.write("## Recommendations\n\n")
-        f.write("Based on cross-month analysis:\n\n")
-
-        for pattern, stats in sorted_patterns:
-            profitable_months = sum(1 for ms in stats["by_month"].values()
-                                   if ms["wins"] + ms["losses"] > 0 and ms["pnl"] > 0)
-            trades = stats["wins"] + stats["losses"]
-            win_rate = stats["wins"] / trades * 100 if trades > 0 else 0
-
-            if profitable_months >= 3 and win_rate >= 50:
-                f.write(f"- **{pattern}**: ✅ Strong performer - keep enabled\n")
-            elif profitable_months >= 2 and win_rate >= 45:
-                f.write(f"- **{pattern}**: ⚠️ Marginal - consider regime filtering\n")
-            elif profitable_months == 1:
-                f.write(f"- **{pattern}**: ❌ Inconsistent - disable or heavy filtering\n")
-            else:
-                f.write(f"- **{pattern}**: ❌ Net loser - disable\n")
+    for r in results:
+        buf.write(f"### {r['month']}\n\n")
+        buf.write(f"**Contract:** {r['contract']} | **Period:** {r['start_date']} ({r['num_days']} days)\n\n")
+
+        buf.write("| Metric | Value |\n")
+        buf.write("|--------|-------|\n")
+        buf.write(f"| Signals | {r['signals']} |\n")
+        buf.write(f"| Fill Rate | {r['fill_rate']:.1f}% |\n")
+        buf.write(f"| Trades | {r['trades']} |\n")
+        buf.write(f"| Win Rate | {r['win_rate']:.1f}% |\n")
+        buf.write(f"| Gross P&L | ${r['gross_pnl']:+,.2f} |\n")
+        commission = r['trades'] * 4.50
+        buf.write(f"| Commissions | ${commission:.2f} |\n")
+        buf.write(f"| Net P&L | ${r['gross_pnl'] - commission:+,.2f} |\n")
+        buf.write(f"| Profit Factor | {r['profit_factor']:.2f} |\n")
+        buf.write(f"| Winning Days | {r['winning_days']} |\n")
+        buf.write(f"| Losing Days | {r['losing_days']} |\n")
+        buf.write("\n")
+
+        buf.write("**Daily Breakdown:**\n\n")
+        buf.write("| Date | Trades | W/L | P&L |\n")
+        buf.write("|------|--------|-----|-----|\n")
+        for d in r["daily_results"]:
+            pnl_str = f"+${d['pnl']:.2f}" if d['pnl'] >= 0 else f"${d['pnl']:.2f}"
+            buf.write(f"| {d['date']} | {d['trades']} | {d['wins']}/{d['losses']} | {pnl_str} |\n")
+        buf.write("\n")
+
+    buf.write("---\n\n")
+
+    # Recommendations
+    buf.write("## Recommendations\n\n")
+    buf.write("Based on cross-month analysis:\n\n")
+
+    for pattern, stats in sorted_patterns:
+        profitable_months = sum(1 for ms in stats["by_month"].values()
+                               if ms["wins"] + ms["losses"] > 0 and ms["pnl"] > 0)
+        trades = stats["wins"] + stats["losses"]
+        win_rate = stats["wins"] / trades * 100 if trades > 0 else 0
+
+        if profitable_months >= 3 and win_rate >= 50:
+            buf.write(f"- **{pattern}**: ✅ Strong performer - keep enabled\n")
+        elif profitable_months >= 2 and win_rate >= 45:
+            buf.write(f"- **{pattern}**: ⚠️ Marginal - consider regime filtering\n")
+        elif profitable_months == 1:
+            buf.write(f"- **{pattern}**: ❌ Inconsistent - disable or heavy filtering\n")
+        else:
+            buf.write(f"- **{pattern}**: ❌ Net loser - disable\n")
+
+    buf.write("\n---\n\n")
+    buf.write("*Report generated by Delta Trading System*\n")
 
-        f.write("\n---\n\n")
-        f.write("*Report generated by Delta Trading System*\n")
+    with open(output_path, "w") as f:
+        f.write(buf.getvalue())
 
     logger.info(f"Report saved to: {output_path}")
 
 
-async def main():
-    """Run all month backtests."""
+# Test months
+# Contract months: H=March, M=June, U=September, Z=December
+MONTHS = [
+    ("August 2024", "2024-08-01", 22, "ESU4"),      # Sep contract
+    ("October 2024", "2024-10-01", 23, "ESZ4"),     # Dec contract
+    ("February 2025", "2025-02-03", 19, "ESH5"),    # Mar contract
+    ("June 2025", "2025-06-02", 21, "ESU5"),        # Sep contract
+]
 
-    # Define test months
-    # Contract months: H=March, M=June, U=September, Z=December
-    months = [
-        ("August 2024", "2024-08-01", 22, "ESU4"),      # Sep contract
-        ("October 2024", "2024-10-01", 23, "ESZ4"),     # Dec contract
-        ("February 2025", "2025-02-03", 19, "ESH5"),    # Mar contract
-        ("June 2025", "2025-06-02", 21, "ESU5"),        # Sep contract
-    ]
 
+def profile_month(month: tuple, output_path: str) -> None:
+    """
+    Run one month in-process under cProfile.
+
+    Writes pstats data to output_path (viewable with snakeviz or
+    `python -m pstats`) and prints the top entries by cumulative time.
+    """
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    run_month_sync(*month)
+    profiler.disable()
+
+    profiler.dump_stats(output_path)
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+    logger.info(f"Profile saved to: {output_path}")
+
+
+async def main():
+    """Run all month backtests."""
+    months = MONTHS
     results = []
 
-    for month_name, start_date, num_days, contract in months:
-        try:
-            summary = await run_month(month_name, start_date, num_days, contract)
-            results.append(summary)
-        except Exception as e:
-            logger.error(f"Failed to run {month_name}: {e}")
-            import traceback
-            traceback.print_exc()
+    # Months share no state, so each runs in its own worker process
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=len(months)) as pool:
+        futures = [
+            (month[0], loop.run_in_executor(pool, run_month_sync, *month))
+            for month in months
+        ]
+
+        for month_name, future in futures:
+            try:
+                summary = await future
+                results.append(summary)
+            except Exception as e:
+                logger.error(f"Failed to run {month_name}: {e}")
+                import traceback
+                traceback.print_exc()
 
     # Generate report
     report_path = os.path.join(os.path.dirname(__file__), "multi_month_analysis.md")
@@ -722,4 +934,17 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Multi-month limit order backtest")
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Profile the first month in-process and write pstats to PATH",
+    )
+    args = parser.parse_args()
+
+    if args.profile:
+        profile_month(MONTHS[0], args.profile)
+    else:
+        asyncio.run(main())
@@ -1,59 +1,114 @@
 #!/usr/bin/env python3
 """Run backtests on multiple days from a file."""
 
+import argparse
+import contextlib
+import io
 import subprocess
 import sys
 import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Callable
 
-def run_backtest(date: str) -> dict:
-    """Run backtest for a single date and return result."""
-    result = subprocess.run(
-        ["python3", "scripts/run_databento_backtest.py", "--date", date],
-        capture_output=True,
-        text=True,
-        timeout=180,
-        env={**os.environ, "PYTHONPATH": "/home/faded-vibes/tradebot"}
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.data.tick_cache import read_json
+
+# Backtest stack, bound once per worker process by _init_worker
+_run_databento_backtest = None
+_front_month_contract = None
+_total_spending = None
+
+
+def _init_worker():
+    """Pool initializer: import the backtest stack once per worker."""
+    global _run_databento_backtest, _front_month_contract, _total_spending
+    from scripts.run_databento_backtest import run_backtest
+    from src.data.adapters.databento import DatabentoAdapter
+    from src.data.backtest_db import get_total_spending
+
+    _run_databento_backtest = run_backtest
+    _front_month_contract = DatabentoAdapter.get_front_month_contract
+    _total_spending = get_total_spending
+
+
+def needs_fetch(date: str) -> bool:
+    """Whether a date's session or warmup ticks would be bought from Databento."""
+    from scripts.run_databento_backtest import get_cache_path
+    from src.data.adapters.databento import DatabentoAdapter
+
+    contract = DatabentoAdapter.get_front_month_contract("ES", date)
+    return not all(
+        os.path.exists(get_cache_path(contract, date, start, end))
+        for start, end in (("09:30", "16:00"), ("07:00", "09:30"))
     )
 
-    # Parse the output for key metrics
-    output = result.stdout + result.stderr
-
-    # Extract P&L from the line that shows the date
-    pnl = 0
-    trades = 0
-    win_rate = 0
-    for line in output.split("\n"):
-        if date in line and "$" in line:
-            parts = line.split()
-            for i, p in enumerate(parts):
-                if p.startswith("$") and i > 0:
-                    try:
-                        pnl = float(p.replace("$", "").replace(",", ""))
-                    except:
-                        pass
-                if "%" in p and i > 0:
-                    try:
-                        win_rate = float(p.replace("%", ""))
-                    except:
-                        pass
-            # Find trades count
-            for i, p in enumerate(parts):
-                try:
-                    if i > 3 and parts[i+1].endswith("%"):
-                        trades = int(p)
-                        break
-                except:
-                    pass
 
+def _summarize(date: str, result: dict) -> dict:
+    """Reduce a run_backtest result to the batch summary fields."""
+    if not result:
+        return {"date": date, "pnl": 0, "trades": 0, "win_rate": 0, "success": False}
+
+    trades = result["trades"]
     return {
         "date": date,
-        "pnl": pnl,
+        "pnl": result["pnl"],
         "trades": trades,
-        "win_rate": win_rate,
-        "success": result.returncode == 0
+        "win_rate": 100 * result["wins"] / trades if trades else 0,
+        "success": True
     }
 
+
+def run_backtest(date: str) -> dict:
+    """Run backtest for a single date and return result (worker process)."""
+    if _run_databento_backtest is None:
+        _init_worker()
+    contract = _front_month_contract("ES", date)
+
+    # Keep the per-session log out of the batch output
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = _run_databento_backtest(
+            contract=contract,
+            date=date,
+            start_time="09:30",
+            end_time="16:00",
+            budget_remaining=_total_spending()["remaining"],
+        )
+
+    return _summarize(date, result)
+
+
+def run_backtest_isolated(date: str) -> dict:
+    """Run backtest for a single date in its own interpreter."""
+    fd, json_path = tempfile.mkstemp(prefix=f"backtest_{date}_", suffix=".json")
+    os.close(fd)
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-m", "scripts.run_databento_backtest",
+             "--date", date, "--json-out", json_path],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            timeout=180,
+        )
+        # The child writes its result dict; no stdout parsing needed
+        if proc.returncode != 0 or os.path.getsize(json_path) == 0:
+            return _summarize(date, None)
+        return _summarize(date, read_json(json_path))
+    finally:
+        os.unlink(json_path)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Run backtests on multiple days")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run each date in its own subprocess")
+    args = parser.parse_args()
+
     # Read dates from file
     with open("/tmp/new_60_days.txt") as f:
         dates = [line.strip() for line in f if line.strip()]
@@ -62,26 +117,59 @@ def main():
     print("=" * 70)
 
     results = []
-    total_pnl = 0
-    total_trades = 0
-    winning_days = 0
-
-    for i, date in enumerate(dates):
-        print(f"[{i+1}/{len(dates)}] {date}...", end=" ", flush=True)
-        try:
-            result = run_backtest(date)
-            results.append(result)
-            total_pnl += result["pnl"]
-            total_trades += result["trades"]
-            if result["pnl"] > 0:
-                winning_days += 1
+    done = 0
+    lock = threading.Lock()
 
+    def report(date: str, result: dict, error: Exception = None) -> None:
+        nonlocal done
+        with lock:
+            done += 1
+            if error is not None:
+                print(f"[{done}/{len(dates)}] {date}... ERROR: {error}")
+                return
             status = "WIN" if result["pnl"] > 0 else "LOSS" if result["pnl"] < 0 else "FLAT"
-            print(f"{result['trades']:>3} trades, {result['win_rate']:>5.0f}% win, ${result['pnl']:>8,.0f} [{status}]  Running: ${total_pnl:,.0f}")
+            print(f"[{done}/{len(dates)}] {date}... {result['trades']:>3} trades, {result['win_rate']:>5.0f}% win, ${result['pnl']:>8,.0f} [{status}]")
 
+    def collect(date: str, get_result: Callable[[], dict]) -> None:
+        try:
+            result = get_result()
+            report(date, result)
         except Exception as e:
-            print(f"ERROR: {e}")
-            results.append({"date": date, "pnl": 0, "trades": 0, "win_rate": 0, "success": False})
+            result = {"date": date, "pnl": 0, "trades": 0, "win_rate": 0, "success": False}
+            report(date, result, e)
+        results.append(result)
+
+    # Only fully cached dates run in parallel. A date that has to buy ticks
+    # runs here, one at a time, so each one checks the budget after the
+    # previous fetch has been logged and concurrent runs cannot overspend it
+    to_fetch = [d for d in dates if needs_fetch(d)]
+    fetching = set(to_fetch)
+    cached = [d for d in dates if d not in fetching]
+    if to_fetch:
+        print(f"{len(to_fetch)} days need Databento data; fetching those one at a time")
+
+    # In-process backtests are CPU-bound, so use processes; isolated ones
+    # already run in child interpreters and only need threads to wait on them.
+    # Each worker imports the backtest stack once at start-up and then
+    # serves many dates
+    workers = max(1, min(len(cached), os.cpu_count() or 1))
+    if args.isolate:
+        pool = ThreadPoolExecutor(max_workers=workers)
+        run = run_backtest_isolated
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        run = run_backtest
+    with pool as ex:
+        futures = {ex.submit(run, d): d for d in cached}
+        for date in to_fetch:
+            collect(date, partial(run, date))
+        for fut in as_completed(futures):
+            collect(futures[fut], fut.result)
+
+    results.sort(key=lambda r: r["date"])
+    total_pnl = sum(r["pnl"] for r in results)
+    total_trades = sum(r["trades"] for r in results)
+    winning_days = sum(1 for r in results if r["pnl"] > 0)
 
     print("=" * 70)
     print(f"\nBATCH SUMMARY ({len(dates)} days):")
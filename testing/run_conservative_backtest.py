@@ -6,9 +6,13 @@ Conservative fills = require price to go 1 tick BEYOND target for fills.
 This simulates being last in the order queue.
 """
 
+import hashlib
+import json
 import os
 import sys
 import re
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,9 +21,56 @@ from datetime import datetime, time
 from scripts.run_databento_backtest import run_backtest, get_cache_path
 from src.data.backtest_db import get_total_spending, print_summary, get_trade_analysis, get_max_drawdown
 from src.data.adapters.databento import DatabentoAdapter
+from src.data.tick_cache import read_json, write_json
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "../data/tick_cache")
 
+# Per-session results, keyed by tick data + strategy code
+RESULTS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tradebot", "results")
+
+# Everything whose source can change a backtest result, besides the module
+# run_backtest is imported from (hashed wherever it is loaded from)
+STRATEGY_SOURCES = ["src/core", "src/analysis", "src/regime", "src/execution", "src/data/aggregator.py",
+                    "src/data/tick_cache.py"]
+
+# Backtest settings that are part of the result key
+BACKTEST_SETTINGS = {"mode": "conservative_fills", "conservative_fills": True}
+
+
+def _hash_file(path: str, digest) -> None:
+    """Feed a file into a hash object in chunks."""
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+
+def strategy_digest() -> str:
+    """
+    Hash of the strategy source files and backtest settings.
+
+    Raises FileNotFoundError if a listed source is missing, so a moved file
+    can't silently drop out of the result key.
+    """
+    digest = hashlib.sha256(json.dumps(BACKTEST_SETTINGS, sort_keys=True).encode())
+    paths = [os.path.join(PROJECT_ROOT, source) for source in STRATEGY_SOURCES]
+    paths.append(os.path.abspath(sys.modules[run_backtest.__module__].__file__))
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(
+                os.path.join(root, name)
+                for root, _, names in os.walk(path)
+                for name in names if name.endswith(".py")
+            )
+        elif os.path.exists(path):
+            files = [path]
+        else:
+            raise FileNotFoundError(f"Strategy source not found: {path}")
+        for file in files:
+            digest.update(os.path.relpath(file, PROJECT_ROOT).encode())
+            _hash_file(file, digest)
+    return digest.hexdigest()
+
 
 def get_cached_sessions():
     """Get all cached sessions from tick_cache directory."""
@@ -48,6 +99,51 @@ def get_cached_sessions():
     return sessions
 
 
+def _run_one(session: dict):
+    """Run one cached session with conservative fills (worker process)."""
+    # Reuse the stored result if neither the ticks nor the strategy changed.
+    # run_backtest also warms the router up on the 07:00-09:30 ticks, so
+    # whether they are cached, and their content, is part of the key too
+    digest = hashlib.sha256(session['strategy_key'].encode())
+    _hash_file(os.path.join(CACHE_DIR, session['filename']), digest)
+    warmup_path = get_cache_path(session['contract'], session['date'], "07:00", "09:30")
+    if os.path.exists(warmup_path):
+        digest.update(b"warmup")
+        _hash_file(warmup_path, digest)
+    else:
+        digest.update(b"no warmup")
+    result_path = os.path.join(RESULTS_CACHE_DIR, digest.hexdigest() + ".json")
+    if os.path.exists(result_path):
+        return read_json(result_path)
+
+    try:
+        result = run_backtest(
+            contract=session['contract'],
+            date=session['date'],
+            start_time=session['start_time'],
+            end_time=session['end_time'],
+            budget_remaining=999999,  # Using cached data, no cost
+            conservative_fills=True   # THE KEY SETTING
+        )
+    except Exception as e:
+        print(f"  ERROR ({session['date']}): {e}")
+        traceback.print_exc()
+        return None
+
+    if not result:
+        return None
+    summary = {
+        'date': result['date'],
+        'pnl': result.get('pnl', 0),
+        'trades': result.get('trades', 0),
+        'wins': result.get('wins', 0),
+        'losses': result.get('losses', 0),
+    }
+    os.makedirs(RESULTS_CACHE_DIR, exist_ok=True)
+    write_json(result_path, summary)
+    return summary
+
+
 def main():
     print("=" * 70)
     print("CONSERVATIVE FILLS BACKTEST")
@@ -58,42 +154,18 @@ def main():
     sessions = get_cached_sessions()
     print(f"\nFound {len(sessions)} cached sessions")
 
-    # Results tracking
-    results = []
-    total_pnl = 0
-    total_trades = 0
-    winning_days = 0
-    losing_days = 0
-
-    for i, session in enumerate(sessions):
-        print(f"\n[{i+1}/{len(sessions)}] Processing {session['date']}...")
-
-        try:
-            result = run_backtest(
-                contract=session['contract'],
-                date=session['date'],
-                start_time=session['start_time'],
-                end_time=session['end_time'],
-                budget_remaining=999999,  # Using cached data, no cost
-                conservative_fills=True   # THE KEY SETTING
-            )
+    strategy_key = strategy_digest()
+    for session in sessions:
+        session['strategy_key'] = strategy_key
+
+    # Sessions are independent, so run them across all cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = [r for r in ex.map(_run_one, sessions) if r]
 
-            if result:
-                results.append(result)
-                pnl = result.get('pnl', 0)
-                trades = result.get('trades', 0)
-                total_pnl += pnl
-                total_trades += trades
-
-                if pnl > 0:
-                    winning_days += 1
-                elif pnl < 0:
-                    losing_days += 1
-
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            import traceback
-            traceback.print_exc()
+    total_pnl = sum(r['pnl'] for r in results)
+    total_trades = sum(r['trades'] for r in results)
+    winning_days = sum(1 for r in results if r['pnl'] > 0)
+    losing_days = sum(1 for r in results if r['pnl'] < 0)
 
     # Final summary
     print("\n" + "=" * 70)
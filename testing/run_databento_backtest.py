@@ -12,8 +12,9 @@ import os
 import sys
 from datetime import datetime, time
 
-from src.core.types import Tick, Signal, FootprintBar
+from src.core.types import Signal, FootprintBar
 from src.data.adapters.databento import DatabentoAdapter
+from src.data.tick_cache import read_json, write_json, records_to_ticks, ticks_to_records
 from src.data.backtest_db import log_backtest, log_trade, get_total_spending, print_summary, get_trade_analysis, get_max_drawdown
 from src.analysis.engine import OrderFlowEngine
 from src.regime.router import StrategyRouter
@@ -38,35 +39,12 @@ def load_cached_ticks(cache_path: str) -> list:
         return None
 
     print(f"Loading from cache: {cache_path}")
-    with open(cache_path) as f:
-        data = json.load(f)
-
-    ticks = []
-    for d in data:
-        ticks.append(Tick(
-            timestamp=datetime.fromisoformat(d["timestamp"]),
-            price=d["price"],
-            volume=d["volume"],
-            side=d["side"],
-            symbol=d["symbol"]
-        ))
-    return ticks
+    return records_to_ticks(read_json(cache_path))
 
 
 def save_ticks_to_cache(ticks: list, cache_path: str) -> None:
     """Save ticks to cache file."""
-    data = [
-        {
-            "timestamp": t.timestamp.isoformat(),
-            "price": t.price,
-            "volume": t.volume,
-            "side": t.side,
-            "symbol": t.symbol
-        }
-        for t in ticks
-    ]
-    with open(cache_path, "w") as f:
-        json.dump(data, f)
+    write_json(cache_path, ticks_to_records(ticks))
     print(f"Cached {len(ticks):,} ticks to: {cache_path}")
 
 
@@ -376,6 +354,8 @@ def main():
     parser.add_argument("--summary", action="store_true", help="Show spending summary only")
     parser.add_argument("--conservative", action="store_true",
                        help="Require price to go 1 tick BEYOND target for fills (simulates queue position)")
+    parser.add_argument("--json-out", type=str,
+                       help="Write the --date result as JSON to this path")
 
     args = parser.parse_args()
 
@@ -484,7 +464,7 @@ def main():
 
     elif args.date:
         contract = args.contract or DatabentoAdapter.get_front_month_contract("ES", args.date)
-        run_backtest(
+        result = run_backtest(
             contract=contract,
             date=args.date,
             start_time=args.start,
@@ -492,6 +472,9 @@ def main():
             budget_remaining=budget_remaining,
             conservative_fills=args.conservative
         )
+        if args.json_out and result:
+            with open(args.json_out, "w") as f:
+                json.dump(result, f)
         print_summary()
 
     else:
@@ -6,17 +6,18 @@ This starts the FastAPI server and feeds it simulated market data
 so you can see the dashboard in action.
 
 Usage:
-    python scripts/run_demo.py
+    python scripts/run_demo.py [--ticks-per-sec 10]
     Then open http://localhost:8000/dashboard in your browser
 """
 
+import argparse
 import asyncio
 import logging
-import random
 import signal
 import sys
 from datetime import datetime, time, timedelta
 
+import numpy as np
 import uvicorn
 
 from src.core.types import Tick, Signal, FootprintBar
@@ -35,51 +36,73 @@ logging.basicConfig(
 logger = logging.getLogger("demo")
 
 
+def _randint(u: float, low: int, high: int) -> int:
+    """Map a uniform draw in [0, 1) to an integer in [low, high]."""
+    return low + int(u * (high - low + 1))
+
+
 class DemoMarketSimulator:
     """Generates realistic market data for demo purposes."""
 
-    def __init__(self, base_price: float = 5050.0):
+    # Uniform draws are generated in bulk, one row of DRAWS_PER_TICK per tick
+    BATCH_SIZE = 4096
+    DRAWS_PER_TICK = 10
+
+    def __init__(self, base_price: float = 5050.0, seed: int = None):
+        self.rng = np.random.default_rng(seed)
+        self._refill()
+
         self.price = base_price
         self.tick_size = 0.25
-        self.trend_direction = random.choice([1, -1])
-        self.trend_duration = random.randint(50, 200)
+        self.trend_direction = 1 if self.rng.random() < 0.5 else -1
+        self.trend_duration = int(self.rng.integers(50, 201))
         self.trend_ticks = 0
         self.tick_count = 0
 
+    def _refill(self) -> None:
+        """Draw the next batch of uniforms."""
+        self._draws = self.rng.random((self.BATCH_SIZE, self.DRAWS_PER_TICK)).tolist()
+        self._cur = 0
+
     def generate_tick(self) -> Tick:
         """Generate a single realistic tick."""
+        u = self._draws[self._cur]
+        self._cur += 1
+        if self._cur == self.BATCH_SIZE:
+            self._refill()
+
         self.tick_count += 1
         self.trend_ticks += 1
 
         # Maybe change trend
         if self.trend_ticks >= self.trend_duration:
-            self.trend_direction = random.choice([1, -1, 0])
-            self.trend_duration = random.randint(30, 150)
+            self.trend_direction = (1, -1, 0)[int(u[0] * 3)]
+            self.trend_duration = _randint(u[1], 30, 150)
             self.trend_ticks = 0
 
         # Price movement
         if self.trend_direction != 0:
             prob_with_trend = 0.6
-            direction = self.trend_direction if random.random() < prob_with_trend else -self.trend_direction
+            direction = self.trend_direction if u[2] < prob_with_trend else -self.trend_direction
         else:
-            direction = random.choice([1, -1])
+            direction = 1 if u[2] < 0.5 else -1
 
-        magnitude = 1 if random.random() < 0.8 else random.randint(2, 3)
+        magnitude = 1 if u[3] < 0.8 else _randint(u[4], 2, 3)
         self.price += direction * magnitude * self.tick_size
 
         # Volume
         base_volume = 10 if self.trend_direction == 0 else 20
-        volume = random.randint(1, base_volume + random.randint(0, 50))
+        volume = _randint(u[5], 1, base_volume + _randint(u[6], 0, 50))
 
         # Side
         if direction > 0:
-            side = "ASK" if random.random() < 0.7 else "BID"
+            side = "ASK" if u[7] < 0.7 else "BID"
         else:
-            side = "BID" if random.random() < 0.7 else "ASK"
+            side = "BID" if u[7] < 0.7 else "ASK"
 
         # Create imbalances occasionally
-        if random.random() < 0.1:
-            volume = random.randint(50, 150)
+        if u[8] < 0.1:
+            volume = _randint(u[9], 50, 150)
 
         return Tick(
             timestamp=datetime.now(),
@@ -93,7 +116,9 @@ class DemoMarketSimulator:
 class DemoSystem:
     """Demo trading system with simulated data."""
 
-    def __init__(self):
+    def __init__(self, ticks_per_sec: float = 10.0):
+        self.ticks_per_sec = ticks_per_sec
+
         # Engine
         self.engine = OrderFlowEngine({
             "symbol": "MES",
@@ -150,6 +175,31 @@ class DemoSystem:
 
         self._running = False
 
+        # Dashboard broadcasts are drained by one worker task
+        self._broadcast_q: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self.dropped_broadcasts = 0
+
+    def _publish(self, kind: str, item) -> None:
+        """Queue a signal or trade for the dashboard, dropping the oldest if full."""
+        try:
+            self._broadcast_q.put_nowait((kind, item))
+        except asyncio.QueueFull:
+            self._broadcast_q.get_nowait()
+            self._broadcast_q.put_nowait((kind, item))
+            self.dropped_broadcasts += 1
+
+    async def _broadcast_worker(self):
+        """Send queued signals and trades to the dashboard."""
+        while True:
+            kind, item = await self._broadcast_q.get()
+            try:
+                if kind == "signal":
+                    await broadcast_signal(item)
+                else:
+                    await broadcast_trade(item)
+            except Exception as e:
+                logger.warning(f"Broadcast failed: {e}")
+
     def _on_bar(self, bar: FootprintBar):
         """Handle bar completion."""
         self.router.on_bar(bar)
@@ -161,7 +211,7 @@ class DemoSystem:
         signal = self.router.evaluate_signal(signal)
 
         # Broadcast to dashboard
-        asyncio.create_task(broadcast_signal(signal))
+        self._publish("signal", signal)
 
         if signal.approved:
             # Check cooldown - don't trade too frequently
@@ -195,32 +245,43 @@ class DemoSystem:
 
     def _on_trade(self, trade):
         """Handle trade completion - broadcast to dashboard."""
-        asyncio.create_task(broadcast_trade(trade))
+        self._publish("trade", trade)
 
     async def run_data_feed(self):
         """Generate and process simulated ticks."""
         self._running = True
         tick_count = 0
 
-        while self._running:
-            tick = self.simulator.generate_tick()
-            self.engine.process_tick(tick)
-            tick_count += 1
-
-            # Small delay to simulate real market speed
-            # ~10 ticks per second
-            await asyncio.sleep(0.1)
-
-            # Log progress
-            if tick_count % 100 == 0:
-                stats = self.manager.get_statistics()
-                logger.info(
-                    f"Ticks: {tick_count} | "
-                    f"Bars: {self.engine.bar_count} | "
-                    f"Signals: {self.engine.signal_count} | "
-                    f"Trades: {stats.get('total_trades', 0)} | "
-                    f"P&L: ${self.manager.daily_pnl:.2f}"
-                )
+        # Wake about 10 times a second and emit the ticks due since the last
+        # wakeup, so higher rates don't cost one event-loop hop per tick
+        batch_size = max(1, int(self.ticks_per_sec / 10))
+        delay = batch_size / self.ticks_per_sec
+        # Log every 100 ticks, but no more than about once a second
+        log_every = max(100, int(self.ticks_per_sec))
+        generate_tick = self.simulator.generate_tick
+        process_tick = self.engine.process_tick
+        broadcaster = asyncio.create_task(self._broadcast_worker())
+
+        try:
+            while self._running:
+                for _ in range(batch_size):
+                    process_tick(generate_tick())
+                tick_count += batch_size
+
+                await asyncio.sleep(delay)
+
+                # Log progress
+                if tick_count // log_every != (tick_count - batch_size) // log_every:
+                    stats = self.manager.get_statistics()
+                    logger.info(
+                        f"Ticks: {tick_count} | "
+                        f"Bars: {self.engine.bar_count} | "
+                        f"Signals: {self.engine.signal_count} | "
+                        f"Trades: {stats.get('total_trades', 0)} | "
+                        f"P&L: ${self.manager.daily_pnl:.2f}"
+                    )
+        finally:
+            broadcaster.cancel()
 
     def stop(self):
         """Stop the demo."""
@@ -229,6 +290,13 @@ class DemoSystem:
 
 async def main():
     """Run the demo."""
+    parser = argparse.ArgumentParser(description="Order flow trading demo")
+    parser.add_argument("--ticks-per-sec", type=float, default=10.0,
+                        help="Simulated tick rate (default: 10)")
+    args = parser.parse_args()
+    if args.ticks_per_sec <= 0:
+        parser.error("--ticks-per-sec must be positive")
+
     logger.info("Starting Order Flow Trading Demo")
     logger.info("=" * 50)
     logger.info("Dashboard: http://localhost:8000/dashboard")
@@ -236,7 +304,7 @@ async def main():
     logger.info("=" * 50)
 
     # Create demo system
-    demo = DemoSystem()
+    demo = DemoSystem(ticks_per_sec=args.ticks_per_sec)
 
     # Handle shutdown
     def shutdown_handler(signum, frame):
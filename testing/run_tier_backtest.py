@@ -15,6 +15,7 @@ Usage:
     PYTHONPATH=. python scripts/run_tier_backtest.py --week 2025-10-22
     PYTHONPATH=. python scripts/run_tier_backtest.py --dates 2025-10-22,2025-10-23,2025-10-24
     PYTHONPATH=. python scripts/run_tier_backtest.py --dates 2025-10-22 --discord
+    PYTHONPATH=. python scripts/run_tier_backtest.py --week 2025-10-22 --no-throttle
 """
 
 import argparse
@@ -22,10 +23,12 @@ import asyncio
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -40,18 +43,23 @@ from src.analysis.engine import OrderFlowEngine
 from src.regime.router import StrategyRouter
 from src.execution.manager import ExecutionManager
 from src.execution.session import TradingSession
+from src.core.jit import HAS_NUMBA
+from src.execution.kernels import first_band_cross, first_band_cross_np
 from src.data.adapters.databento import DatabentoAdapter
-from src.data.backtest_db import log_backtest, log_trade, update_backtest, get_connection
+from src.data.tick_cache import TickArrays, ensure_binary_cache, map_tick_arrays, ticks_to_records, write_json
+from src.data.backtest_db import log_backtest, log_trades, update_backtest, get_connection
 
 # Cache directory for tick data
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "../data/tick_cache")
 
 
-def load_cached_ticks(contract: str, date: str, start_time: str = "09:30", end_time: str = "16:00"):
-    """Load ticks from cache file if it exists."""
-    import json
-    from src.core.types import Tick
+def load_cached_ticks(contract: str, date: str, start_time: str = "09:30", end_time: str = "16:00") -> Optional[TickArrays]:
+    """
+    Load a cached session as column arrays if it exists.
 
+    The columns are memory-mapped from the session's .bin copy, which is
+    built from the JSON on first use, so reruns skip JSON parsing entirely.
+    """
     safe_start = start_time.replace(":", "")
     safe_end = end_time.replace(":", "")
     cache_path = os.path.join(CACHE_DIR, f"{contract}_{date}_{safe_start}_{safe_end}.json")
@@ -60,19 +68,38 @@ def load_cached_ticks(contract: str, date: str, start_time: str = "09:30", end_t
         return None
 
     logger.info(f"Loading from cache: {cache_path}")
-    with open(cache_path) as f:
-        data = json.load(f)
-
-    ticks = []
-    for d in data:
-        ticks.append(Tick(
-            timestamp=datetime.fromisoformat(d["timestamp"]),
-            price=d["price"],
-            volume=d["volume"],
-            side=d["side"],
-            symbol=d["symbol"]
-        ))
-    return ticks
+    return map_tick_arrays(cache_path)
+
+
+def save_ticks_to_cache(ticks: List[Tick], contract: str, date: str, start_time: str = "09:30", end_time: str = "16:00"):
+    """Save ticks to cache file."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    safe_start = start_time.replace(":", "")
+    safe_end = end_time.replace(":", "")
+    cache_path = os.path.join(CACHE_DIR, f"{contract}_{date}_{safe_start}_{safe_end}.json")
+
+    write_json(cache_path, ticks_to_records(ticks))
+    logger.info(f"Cached {len(ticks):,} ticks to: {cache_path}")
+
+
+def prepare_cached_sessions(contract_dates: List[Tuple[str, str]], max_workers: Optional[int] = None) -> int:
+    """
+    Build the .bin copies of several cached sessions in parallel.
+
+    Sessions that are not cached are skipped. Returns the number prepared.
+    """
+    paths = [
+        os.path.join(CACHE_DIR, f"{contract}_{date}_0930_1600.json")
+        for contract, date in contract_dates
+    ]
+    paths = [p for p in paths if os.path.exists(p)]
+    if not paths:
+        return 0
+
+    workers = max_workers or min(len(paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(ensure_binary_cache, paths))
+    return len(paths)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -88,12 +115,16 @@ class TierBacktester:
     def __init__(
         self,
         starting_balance: float = 2500.0,
-        speed_multiplier: float = 10.0,  # 1 min per hour = 60x
+        speed_multiplier: float = 10.0,  # 1 min per hour = 60x; <= 0 runs unthrottled
         send_discord: bool = False,
+        parallel_days: bool = False,
+        use_jit: bool = True,
     ):
         self.starting_balance = starting_balance
         self.speed_multiplier = speed_multiplier
         self.send_discord = send_discord
+        self.parallel_days = parallel_days
+        self._band_scan = first_band_cross if use_jit and HAS_NUMBA else first_band_cross_np
 
         # Discord notifications
         self.notifier: Optional[NotificationService] = None
@@ -108,7 +139,8 @@ class TierBacktester:
         # Track results (must be initialized BEFORE TierManager since callback may fire)
         self.daily_results = []
         self.tier_changes = []
-        self.all_trades = []
+        self._notify_q: asyncio.Queue = asyncio.Queue()  # Tier change alerts for _notify_worker
+        self.trade_sizes: List[int] = []  # Contracts per trade, for the sizing stats
         self._current_date: str = ""  # Also needed by callback
 
         # Initialize tier manager
@@ -130,13 +162,18 @@ class TierBacktester:
         self.session: Optional[TradingSession] = None
         self.manager: Optional[ExecutionManager] = None
 
-        # Signal stacking
-        self._current_bar_signals: List[Signal] = []
+        # Signal stacking: signals seen this bar, by direction
+        self._bar_dir_counts: Dict[str, int] = {}
 
         # Database tracking
         self._current_backtest_id: Optional[int] = None
         self._trade_count: int = 0
         self._pending_trade_context: dict = {}  # Context for trade being executed
+        # Tier fields of the trade context. Tiers can change mid-session
+        # (TierManager.record_trade), so _on_tier_change must refresh these
+        self._tier_ctx: dict = {}
+        self._labels: Dict[Any, str] = {}  # Pattern/regime value -> string for the database
+        self._trade_log_buffer: List[dict] = []  # Trades awaiting the end-of-day insert
 
     def _on_tier_change(self, change: dict):
         """Handle tier change - log and send Discord notification."""
@@ -153,6 +190,12 @@ class TierBacktester:
             f"{'='*60}\n"
         )
 
+        self._tier_ctx = {
+            "tier_index": change["to_tier"],
+            "tier_name": new_tier["name"],
+            "instrument": new_tier["instrument"],
+        }
+
         self.tier_changes.append({
             "direction": direction,
             "from": old_tier["name"],
@@ -164,7 +207,18 @@ class TierBacktester:
 
         # Send Discord notification
         if self.notifier:
-            asyncio.create_task(self._send_tier_change_notification(change, old_tier, new_tier, direction))
+            self._notify_q.put_nowait((change, old_tier, new_tier, direction))
+
+    async def _notify_worker(self):
+        """Send queued tier change alerts to Discord, one at a time."""
+        while True:
+            args = await self._notify_q.get()
+            try:
+                await self._send_tier_change_notification(*args)
+            except Exception as e:
+                logger.warning(f"Tier change notification failed: {e}")
+            finally:
+                self._notify_q.task_done()
 
     async def _send_tier_change_notification(self, change: dict, old_tier: dict, new_tier: dict, direction: str):
         """Send tier change to Discord."""
@@ -223,13 +277,18 @@ class TierBacktester:
         self.engine.on_bar(self._on_bar)
         self.engine.on_signal(self._on_signal)
 
-        self._current_bar_signals = []
+        self._bar_dir_counts.clear()
         self._trade_count = 0
         self._current_backtest_id = None
+        self._tier_ctx = {
+            "tier_index": self.tier_manager.state.tier_index,
+            "tier_name": tier_config["tier_name"],
+            "instrument": symbol,
+        }
 
     def _on_bar(self, bar: FootprintBar) -> None:
         """Handle completed bar."""
-        self._current_bar_signals = []
+        self._bar_dir_counts.clear()
 
         if self.router:
             self.router.on_bar(bar)
@@ -242,15 +301,12 @@ class TierBacktester:
         if not self.router or not self.manager:
             return
 
-        self._current_bar_signals.append(signal)
+        self._bar_dir_counts[signal.direction] = self._bar_dir_counts.get(signal.direction, 0) + 1
         signal = self.router.evaluate_signal(signal)
 
         if signal.approved:
             # Count stacked signals
-            stacked_count = sum(
-                1 for s in self._current_bar_signals
-                if s.direction == signal.direction
-            )
+            stacked_count = self._bar_dir_counts[signal.direction]
 
             # Get position size from tier manager
             current_regime = self.router.current_regime if self.router else "UNKNOWN"
@@ -261,23 +317,23 @@ class TierBacktester:
             )
 
             # Capture context BEFORE executing (for database logging)
-            self._pending_trade_context = {
-                "pattern": signal.pattern,
-                "signal_strength": getattr(signal, "strength", 0),
-                "regime": current_regime,
-                "regime_score": getattr(self.router, "regime_score", None),
-                "stacked_count": stacked_count,
-                "tier_index": self.tier_manager.state.tier_index,
-                "tier_name": self.tier_manager.state.tier_name,
-                "instrument": self.tier_manager.state.instrument,
-                "win_streak": self.tier_manager.state.win_streak,
-                "loss_streak": self.tier_manager.state.loss_streak,
-                "balance_before": self.tier_manager.state.balance,
-            }
+            state = self.tier_manager.state
+            self._pending_trade_context = dict(
+                self._tier_ctx,
+                pattern=signal.pattern,
+                signal_strength=getattr(signal, "strength", 0),
+                regime=current_regime,
+                regime_score=getattr(self.router, "regime_score", None),
+                stacked_count=stacked_count,
+                win_streak=state.win_streak,
+                loss_streak=state.loss_streak,
+                balance_before=state.balance,
+            )
 
             order = self.manager.on_signal(signal, absolute_size=position_size)
 
-            if order:
+            # Only build the message when it will be emitted
+            if order and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     f"Order: {order.side} {order.size}x @ {order.entry_price} "
                     f"(stacked={stacked_count}, regime={current_regime})"
@@ -294,34 +350,17 @@ class TierBacktester:
 
         self._trade_count += 1
 
-        # Track in memory
-        self.all_trades.append({
-            "side": trade.side,
-            "size": trade.size,
-            "entry": trade.entry_price,
-            "exit": trade.exit_price,
-            "pnl": trade.pnl,
-            "exit_reason": trade.exit_reason,
-            "tier_name": ctx.get("tier_name"),
-            "instrument": ctx.get("instrument"),
-        })
+        # Track in memory (the full trade is in the database)
+        self.trade_sizes.append(trade.size)
 
         # Log to database
         if self._current_backtest_id:
             # Convert enums to strings if needed
-            pattern = ctx.get("pattern", "UNKNOWN")
-            if hasattr(pattern, 'name'):
-                pattern = pattern.name
-            elif hasattr(pattern, 'value'):
-                pattern = str(pattern.value)
-
-            regime = ctx.get("regime", "UNKNOWN")
-            if hasattr(regime, 'name'):
-                regime = regime.name
-            elif hasattr(regime, 'value'):
-                regime = str(regime.value)
-
-            log_trade(
+            pattern = self._to_label(ctx.get("pattern", "UNKNOWN"))
+            regime = self._to_label(ctx.get("regime", "UNKNOWN"))
+
+            # Written in one batch by _end_day
+            self._trade_log_buffer.append(dict(
                 backtest_id=self._current_backtest_id,
                 trade_num=self._trade_count,
                 entry_time=trade.entry_time,
@@ -348,28 +387,61 @@ class TierBacktester:
                 loss_streak=ctx.get("loss_streak", 0),
                 balance_before=ctx.get("balance_before"),
                 balance_after=balance_after,
-            )
+            ))
 
         # Clear pending context
         self._pending_trade_context = {}
 
-        emoji = "+" if trade.pnl >= 0 else ""
-        logger.info(
-            f"Trade: {trade.side} {trade.size}x | "
-            f"P&L: {emoji}${trade.pnl:,.2f} | "
-            f"Balance: ${self.tier_manager.state.balance:,.2f}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            emoji = "+" if trade.pnl >= 0 else ""
+            logger.info(
+                f"Trade: {trade.side} {trade.size}x | "
+                f"P&L: {emoji}${trade.pnl:,.2f} | "
+                f"Balance: ${self.tier_manager.state.balance:,.2f}"
+            )
+
+    def _to_label(self, value: Any) -> Any:
+        """Database label for a pattern or regime (enum name/value), memoized per value."""
+        try:
+            return self._labels[value]
+        except KeyError:
+            pass
+        if hasattr(value, "name"):
+            label = value.name
+        elif hasattr(value, "value"):
+            label = str(value.value)
+        else:
+            label = value
+        self._labels[value] = label
+        return label
+
+    def _check_exits(self, prices: np.ndarray, start: int, stop: int) -> Optional[int]:
+        """
+        Update positions on each tick in [start, stop) that leaves the exit band.
+
+        Returns the index at which the session halted, or None.
+        """
+        manager = self.manager
+        scan = self._band_scan
+        i = start
+        while i < stop and manager.open_positions:
+            low, high = manager.get_exit_band()
+            i = scan(prices, i, stop, low, high)
+            if i == stop:
+                break
+            manager.update_prices(float(prices[i]))
+            if manager.is_halted:
+                return i
+            i += 1
+        return None
 
     async def _end_day(self, date: str, contract: str = "", tick_count: int = 0) -> dict:
         """End trading day and return results."""
         if not self.manager:
             return {}
 
-        # Close any open positions
-        if self.manager.open_positions:
-            for pos in self.manager.open_positions:
-                price = pos.current_price or pos.entry_price
-            self.manager.close_all_positions(price, "END_OF_DAY")
+        # Close any open positions, each at its own last mark
+        self.manager.close_all_positions(None, "END_OF_DAY")
 
         # Get stats
         daily_pnl = self.manager.daily_pnl
@@ -380,6 +452,10 @@ class TierBacktester:
         # End tier session
         session_result = self.tier_manager.end_session(daily_pnl)
 
+        # Write the day's trades in one transaction
+        log_trades(self._trade_log_buffer)
+        self._trade_log_buffer.clear()
+
         # Update backtest record with final stats
         if self._current_backtest_id:
             update_backtest(
@@ -469,10 +545,11 @@ class TierBacktester:
         logger.info(f"Loading tick data for {contract} on {date}...")
 
         # Try cache first (FREE!)
-        ticks = load_cached_ticks(contract, date)
+        arrays = load_cached_ticks(contract, date)
+        n = len(arrays.ts_ns) if arrays is not None else 0
 
-        if ticks:
-            logger.info(f"Loaded {len(ticks):,} ticks from cache (no Databento cost)")
+        if n:
+            logger.info(f"Loaded {n:,} ticks from cache (no Databento cost)")
         else:
             # Fall back to Databento (costs money)
             logger.warning(f"Cache miss for {contract} {date} - fetching from Databento...")
@@ -483,8 +560,14 @@ class TierBacktester:
                 start_time="09:30",
                 end_time="16:00",
             )
-
-        if not ticks:
+            if ticks:
+                # Cache the session, then load it back through the column
+                # loader so timestamps are parsed in one vectorized pass
+                save_ticks_to_cache(ticks, contract, date)
+                arrays = load_cached_ticks(contract, date)
+            n = len(arrays.ts_ns) if arrays is not None else 0
+
+        if not n:
             logger.warning(f"No tick data for {date}")
             return await self._end_day(date, contract, 0)
 
@@ -495,39 +578,75 @@ class TierBacktester:
             date=date,
             start_time="09:30",
             end_time="16:00",
-            ticks=len(ticks),
+            ticks=n,
             notes=f"Tier backtest: {self.tier_manager.state.tier_name}",
             from_cache=True,  # Tick data is cached, don't count as spending
         )
         logger.info(f"Created backtest record #{self._current_backtest_id}")
 
-        logger.info(f"Processing {len(ticks):,} ticks at {self.speed_multiplier}x speed...")
+        throttle = self.speed_multiplier > 0
+        if throttle:
+            logger.info(f"Processing {n:,} ticks at {self.speed_multiplier}x speed...")
+        else:
+            logger.info(f"Processing {n:,} ticks unthrottled...")
 
         # Process ticks
-        tick_delay = 1.0 / self.speed_multiplier / 1000  # Approximate
-
-        for i, tick in enumerate(ticks):
-            self.engine.process_tick(tick)
-
-            # Update position prices
-            if self.manager and self.manager.open_positions:
-                self.manager.update_prices(tick.price)
-
-            # Check halt conditions
-            if self.manager.is_halted:
-                logger.info(f"Session halted: {self.manager.halt_reason}")
+        tick_delay = 1.0 / self.speed_multiplier / 1000 if throttle else 0.0  # Approximate
+
+        ts_ns = arrays.ts_ns
+        prices = arrays.price
+        volumes = arrays.volume
+        sides = arrays.side
+        symbol = arrays.symbol
+
+        # Bound once; the loop below runs once per bar segment
+        process_ticks = self.engine.process_ticks
+        check_exits = self._check_exits
+        manager = self.manager
+        progress_interval = 50000
+
+        # The engine is fed one bar segment at a time: only a segment's first
+        # tick can close a bar (and so open positions), after which only ticks
+        # that leave the open positions' exit band can change anything
+        bar_ns = self.engine.timeframe * 1_000_000_000
+        bounds = (np.flatnonzero(np.diff(ts_ns // bar_ns)) + 1).tolist()
+        last = 0
+        next_progress = progress_interval
+
+        for lo, hi in zip([0, *bounds], [*bounds, n]):
+            process_ticks(ts_ns[lo:hi], prices[lo:hi], volumes[lo:hi], sides[lo:hi], symbol)
+            last = hi - 1
+
+            # The segment's first tick is checked on its own: the bar close it
+            # triggered may have opened positions or halted the session
+            halted_at = check_exits(prices, lo, lo + 1)
+            if halted_at is None and manager.is_halted:
+                halted_at = lo
+            if halted_at is None:
+                halted_at = check_exits(prices, lo + 1, hi)
+            if halted_at is not None:
+                last = halted_at
+                logger.info(f"Session halted: {manager.halt_reason}")
                 break
 
             # Progress indicator
-            if i > 0 and i % 50000 == 0:
-                pct = i / len(ticks) * 100
-                logger.info(f"  Progress: {pct:.0f}% ({i:,}/{len(ticks):,} ticks)")
+            if hi > next_progress:
+                pct = hi / n * 100
+                logger.info(f"  Progress: {pct:.0f}% ({hi:,}/{n:,} ticks)")
+                next_progress = (hi // progress_interval + 1) * progress_interval
 
-            # Small delay for speed simulation
-            if tick_delay > 0 and i % 1000 == 0:
-                await asyncio.sleep(tick_delay)
+            # Small delay for speed simulation (once per 1000 ticks processed)
+            if throttle:
+                steps = -(-hi // 1000) - -(-lo // 1000)
+                if steps:
+                    await asyncio.sleep(tick_delay * steps)
 
-        return await self._end_day(date, contract, len(ticks))
+        # Ticks inside the exit band were skipped, so mark open positions to
+        # the last tick processed, as per-tick update_prices would have
+        if manager.open_positions:
+            manager.update_prices(float(prices[last]))
+
+        return await self._end_day(date, contract, n)
 
     async def run_week(self, dates: List[str]) -> None:
         """Run backtest for multiple days."""
@@ -535,7 +654,7 @@ class TierBacktester:
         logger.info(f"TIER PROGRESSION BACKTEST")
         logger.info(f"Starting balance: ${self.starting_balance:,.2f}")
         logger.info(f"Days: {len(dates)}")
-        logger.info(f"Speed: {self.speed_multiplier}x")
+        logger.info(f"Speed: {f'{self.speed_multiplier}x' if self.speed_multiplier > 0 else 'unthrottled'}")
         logger.info(f"Discord: {'enabled' if self.notifier else 'disabled'}")
         logger.info(f"{'='*60}\n")
 
@@ -545,13 +664,27 @@ class TierBacktester:
         # For short runs (5 days or less), skip Friday checks and send one digest at end
         is_single_week = len(dates) <= 5
 
+        # Parsed once up front rather than on every iteration
+        weekdays = [datetime.strptime(d, "%Y-%m-%d").weekday() for d in dates]
+
+        # Tier change alerts are sent in the background as they are queued
+        notify_worker = asyncio.create_task(self._notify_worker()) if self.notifier else None
+
+        # Days depend on each other through the tier state, so they still run
+        # in order; what can run in parallel is parsing each day's tick cache
+        if self.parallel_days:
+            symbol = self.tier_manager.state.instrument
+            prepared = prepare_cached_sessions(
+                [(DatabentoAdapter.get_front_month_contract(symbol, date), date) for date in dates]
+            )
+            logger.info(f"Prepared {prepared} cached {symbol} sessions in parallel")
+
         for i, date in enumerate(dates):
             await self.run_day(date)
 
             # Only check for Friday in multi-week runs
             if not is_single_week:
-                date_obj = datetime.strptime(date, "%Y-%m-%d")
-                if date_obj.weekday() == 4:  # Friday
+                if weekdays[i] == 4:  # Friday
                     if self.notifier:
                         await self._send_weekly_digest(dates[week_start_idx:i+1], self._week_start_balance)
                     week_start_idx = i + 1  # Next week starts after this
@@ -565,10 +698,13 @@ class TierBacktester:
                 await self._send_weekly_digest(dates, self._week_start_balance)
             elif week_start_idx < len(dates):
                 # Multi-week that didn't end on Friday
-                last_date = datetime.strptime(dates[-1], "%Y-%m-%d")
-                if last_date.weekday() != 4:
+                if weekdays[-1] != 4:
                     await self._send_weekly_digest(dates[week_start_idx:], self._week_start_balance)
 
+        if notify_worker:
+            await self._notify_q.join()
+            notify_worker.cancel()
+
         self._print_summary()
 
         # Close notifier
@@ -602,11 +738,13 @@ class TierBacktester:
             emoji = "+" if r["pnl"] >= 0 else ""
             daily_lines.append(f"{r['date']}: {emoji}${r['pnl']:,.0f} | {r['trades']}T | {r['instrument']}")
 
+        daily_block = "\n".join(daily_lines)
+
         # Build tier changes section
         tier_section = ""
         if week_tier_changes:
-            tier_lines = [f"  {tc['direction']}: {tc['from']} → {tc['to']}" for tc in week_tier_changes]
-            tier_section = f"\n**Tier Changes:**\n" + "\n".join(tier_lines)
+            tier_block = "\n".join(f"  {tc['direction']}: {tc['from']} → {tc['to']}" for tc in week_tier_changes)
+            tier_section = f"\n**Tier Changes:**\n{tier_block}"
 
         await self.notifier.send_alert(
             title=f"Weekly Summary: {week_dates[0]} to {week_dates[-1]}",
@@ -616,47 +754,51 @@ class TierBacktester:
                 f"**Trades:** {week_trades} ({week_win_rate:.0f}% WR)\n"
                 f"**Winning Days:** {winning_days}/{len(week_results)}\n"
                 f"**Current Tier:** {week_results[-1]['tier']}\n\n"
-                f"**Daily Breakdown:**\n" + "\n".join(daily_lines) +
-                tier_section
+                f"**Daily Breakdown:**\n{daily_block}{tier_section}"
             ),
             alert_type=AlertType.SUCCESS if week_pnl >= 0 else AlertType.WARNING,
         )
 
     def _print_summary(self) -> None:
         """Print final summary."""
-        print("\n" + "="*60)
-        print("WEEK SUMMARY")
-        print("="*60)
-
-        print(f"\nStarting: ${self.starting_balance:,.2f} on MES")
-        print(f"Ending:   ${self.tier_manager.state.balance:,.2f} on {self.tier_manager.state.instrument}")
-        print(f"Total P&L: ${self.tier_manager.state.balance - self.starting_balance:+,.2f}")
-
-        print("\n--- Daily Breakdown ---")
+        # Collected and written in one go
+        lines = [
+            "\n" + "="*60,
+            "WEEK SUMMARY",
+            "="*60,
+            f"\nStarting: ${self.starting_balance:,.2f} on MES",
+            f"Ending:   ${self.tier_manager.state.balance:,.2f} on {self.tier_manager.state.instrument}",
+            f"Total P&L: ${self.tier_manager.state.balance - self.starting_balance:+,.2f}",
+            "\n--- Daily Breakdown ---",
+        ]
         for r in self.daily_results:
             tier_flag = " *TIER CHANGE*" if r["tier_changed"] else ""
-            print(
+            lines.append(
                 f"{r['date']}: ${r['pnl']:+,.0f} | "
                 f"{r['trades']}T ({r['win_rate']:.0f}% WR) | "
                 f"${r['balance']:,.0f} | {r['instrument']}{tier_flag}"
             )
 
         if self.tier_changes:
-            print("\n--- Tier Changes ---")
+            lines.append("\n--- Tier Changes ---")
             for tc in self.tier_changes:
-                print(f"  {tc['direction']}: {tc['from']} -> {tc['to']} @ ${tc['balance']:,.2f}")
+                lines.append(f"  {tc['direction']}: {tc['from']} -> {tc['to']} @ ${tc['balance']:,.2f}")
 
-        print("\n--- Position Sizing Stats ---")
-        sizes = [t.get("size", 1) for t in self.all_trades]
-        if sizes:
-            print(f"  Total trades: {len(sizes)}")
-            print(f"  Avg size: {sum(sizes)/len(sizes):.1f} contracts")
-            print(f"  Max size: {max(sizes)} contracts")
-            print(f"  1 contract: {sizes.count(1)} trades")
-            print(f"  2 contracts: {sizes.count(2)} trades")
-            print(f"  3 contracts: {sizes.count(3)} trades")
+        lines.append("\n--- Position Sizing Stats ---")
+        sizes = np.array(self.trade_sizes, dtype=np.int64)
+        if len(sizes):
+            counts = np.bincount(sizes, minlength=4)
+            lines += [
+                f"  Total trades: {len(sizes)}",
+                f"  Avg size: {sizes.mean():.1f} contracts",
+                f"  Max size: {sizes.max()} contracts",
+                f"  1 contract: {counts[1]} trades",
+                f"  2 contracts: {counts[2]} trades",
+                f"  3 contracts: {counts[3]} trades",
+            ]
 
-        print("="*60)
+        lines.append("="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def main():
@@ -673,7 +815,12 @@ async def main():
         "--speed",
         type=float,
         default=60.0,  # 1 min per hour
-        help="Speed multiplier (default: 60 = 1min per hour)",
+        help="Speed multiplier (default: 60 = 1min per hour, <= 0 = unthrottled)",
+    )
+    parser.add_argument(
+        "--no-throttle",
+        action="store_true",
+        help="Run as fast as possible (same as --speed 0)",
     )
     parser.add_argument(
         "--balance",
@@ -686,6 +833,16 @@ async def main():
         action="store_true",
         help="Send notifications to Discord",
     )
+    parser.add_argument(
+        "--parallel-days",
+        action="store_true",
+        help="Prepare every day's cached ticks in parallel before running",
+    )
+    parser.add_argument(
+        "--no-jit",
+        action="store_true",
+        help="Scan exit bands with the NumPy kernel instead of numba",
+    )
     args = parser.parse_args()
 
     # Determine dates
@@ -695,12 +852,11 @@ async def main():
         # Get 5 trading days starting from week start
         from src.data.backtest_db import get_connection
         conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        cursor = conn.execute(
             "SELECT DISTINCT date FROM backtests WHERE date >= ? ORDER BY date LIMIT 5",
             (args.week,)
         )
-        dates = [row[0] for row in cursor.fetchall()]
+        dates = [row[0] for row in cursor]
         conn.close()
     else:
         # Default: Oct 22-28, 2025
@@ -712,8 +868,10 @@ async def main():
 
     backtester = TierBacktester(
         starting_balance=args.balance,
-        speed_multiplier=args.speed,
+        speed_multiplier=0.0 if args.no_throttle else args.speed,
         send_discord=args.discord,
+        parallel_days=args.parallel_days,
+        use_jit=not args.no_jit,
     )
 
     await backtester.run_week(dates)
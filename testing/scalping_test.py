@@ -12,13 +12,18 @@ Win rate needs to be >33% to break even (before slippage/commissions).
 Usage:
     PYTHONPATH=. python scripts/scalping_test.py
     PYTHONPATH=. python scripts/scalping_test.py --days 10
+
+The numba kernels are compiled on first use and cached; run
+``python -m src.execution.kernels`` once to build the cache ahead of time.
 """
 
 import argparse
+import hashlib
 import json
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -26,13 +31,40 @@ from dataclasses import dataclass, field
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.core.types import Tick, Signal, FootprintBar
+import numpy as np
+
+from src.core.types import Signal, FootprintBar
 from src.analysis.engine import OrderFlowEngine
 from src.regime.router import StrategyRouter
+from src.core.jit import HAS_NUMBA
+from src.execution.kernels import (
+    EXIT_END, EXIT_STOP, EXIT_TARGET, compiled_on_import, simulate_brackets, simulate_brackets_np,
+)
+from src.data.tick_cache import (
+    TickArrays, datetime_to_ns, map_tick_arrays, ns_to_datetime, prefetch_sessions,
+)
 
 # Cache directory for tick data
 CACHE_DIR = Path(__file__).parent.parent / "data" / "tick_cache"
 
+# Per-day approved signal streams (see signals_cache_path)
+DERIVED_DIR = CACHE_DIR / "derived"
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+ENGINE_CONFIG = {"symbol": "ES", "timeframe": 300}
+ROUTER_CONFIG = {}
+
+# Router thresholds applied after the signal cache (see simulate_trades),
+# so changing them doesn't invalidate it
+THRESHOLD_KEYS = ("min_signal_strength", "min_regime_confidence")
+
+# Bump when the cached signal columns change
+SIGNAL_CACHE_VERSION = 2
+
+# Everything whose source can change which signals are generated/approved
+SIGNAL_SOURCES = ["src/core", "src/analysis", "src/regime", "src/data/aggregator.py"]
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)-8s | %(message)s",
@@ -40,8 +72,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger("scalping_test")
 
+# simulate_brackets exit reason codes
+EXIT_REASONS = {EXIT_STOP: "STOP_LOSS", EXIT_TARGET: "TAKE_PROFIT", EXIT_END: "END_OF_DAY"}
 
-@dataclass
+
+@dataclass(slots=True)
 class ScalpTrade:
     """A single scalp trade."""
     entry_time: datetime
@@ -65,6 +100,10 @@ class ScalpingBacktester:
     stop_loss_ticks: int = 2    # 0.5 points
     entry_slippage_ticks: int = 1  # 1 tick slippage on entry
 
+    # Router thresholds; None = the router's own
+    min_signal_strength: Optional[float] = None
+    min_regime_confidence: Optional[float] = None
+
     # ES tick value
     tick_size: float = 0.25
     tick_value: float = 12.50  # $12.50 per tick for ES
@@ -78,14 +117,27 @@ class ScalpingBacktester:
     engine: Optional[OrderFlowEngine] = None
     router: Optional[StrategyRouter] = None
 
-    # Signal buffer for current bar
-    _current_bar_signals: List[Signal] = field(default_factory=list)
-    _last_price: float = 0.0
+    # Signals for the day that pass the regime rules: tick index, direction
+    # (+1/-1), time, strength and regime confidence at evaluation
+    _signal_idx: List[int] = field(default_factory=list)
+    _signal_dir: List[int] = field(default_factory=list)
+    _signal_time: List[datetime] = field(default_factory=list)
+    _signal_strength: List[float] = field(default_factory=list)
+    _signal_confidence: List[float] = field(default_factory=list)
+    _tick_index: int = 0
 
     def setup(self):
         """Initialize components."""
-        self.engine = OrderFlowEngine({"symbol": "ES", "timeframe": 300})
-        self.router = StrategyRouter({})
+        self.engine = OrderFlowEngine(dict(ENGINE_CONFIG))
+        self.router = StrategyRouter(dict(ROUTER_CONFIG))
+
+        # The router only applies the regime rules; the thresholds are
+        # applied in simulate_trades
+        if self.min_signal_strength is None:
+            self.min_signal_strength = self.router.min_signal_strength
+        if self.min_regime_confidence is None:
+            self.min_regime_confidence = self.router.min_regime_confidence
+        self.router.config.update(dict.fromkeys(THRESHOLD_KEYS, float("-inf")))
 
         self.engine.on_bar(self._on_bar)
         self.engine.on_signal(self._on_signal)
@@ -93,78 +145,120 @@ class ScalpingBacktester:
         self.completed_trades = []
         self.open_trade = None
         self.daily_pnl = 0.0
-        self._current_bar_signals = []
+        self._signal_idx = []
+        self._signal_dir = []
+        self._signal_time = []
+        self._signal_strength = []
+        self._signal_confidence = []
 
     def _on_bar(self, bar: FootprintBar):
         """Handle completed bar."""
-        self._current_bar_signals = []
         if self.router:
             self.router.on_bar(bar)
 
     def _on_signal(self, signal: Signal):
-        """Handle signal - enter trade if approved and no open position."""
+        """Record signals the regime allows; simulate_trades decides which open trades."""
         if not self.router:
             return
 
-        self._current_bar_signals.append(signal)
         signal = self.router.evaluate_signal(signal)
 
-        if signal.approved and not self.open_trade:
-            self._enter_trade(signal)
-
-    def _enter_trade(self, signal: Signal):
-        """Enter a scalp trade."""
-        direction = signal.direction
-        entry_price = self._last_price
-
-        # Apply slippage (worse fill)
-        if direction == "LONG":
-            entry_price += self.entry_slippage_ticks * self.tick_size
-            stop_price = entry_price - (self.stop_loss_ticks * self.tick_size)
-            target_price = entry_price + (self.take_profit_ticks * self.tick_size)
-        else:
-            entry_price -= self.entry_slippage_ticks * self.tick_size
-            stop_price = entry_price + (self.stop_loss_ticks * self.tick_size)
-            target_price = entry_price - (self.take_profit_ticks * self.tick_size)
-
-        self.open_trade = ScalpTrade(
-            entry_time=signal.timestamp,
-            entry_price=entry_price,
-            direction=direction,
-            stop_price=stop_price,
-            target_price=target_price,
+        if signal.approved:
+            self._signal_idx.append(self._tick_index)
+            self._signal_dir.append(1 if signal.direction == "LONG" else -1)
+            self._signal_time.append(signal.timestamp)
+            self._signal_strength.append(signal.strength)
+            self._signal_confidence.append(self.router.regime_confidence)
+
+    def run_day(self, arrays: TickArrays, use_jit: bool = True):
+        """Process a day of ticks and simulate the scalp trades."""
+        self.collect_signals(arrays)
+        self.simulate_trades(arrays, use_jit=use_jit)
+
+    def collect_signals(self, arrays: TickArrays):
+        """
+        Run the engine over a day and record the signals.
+
+        Signal approval doesn't depend on open trades, so the whole day is
+        run first, one bar segment at a time (only a segment's first tick
+        can close a bar and emit signals).
+        """
+        ts_ns = arrays.ts_ns
+        prices = arrays.price
+        n = len(ts_ns)
+
+        bar_ns = self.engine.timeframe * 1_000_000_000
+        bounds = (np.flatnonzero(np.diff(ts_ns // bar_ns)) + 1).tolist()
+
+        for lo, hi in zip([0, *bounds], [*bounds, n]):
+            self._tick_index = lo
+            self.engine.process_ticks(
+                ts_ns[lo:hi], prices[lo:hi], arrays.volume[lo:hi], arrays.side[lo:hi], arrays.symbol
+            )
+
+    def save_signals(self, path: Path):
+        """Write the recorded signals to an .npz file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp_path,
+            idx=np.array(self._signal_idx, dtype=np.int64),
+            dir=np.array(self._signal_dir, dtype=np.int8),
+            time_ns=np.array([datetime_to_ns(t) for t in self._signal_time], dtype=np.int64),
+            strength=np.array(self._signal_strength, dtype=np.float64),
+            confidence=np.array(self._signal_confidence, dtype=np.float64),
         )
-
-    def _check_exit(self, tick: Tick):
-        """Check if open trade should exit."""
-        if not self.open_trade:
+        os.replace(tmp_path, path)
+
+    def load_signals(self, path: Path):
+        """Load signals written by save_signals in place of collect_signals."""
+        with np.load(path) as data:
+            self._signal_idx = data["idx"].tolist()
+            self._signal_dir = data["dir"].tolist()
+            self._signal_time = [ns_to_datetime(t) for t in data["time_ns"].tolist()]
+            self._signal_strength = data["strength"].tolist()
+            self._signal_confidence = data["confidence"].tolist()
+
+    def simulate_trades(self, arrays: TickArrays, use_jit: bool = True):
+        """
+        Simulate the scalp trades for the recorded signals.
+
+        Signals below the strength or regime confidence thresholds are
+        dropped, then the one-trade-at-a-time entries and the stop/target
+        exits are simulated over the price array by simulate_brackets.
+        """
+        ts_ns = arrays.ts_ns
+        prices = arrays.price
+
+        approved = np.flatnonzero(
+            (np.array(self._signal_strength, dtype=np.float64) >= self.min_signal_strength)
+            & (np.array(self._signal_confidence, dtype=np.float64) >= self.min_regime_confidence)
+        )
+        if not len(approved):
             return
 
-        trade = self.open_trade
-        price = tick.price
-
-        exit_price = None
-        exit_reason = None
+        simulate = simulate_brackets if use_jit and HAS_NUMBA else simulate_brackets_np
+        ints, floats = simulate(
+            prices,
+            np.array(self._signal_idx, dtype=np.int64)[approved],
+            np.array(self._signal_dir, dtype=np.int8)[approved],
+            self.entry_slippage_ticks * self.tick_size,
+            self.stop_loss_ticks * self.tick_size,
+            self.take_profit_ticks * self.tick_size,
+        )
 
-        if trade.direction == "LONG":
-            # Check stop first (worse case)
-            if price <= trade.stop_price:
-                exit_price = trade.stop_price
-                exit_reason = "STOP_LOSS"
-            # Then check target
-            elif price >= trade.target_price:
-                exit_price = trade.target_price
-                exit_reason = "TAKE_PROFIT"
-        else:  # SHORT
-            if price >= trade.stop_price:
-                exit_price = trade.stop_price
-                exit_reason = "STOP_LOSS"
-            elif price <= trade.target_price:
-                exit_price = trade.target_price
-                exit_reason = "TAKE_PROFIT"
-
-        if exit_price:
-            self._close_trade(tick.timestamp, exit_price, exit_reason)
+        # Trade objects are only built here, outside the kernel
+        approved = approved.tolist()
+        for (j, exit_idx, reason), (entry, stop, target, exit_price) in zip(ints.tolist(), floats.tolist()):
+            j = approved[j]
+            self.open_trade = ScalpTrade(
+                entry_time=self._signal_time[j],
+                entry_price=entry,
+                direction="LONG" if self._signal_dir[j] > 0 else "SHORT",
+                stop_price=stop,
+                target_price=target,
+            )
+            self._close_trade(ns_to_datetime(ts_ns[exit_idx]), exit_price, EXIT_REASONS[reason])
 
     def _close_trade(self, exit_time: datetime, exit_price: float, exit_reason: str):
         """Close the open trade."""
@@ -185,56 +279,137 @@ class ScalpingBacktester:
         self.completed_trades.append(trade)
         self.open_trade = None
 
-    def process_tick(self, tick: Tick):
-        """Process a single tick."""
-        self._last_price = tick.price
-
-        # Check exits first
-        self._check_exit(tick)
-
-        # Then process for new signals
-        self.engine.process_tick(tick)
-
     def close_open_position(self, price: float, time: datetime):
         """Force close any open position at end of day."""
         if self.open_trade:
             self._close_trade(time, price, "END_OF_DAY")
 
 
-def load_cached_ticks(contract: str, date: str) -> Optional[List[Tick]]:
-    """Load ticks from cache."""
-    cache_path = CACHE_DIR / f"{contract}_{date}_0930_1600.json"
-
-    if not cache_path.exists():
-        return None
-
-    with open(cache_path) as f:
-        data = json.load(f)
-
-    ticks = []
-    for d in data:
-        ticks.append(Tick(
-            timestamp=datetime.fromisoformat(d["timestamp"]),
-            price=d["price"],
-            volume=d["volume"],
-            side=d["side"],
-            symbol=d["symbol"]
-        ))
-    return ticks
+def tick_cache_path(contract: str, date: str) -> Path:
+    """Path of a day's cached ticks."""
+    return CACHE_DIR / f"{contract}_{date}_0930_1600.json"
+
+
+def load_cached_ticks(contract: str, date: str) -> Optional[TickArrays]:
+    """
+    Load a day of ticks from cache as arrays.
+
+    The day is memory-mapped from its .bin copy (written from the JSON on
+    first use), so timestamps are read as int64 nanoseconds with no JSON or
+    ISO-8601 parsing.
+    """
+    return map_tick_arrays(str(tick_cache_path(contract, date)))
+
+
+def signal_source_digest() -> str:
+    """Hash of the source files that generate and approve signals."""
+    digest = hashlib.blake2b(digest_size=16)
+    for source in SIGNAL_SOURCES:
+        path = PROJECT_ROOT / source
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path] if path.exists() else []
+        for file in files:
+            digest.update(str(file.relative_to(PROJECT_ROOT)).encode())
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def signals_cache_path(contract: str, date: str, source_key: str) -> Path:
+    """
+    Path of a day's cached signal stream.
+
+    Keyed by the tick file (size and mtime), the engine config, the router
+    config less its thresholds and the signal source digest. TP/SL/slippage
+    and the router thresholds are applied after the cache, so a sweep over
+    any of them reuses the same stream.
+    """
+    tick_stat = tick_cache_path(contract, date).stat()
+    router_config = {k: v for k, v in ROUTER_CONFIG.items() if k not in THRESHOLD_KEYS}
+    key = json.dumps(
+        [
+            SIGNAL_CACHE_VERSION, tick_stat.st_size, tick_stat.st_mtime_ns,
+            ENGINE_CONFIG, router_config, source_key,
+        ],
+        sort_keys=True,
+    )
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    return DERIVED_DIR / f"{contract}_{date}_{digest}.npz"
 
 
 def get_available_dates(contract: str = "ESH5") -> List[str]:
     """Get list of available dates from cache."""
-    dates = []
-    for f in CACHE_DIR.glob(f"{contract}_*_0930_1600.json"):
-        # Extract date from filename: ESH5_2025-01-13_0930_1600.json
-        parts = f.stem.split("_")
-        if len(parts) >= 2:
-            dates.append(parts[1])
+    if not CACHE_DIR.is_dir():
+        return []
+
+    # One directory scan; filenames look like ESH5_2025-01-13_0930_1600.json
+    prefix, suffix = f"{contract}_", "_0930_1600.json"
+    with os.scandir(CACHE_DIR) as entries:
+        dates = [
+            entry.name[len(prefix):-len(suffix)]
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+        ]
     return sorted(dates)
 
 
-def run_backtest(dates: List[str], contract: str = "ESH5"):
+def _run_one_day(job: tuple) -> Optional[tuple]:
+    """
+    Backtest one day (worker process).
+
+    Returns (daily result, completed trades, signal cache hit), or None if
+    the day isn't cached.
+    """
+    date, contract, source_key, use_jit = job
+    logger.info(f"Processing {date}...")
+
+    # Load ticks
+    arrays = load_cached_ticks(contract, date)
+    if arrays is None or not len(arrays.ts_ns):
+        logger.warning(f"No data for {date}, skipping")
+        return None
+
+    # Run day
+    bt = ScalpingBacktester()
+    bt.setup()
+
+    signals_path = signals_cache_path(contract, date, source_key)
+    cache_hit = signals_path.exists()
+    if cache_hit:
+        bt.load_signals(signals_path)
+    else:
+        bt.collect_signals(arrays)
+        bt.save_signals(signals_path)
+    bt.simulate_trades(arrays, use_jit=use_jit)
+
+    # Close any open position
+    bt.close_open_position(float(arrays.price[-1]), ns_to_datetime(arrays.ts_ns[-1]))
+
+    # Collect results
+    trades = len(bt.completed_trades)
+    wins = sum(1 for t in bt.completed_trades if t.pnl > 0)
+    losses = trades - wins
+    win_rate = (wins / trades * 100) if trades > 0 else 0
+
+    result = {
+        "date": date,
+        "pnl": bt.daily_pnl,
+        "trades": trades,
+        "wins": wins,
+        "losses": losses,
+        "win_rate": win_rate,
+    }
+
+    emoji = "+" if bt.daily_pnl >= 0 else ""
+    logger.info(f"  {date}: {emoji}${bt.daily_pnl:,.2f} | {trades}T ({wins}W/{losses}L) | {win_rate:.0f}% WR")
+
+    return result, bt.completed_trades, cache_hit
+
+
+def run_backtest(
+    dates: List[str],
+    contract: str = "ESH5",
+    use_jit: bool = True,
+    max_workers: Optional[int] = None,
+):
     """Run the scalping backtest."""
 
     print("\n" + "="*70)
@@ -249,121 +424,125 @@ def run_backtest(dates: List[str], contract: str = "ESH5"):
     print(f"Days: {len(dates)}")
     print("="*70 + "\n")
 
-    all_trades = []
-    daily_results = []
-
-    for date in dates:
-        logger.info(f"Processing {date}...")
-
-        # Load ticks
-        ticks = load_cached_ticks(contract, date)
-        if not ticks:
-            logger.warning(f"No data for {date}, skipping")
-            continue
-
-        # Run day
-        bt = ScalpingBacktester()
-        bt.setup()
+    # Queue every day's read up front so cold days don't load one at a time
+    prefetch_sessions(str(tick_cache_path(contract, date)) for date in dates)
 
-        for tick in ticks:
-            bt.process_tick(tick)
+    source_key = signal_source_digest()
+    jobs = [(date, contract, source_key, use_jit) for date in dates]
 
-        # Close any open position
-        if ticks:
-            bt.close_open_position(ticks[-1].price, ticks[-1].timestamp)
+    # Days are independent (fresh backtester each), so run them across
+    # processes; map keeps the results in date order
+    workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        day_runs = list(map(_run_one_day, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            day_runs = list(pool.map(_run_one_day, jobs))
 
-        # Collect results
-        trades = len(bt.completed_trades)
-        wins = sum(1 for t in bt.completed_trades if t.pnl > 0)
-        losses = trades - wins
-        win_rate = (wins / trades * 100) if trades > 0 else 0
-
-        daily_results.append({
-            "date": date,
-            "pnl": bt.daily_pnl,
-            "trades": trades,
-            "wins": wins,
-            "losses": losses,
-            "win_rate": win_rate,
-        })
-
-        all_trades.extend(bt.completed_trades)
-
-        emoji = "+" if bt.daily_pnl >= 0 else ""
-        logger.info(f"  {date}: {emoji}${bt.daily_pnl:,.2f} | {trades}T ({wins}W/{losses}L) | {win_rate:.0f}% WR")
+    all_trades = []
+    daily_results = []
+    cache_hits = 0
 
-    # Print summary
-    print("\n" + "="*70)
-    print("RESULTS SUMMARY")
-    print("="*70)
+    for day in day_runs:
+        if day is None:
+            continue
+        result, trades, cache_hit = day
+        daily_results.append(result)
+        all_trades.extend(trades)
+        cache_hits += cache_hit
+
+    n_days = len(daily_results)
+    if n_days:
+        logger.info(
+            f"Signal cache: {cache_hits} hits, {n_days - cache_hits} misses "
+            f"({cache_hits / n_days:.0%} hit rate)"
+        )
 
-    total_pnl = sum(r["pnl"] for r in daily_results)
-    total_trades = sum(r["trades"] for r in daily_results)
-    total_wins = sum(r["wins"] for r in daily_results)
+    # One pass over the days and one over the trades
+    total_pnl = 0
+    total_trades = total_wins = 0
+    winning_days = losing_days = flat_days = 0
+    for r in daily_results:
+        pnl = r["pnl"]
+        total_pnl += pnl
+        total_trades += r["trades"]
+        total_wins += r["wins"]
+        if pnl > 0:
+            winning_days += 1
+        elif pnl < 0:
+            losing_days += 1
+        else:
+            flat_days += 1
     total_losses = total_trades - total_wins
     overall_win_rate = (total_wins / total_trades * 100) if total_trades > 0 else 0
 
-    winning_days = sum(1 for r in daily_results if r["pnl"] > 0)
-    losing_days = sum(1 for r in daily_results if r["pnl"] < 0)
-    flat_days = sum(1 for r in daily_results if r["pnl"] == 0)
-
-    print(f"\nTotal P&L: ${total_pnl:+,.2f}")
-    print(f"Total Trades: {total_trades}")
-    print(f"Wins/Losses: {total_wins}W / {total_losses}L")
-    print(f"Overall Win Rate: {overall_win_rate:.1f}%")
-    print(f"\nWinning Days: {winning_days} ({winning_days/len(daily_results)*100:.0f}%)")
-    print(f"Losing Days: {losing_days} ({losing_days/len(daily_results)*100:.0f}%)")
-    print(f"Flat Days: {flat_days}")
+    reason_counts = dict.fromkeys(EXIT_REASONS.values(), 0)
+    reason_pnl = dict.fromkeys(EXIT_REASONS.values(), 0)
+    for t in all_trades:
+        reason_counts[t.exit_reason] += 1
+        reason_pnl[t.exit_reason] += t.pnl
+
+    # Build the summary and write it in one call
+    lines = [
+        "\n" + "="*70,
+        "RESULTS SUMMARY",
+        "="*70,
+        f"\nTotal P&L: ${total_pnl:+,.2f}",
+        f"Total Trades: {total_trades}",
+        f"Wins/Losses: {total_wins}W / {total_losses}L",
+        f"Overall Win Rate: {overall_win_rate:.1f}%",
+        f"\nWinning Days: {winning_days} ({winning_days/n_days*100:.0f}%)",
+        f"Losing Days: {losing_days} ({losing_days/n_days*100:.0f}%)",
+        f"Flat Days: {flat_days}",
+    ]
 
     if daily_results:
-        avg_daily_pnl = total_pnl / len(daily_results)
+        avg_daily_pnl = total_pnl / n_days
         best_day = max(daily_results, key=lambda x: x["pnl"])
         worst_day = min(daily_results, key=lambda x: x["pnl"])
 
-        print(f"\nAvg Daily P&L: ${avg_daily_pnl:+,.2f}")
-        print(f"Best Day: {best_day['date']} (${best_day['pnl']:+,.2f})")
-        print(f"Worst Day: {worst_day['date']} (${worst_day['pnl']:+,.2f})")
+        lines += [
+            f"\nAvg Daily P&L: ${avg_daily_pnl:+,.2f}",
+            f"Best Day: {best_day['date']} (${best_day['pnl']:+,.2f})",
+            f"Worst Day: {worst_day['date']} (${worst_day['pnl']:+,.2f})",
+        ]
 
     # Exit reason breakdown
-    print("\n--- Exit Reasons ---")
-    tp_count = sum(1 for t in all_trades if t.exit_reason == "TAKE_PROFIT")
-    sl_count = sum(1 for t in all_trades if t.exit_reason == "STOP_LOSS")
-    eod_count = sum(1 for t in all_trades if t.exit_reason == "END_OF_DAY")
-
-    print(f"Take Profit: {tp_count} ({tp_count/total_trades*100:.1f}%)" if total_trades else "")
-    print(f"Stop Loss: {sl_count} ({sl_count/total_trades*100:.1f}%)" if total_trades else "")
-    print(f"End of Day: {eod_count} ({eod_count/total_trades*100:.1f}%)" if total_trades else "")
+    lines.append("\n--- Exit Reasons ---")
+    for label, reason in (("Take Profit", "TAKE_PROFIT"), ("Stop Loss", "STOP_LOSS"), ("End of Day", "END_OF_DAY")):
+        count = reason_counts[reason]
+        lines.append(f"{label}: {count} ({count/total_trades*100:.1f}%)" if total_trades else "")
 
     # P&L breakdown by exit reason
     if all_trades:
-        tp_pnl = sum(t.pnl for t in all_trades if t.exit_reason == "TAKE_PROFIT")
-        sl_pnl = sum(t.pnl for t in all_trades if t.exit_reason == "STOP_LOSS")
-        eod_pnl = sum(t.pnl for t in all_trades if t.exit_reason == "END_OF_DAY")
-
-        print(f"\nP&L by Exit Reason:")
-        print(f"  Take Profit: ${tp_pnl:+,.2f}")
-        print(f"  Stop Loss: ${sl_pnl:+,.2f}")
-        print(f"  End of Day: ${eod_pnl:+,.2f}")
+        lines += [
+            f"\nP&L by Exit Reason:",
+            f"  Take Profit: ${reason_pnl['TAKE_PROFIT']:+,.2f}",
+            f"  Stop Loss: ${reason_pnl['STOP_LOSS']:+,.2f}",
+            f"  End of Day: ${reason_pnl['END_OF_DAY']:+,.2f}",
+        ]
 
     # Compare to baseline (16 SL / 24 TP)
-    print("\n--- Comparison to Baseline (16 SL / 24 TP) ---")
-    print("Baseline Jan-Feb 2025: +$71,741 (208 trades, 77% winning days)")
-    print(f"Scalping 4TP/2SL:      ${total_pnl:+,.2f} ({total_trades} trades, {winning_days/len(daily_results)*100:.0f}% winning days)")
-
-    print("\n" + "="*70)
+    lines += [
+        "\n--- Comparison to Baseline (16 SL / 24 TP) ---",
+        "Baseline Jan-Feb 2025: +$71,741 (208 trades, 77% winning days)",
+        f"Scalping 4TP/2SL:      ${total_pnl:+,.2f} ({total_trades} trades, {winning_days/n_days*100:.0f}% winning days)",
+        "\n" + "="*70,
+    ]
 
     # Daily breakdown table
-    print("\n--- Daily Breakdown ---")
-    print(f"{'Date':<12} {'P&L':>10} {'Trades':>8} {'W/L':>8} {'WR%':>6}")
-    print("-" * 50)
+    lines += [
+        "\n--- Daily Breakdown ---",
+        f"{'Date':<12} {'P&L':>10} {'Trades':>8} {'W/L':>8} {'WR%':>6}",
+        "-" * 50,
+    ]
     for r in daily_results:
         pnl_str = f"${r['pnl']:+,.0f}"
         wl_str = f"{r['wins']}/{r['losses']}"
-        print(f"{r['date']:<12} {pnl_str:>10} {r['trades']:>8} {wl_str:>8} {r['win_rate']:>5.0f}%")
-
-    print("-" * 50)
-    print(f"{'TOTAL':<12} ${total_pnl:+,.0f}")
+        lines.append(f"{r['date']:<12} {pnl_str:>10} {r['trades']:>8} {wl_str:>8} {r['win_rate']:>5.0f}%")
+    lines += ["-" * 50, f"{'TOTAL':<12} ${total_pnl:+,.0f}"]
 
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     parser = argparse.ArgumentParser(description="Scalping Strategy Backtest")
@@ -378,6 +557,17 @@ def main():
         default="ESH5",
         help="Contract to test (default: ESH5)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Days to run in parallel (default: one per core, 1 = in-process)",
+    )
+    parser.add_argument(
+        "--no-jit",
+        action="store_true",
+        help="Simulate trades with the NumPy kernels instead of numba",
+    )
     args = parser.parse_args()
 
     # Get available dates
@@ -393,7 +583,14 @@ def main():
 
     print(f"Found {len(dates)} days of data for {args.contract}")
 
-    run_backtest(dates, args.contract)
+    compiled = compiled_on_import()
+    if compiled:
+        logger.info(
+            f"Compiled {compiled} kernel signature(s) on first use; later runs load them "
+            f"from cache (prebuild with: python -m src.execution.kernels)"
+        )
+
+    run_backtest(dates, args.contract, use_jit=not args.no_jit, max_workers=args.workers)
 
 
 if __name__ == "__main__":
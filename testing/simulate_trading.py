@@ -9,10 +9,11 @@ Usage:
     python scripts/simulate_trading.py
 """
 
-import asyncio
-import random
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
 
 from src.core.types import Tick
 from src.analysis.engine import OrderFlowEngine
@@ -20,6 +21,7 @@ from src.regime.router import StrategyRouter
 from src.execution.manager import ExecutionManager
 from src.execution.session import TradingSession
 from src.api.server import broadcast_signal
+from src.data.tick_cache import TickArrays
 
 logging.basicConfig(
     level=logging.INFO,
@@ -40,69 +42,131 @@ class MarketSimulator:
     - Volume imbalances (buy/sell aggression)
     """
 
-    def __init__(self, base_price: float = 5000.0, tick_size: float = 0.25):
+    def __init__(
+        self,
+        base_price: float = 5000.0,
+        tick_size: float = 0.25,
+        batch_size: int = 1024,
+        seed: Optional[int] = None,
+    ):
         self.price = base_price
         self.tick_size = tick_size
         self.tick_count = 0
-        self.trend_direction = random.choice([1, -1])
-        self.trend_duration = random.randint(50, 200)
+        self._rng = np.random.default_rng(seed)
+        self.trend_direction = int(self._rng.choice([1, -1]))
+        self.trend_duration = int(self._rng.integers(50, 201))
         self.trend_ticks = 0
         # Simulated time starts at market open
         self.sim_time = datetime.now().replace(hour=9, minute=30, second=0, microsecond=0)
 
+        # Ticks are generated batch_size at a time and handed out one by one
+        self.batch_size = batch_size
+        self._batch = []
+        self._batch_pos = 0
+
+    def _next_trend(self):
+        """Pick the next trend (direction and duration)."""
+        self.trend_direction = int(self._rng.choice([1, -1, 0]))  # 0 = ranging
+        self.trend_duration = int(self._rng.integers(30, 151))
+        self.trend_ticks = 0
+        logger.debug(f"Trend changed to {'UP' if self.trend_direction > 0 else 'DOWN' if self.trend_direction < 0 else 'RANGE'}")
+
+    def _generate(self, n: int) -> tuple:
+        """
+        Generate the next n ticks as (times, prices, volumes, sides) arrays.
+
+        Only the trend changes (one every 30-150 ticks) are drawn in a loop;
+        every per-tick draw is made for the whole batch at once.
+        """
+        rng = self._rng
+
+        # Trend of each tick; the tick that reaches the trend's duration
+        # already moves with the next trend
+        trend = np.empty(n, dtype=np.int64)
+        pos = 0
+        while pos < n:
+            run = max(1, self.trend_duration - self.trend_ticks)
+            if pos + run > n:
+                trend[pos:] = self.trend_direction
+                self.trend_ticks += n - pos
+                break
+            trend[pos:pos + run - 1] = self.trend_direction
+            self._next_trend()
+            trend[pos + run - 1] = self.trend_direction
+            pos += run
+
+        # Price movement: trending ticks lean 60/40 with the trend, ranging
+        # ticks are a coin flip. Usually 1 tick, sometimes 2-3
+        u_dir, u_mag, u_vol, u_side, u_large = rng.random((5, n))
+        direction = np.where(
+            trend != 0,
+            np.where(u_dir < 0.6, trend, -trend),
+            np.where(u_dir < 0.5, 1, -1),
+        )
+        magnitude = np.where(u_mag < 0.8, 1, rng.integers(2, 4, n))
+        prices = self.price + np.cumsum(direction * magnitude * self.tick_size)
+
+        # Volume - higher during trends, lower during ranges, with occasional
+        # large trades to create imbalances
+        base_volume = np.where(trend == 0, 10, 20)
+        volumes = 1 + (u_vol * (base_volume + rng.integers(0, 51, n))).astype(np.int64)
+        volumes = np.where(u_large < 0.1, rng.integers(50, 151, n), volumes)
+
+        # Aggressor side - 70% with the price direction
+        asks = (direction > 0) == (u_side < 0.7)
+
+        # Timestamps advance 50-200ms per tick (100ms+ average)
+        offsets = np.cumsum(rng.integers(50, 201, n)).astype("timedelta64[ms]")
+        times = np.datetime64(self.sim_time, "us") + offsets
+
+        self.price = float(prices[-1])
+        self.sim_time = times[-1].item()
+        return times, np.round(prices, 2), volumes, asks
+
+    def _refill_batch(self):
+        """Generate the next batch of ticks."""
+        times, prices, volumes, asks = self._generate(self.batch_size)
+        sides = np.where(asks, "ASK", "BID")
+        self._batch = list(zip(times.tolist(), prices.tolist(), volumes.tolist(), sides.tolist()))
+        self._batch_pos = 0
+
+    def generate_batch(self, n: int) -> TickArrays:
+        """
+        Generate the next n ticks as arrays.
+
+        Continues from the simulator's current price, time and trend. Ticks
+        already drawn for generate_tick but not yet handed out are skipped.
+        """
+        times, prices, volumes, asks = self._generate(n)
+        self._batch = []
+        self._batch_pos = 0
+        self.tick_count += n
+        return TickArrays(
+            ts_ns=times.astype("datetime64[ns]").view(np.int64),
+            price=prices,
+            volume=volumes,
+            side=asks.astype(np.int8),
+            symbol="MES",
+        )
+
     def generate_tick(self) -> Tick:
         """Generate a single tick."""
+        if self._batch_pos == len(self._batch):
+            self._refill_batch()
+        timestamp, price, volume, side = self._batch[self._batch_pos]
+        self._batch_pos += 1
         self.tick_count += 1
-        self.trend_ticks += 1
-
-        # Maybe change trend
-        if self.trend_ticks >= self.trend_duration:
-            self.trend_direction = random.choice([1, -1, 0])  # 0 = ranging
-            self.trend_duration = random.randint(30, 150)
-            self.trend_ticks = 0
-            logger.debug(f"Trend changed to {'UP' if self.trend_direction > 0 else 'DOWN' if self.trend_direction < 0 else 'RANGE'}")
-
-        # Price movement
-        if self.trend_direction != 0:
-            # Trending: bias in trend direction
-            prob_with_trend = 0.6
-            direction = self.trend_direction if random.random() < prob_with_trend else -self.trend_direction
-        else:
-            # Ranging: mean reversion
-            direction = random.choice([1, -1])
-
-        # Random magnitude (usually 1 tick, sometimes more)
-        magnitude = 1 if random.random() < 0.8 else random.randint(2, 3)
-        self.price += direction * magnitude * self.tick_size
-
-        # Volume - higher during trends, lower during ranges
-        base_volume = 10 if self.trend_direction == 0 else 20
-        volume = random.randint(1, base_volume + random.randint(0, 50))
-
-        # Aggressor side - bias based on price direction
-        if direction > 0:
-            side = "ASK" if random.random() < 0.7 else "BID"
-        else:
-            side = "BID" if random.random() < 0.7 else "ASK"
-
-        # Create imbalances occasionally
-        if random.random() < 0.1:
-            volume = random.randint(50, 150)  # Large trade
-
-        # Generate timestamp that advances time (100ms per tick average)
-        # This simulates real market activity spread across time
-        self.sim_time += timedelta(milliseconds=random.randint(50, 200))
 
         return Tick(
-            timestamp=self.sim_time,
-            price=round(self.price, 2),
+            timestamp=timestamp,
+            price=price,
             volume=volume,
             side=side,
             symbol="MES"
         )
 
 
-async def run_simulation():
+def run_simulation():
     """Run the trading simulation."""
     logger.info("Starting trading simulation")
 
@@ -193,17 +257,17 @@ async def run_simulation():
 
     # Run simulation
     logger.info("Generating synthetic tick data...")
-    tick_count = 0
     target_ticks = 5000  # Generate 5000 ticks
+    ticks = simulator.generate_batch(target_ticks)
 
-    while tick_count < target_ticks:
-        tick = simulator.generate_tick()
-        engine.process_tick(tick)
-        tick_count += 1
-
-        # Small delay to not overwhelm
-        if tick_count % 100 == 0:
-            await asyncio.sleep(0.01)
+    # Feed the engine 500 ticks at a time, logging progress after each
+    tick_count = 0
+    for lo in range(0, target_ticks, 500):
+        tick_count = min(lo + 500, target_ticks)
+        engine.process_ticks(
+            ticks.ts_ns[lo:tick_count], ticks.price[lo:tick_count],
+            ticks.volume[lo:tick_count], ticks.side[lo:tick_count], ticks.symbol,
+        )
 
         # Log progress
         if tick_count % 500 == 0:
@@ -250,4 +314,4 @@ async def run_simulation():
 
 
 if __name__ == "__main__":
-    asyncio.run(run_simulation())
+    run_simulation()
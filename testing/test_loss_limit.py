@@ -8,6 +8,8 @@ Answers: "How many times would I fail before I succeed?"
 import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -15,6 +17,9 @@ from scripts.run_databento_backtest import run_backtest
 
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "../data/tick_cache")
 
+# Cache filenames: {contract}_{date}_{start HHMM}_{end HHMM}.json
+SESSION_RE = re.compile(r'(\w+)_(\d{4}-\d{2}-\d{2})_(\d{4})_(\d{4})\.json')
+
 
 def get_cached_sessions():
     """Get all cached sessions from tick_cache directory."""
@@ -22,7 +27,7 @@ def get_cached_sessions():
     for filename in os.listdir(CACHE_DIR):
         if not filename.endswith('.json'):
             continue
-        match = re.match(r'(\w+)_(\d{4}-\d{2}-\d{2})_(\d{4})_(\d{4})\.json', filename)
+        match = SESSION_RE.match(filename)
         if match:
             contract, date, start, end = match.groups()
             sessions.append({
@@ -35,6 +40,19 @@ def get_cached_sessions():
     return sessions
 
 
+def run_session(session, daily_loss_limit):
+    """Backtest one cached session with conservative fills (worker process)."""
+    return run_backtest(
+        contract=session['contract'],
+        date=session['date'],
+        start_time=session['start_time'],
+        end_time=session['end_time'],
+        budget_remaining=999999,
+        conservative_fills=True,
+        daily_loss_limit=daily_loss_limit
+    )
+
+
 def analyze_streaks(results):
     """Analyze winning and losing streaks."""
     streaks = []
@@ -84,18 +102,17 @@ def main():
     min_balance = running_balance
     max_balance = running_balance
 
-    for i, session in enumerate(sessions):
-        result = run_backtest(
-            contract=session['contract'],
-            date=session['date'],
-            start_time=session['start_time'],
-            end_time=session['end_time'],
-            budget_remaining=999999,
-            conservative_fills=True,
-            daily_loss_limit=daily_loss_limit
-        )
-
-        if result:
+    # Sessions are independent, so run them across all cores; map yields
+    # them in date order for the running balance
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        session_results = ex.map(partial(run_session, daily_loss_limit=daily_loss_limit), sessions)
+
+        # Status lines are written ten sessions at a time
+        status_lines = []
+        for i, (session, result) in enumerate(zip(sessions, session_results)):
+            if not result:
+                continue
+
             pnl = result.get('pnl', 0)
             trades = result.get('trades', 0)
             wins = result.get('wins', 0)
@@ -120,17 +137,38 @@ def main():
             hit_limit = pnl <= daily_loss_limit + 50  # Within $50 of limit
             limit_marker = " [HIT LIMIT]" if hit_limit else ""
 
-            print(f"[{i+1:3d}] {session['date']} | {status} | {trades:2d} trades | "
-                  f"W:{wins:2d} L:{losses:2d} | ${pnl:+8.0f} | "
-                  f"Balance: ${running_balance:,.0f}{limit_marker}")
+            status_lines.append(
+                f"[{i+1:3d}] {session['date']} | {status} | {trades:2d} trades | "
+                f"W:{wins:2d} L:{losses:2d} | ${pnl:+8.0f} | "
+                f"Balance: ${running_balance:,.0f}{limit_marker}"
+            )
+            if len(status_lines) == 10:
+                sys.stdout.write("\n".join(status_lines) + "\n")
+                status_lines.clear()
+
+        if status_lines:
+            sys.stdout.write("\n".join(status_lines) + "\n")
 
     # Analyze streaks
     streaks = analyze_streaks(results)
 
-    # Calculate stats
-    winning_days = sum(1 for r in results if r.get('pnl', 0) > 0)
-    losing_days = sum(1 for r in results if r.get('pnl', 0) < 0)
-    flat_days = sum(1 for r in results if r.get('pnl', 0) == 0)
+    # Calculate stats (one pass over the days)
+    n_days = len(results)
+    winning_days = losing_days = flat_days = limit_hit_days = 0
+    win_pnl = loss_pnl = 0
+    for r in results:
+        pnl = r.get('pnl', 0)
+        if pnl > 0:
+            winning_days += 1
+            win_pnl += pnl
+        elif pnl < 0:
+            losing_days += 1
+            loss_pnl += pnl
+        else:
+            flat_days += 1
+        # Days that hit the $300 loss limit
+        if pnl <= daily_loss_limit + 50:
+            limit_hit_days += 1
 
     losing_streaks = [s[1] for s in streaks if s[0] == 'loss']
     winning_streaks = [s[1] for s in streaks if s[0] == 'win']
@@ -140,73 +178,93 @@ def main():
     avg_losing_streak = sum(losing_streaks) / len(losing_streaks) if losing_streaks else 0
     avg_winning_streak = sum(winning_streaks) / len(winning_streaks) if winning_streaks else 0
 
-    # Days that hit the $300 loss limit
-    limit_hit_days = sum(1 for r in results if r.get('pnl', 0) <= daily_loss_limit + 50)
-
-    print("\n" + "=" * 70)
-    print("RESULTS SUMMARY")
-    print("=" * 70)
-
-    print(f"\n--- Performance ---")
-    print(f"Days tested:      {len(results)}")
-    print(f"Total P&L:        ${total_pnl:,.0f}")
-    print(f"Avg daily P&L:    ${total_pnl/len(results):,.0f}")
-    print(f"Starting balance: $10,000")
-    print(f"Final balance:    ${running_balance:,.0f}")
-    print(f"Peak balance:     ${max_balance:,.0f}")
-    print(f"Low balance:      ${min_balance:,.0f}")
-    print(f"Max drawdown:     ${max_balance - min_balance:,.0f}")
-
-    print(f"\n--- Win/Loss Days ---")
-    print(f"Winning days:     {winning_days} ({100*winning_days/len(results):.1f}%)")
-    print(f"Losing days:      {losing_days} ({100*losing_days/len(results):.1f}%)")
-    print(f"Flat days:        {flat_days}")
-    print(f"Hit loss limit:   {limit_hit_days} days")
-
-    print(f"\n--- Streak Analysis ---")
-    print(f"Max losing streak:  {max_losing_streak} days")
-    print(f"Avg losing streak:  {avg_losing_streak:.1f} days")
-    print(f"Max winning streak: {max_winning_streak} days")
-    print(f"Avg winning streak: {avg_winning_streak:.1f} days")
+    # Build the summary and write it in one call
+    lines = [
+        "\n" + "=" * 70,
+        "RESULTS SUMMARY",
+        "=" * 70,
+    ]
+
+    lines += [
+        f"\n--- Performance ---",
+        f"Days tested:      {n_days}",
+        f"Total P&L:        ${total_pnl:,.0f}",
+        f"Avg daily P&L:    ${total_pnl/n_days:,.0f}",
+        f"Starting balance: $10,000",
+        f"Final balance:    ${running_balance:,.0f}",
+        f"Peak balance:     ${max_balance:,.0f}",
+        f"Low balance:      ${min_balance:,.0f}",
+        f"Max drawdown:     ${max_balance - min_balance:,.0f}",
+    ]
+
+    lines += [
+        f"\n--- Win/Loss Days ---",
+        f"Winning days:     {winning_days} ({100*winning_days/n_days:.1f}%)",
+        f"Losing days:      {losing_days} ({100*losing_days/n_days:.1f}%)",
+        f"Flat days:        {flat_days}",
+        f"Hit loss limit:   {limit_hit_days} days",
+    ]
+
+    lines += [
+        f"\n--- Streak Analysis ---",
+        f"Max losing streak:  {max_losing_streak} days",
+        f"Avg losing streak:  {avg_losing_streak:.1f} days",
+        f"Max winning streak: {max_winning_streak} days",
+        f"Avg winning streak: {avg_winning_streak:.1f} days",
+    ]
 
     # Show all losing streaks
-    print(f"\n--- All Losing Streaks ---")
+    lines.append(f"\n--- All Losing Streaks ---")
     loss_streak_counts = {}
     for streak in losing_streaks:
         loss_streak_counts[streak] = loss_streak_counts.get(streak, 0) + 1
     for length in sorted(loss_streak_counts.keys()):
         count = loss_streak_counts[length]
-        print(f"  {length}-day losing streak: {count} time(s)")
+        lines.append(f"  {length}-day losing streak: {count} time(s)")
 
     # Recovery analysis
-    print(f"\n--- Recovery Analysis ---")
-    print(f"If you lose $300, how many winning days to recover?")
-    avg_win = sum(r.get('pnl', 0) for r in results if r.get('pnl', 0) > 0) / winning_days if winning_days > 0 else 0
-    avg_loss = sum(r.get('pnl', 0) for r in results if r.get('pnl', 0) < 0) / losing_days if losing_days > 0 else 0
-    print(f"  Avg winning day: ${avg_win:,.0f}")
-    print(f"  Avg losing day:  ${avg_loss:,.0f}")
-    print(f"  Days to recover $300 loss: {abs(300/avg_win):.1f} winning days" if avg_win > 0 else "  N/A")
+    lines += [
+        f"\n--- Recovery Analysis ---",
+        f"If you lose $300, how many winning days to recover?",
+    ]
+    avg_win = win_pnl / winning_days if winning_days > 0 else 0
+    avg_loss = loss_pnl / losing_days if losing_days > 0 else 0
+    lines += [
+        f"  Avg winning day: ${avg_win:,.0f}",
+        f"  Avg losing day:  ${avg_loss:,.0f}",
+        f"  Days to recover $300 loss: {abs(300/avg_win):.1f} winning days" if avg_win > 0 else "  N/A",
+    ]
 
     # Expectancy
     win_rate = winning_days / (winning_days + losing_days) if (winning_days + losing_days) > 0 else 0
     expectancy = (win_rate * avg_win) + ((1 - win_rate) * avg_loss)
-    print(f"\n--- Expectancy ---")
-    print(f"  Win rate: {100*win_rate:.1f}%")
-    print(f"  Expectancy per day: ${expectancy:,.0f}")
-
-    print("\n" + "=" * 70)
-    print("KEY TAKEAWAY")
-    print("=" * 70)
+    lines += [
+        f"\n--- Expectancy ---",
+        f"  Win rate: {100*win_rate:.1f}%",
+        f"  Expectancy per day: ${expectancy:,.0f}",
+    ]
+
+    lines += [
+        "\n" + "=" * 70,
+        "KEY TAKEAWAY",
+        "=" * 70,
+    ]
     if max_losing_streak <= 2:
-        print(f"\nWith a ${abs(daily_loss_limit):.0f} daily loss limit:")
-        print(f"  - Max consecutive losing days: {max_losing_streak}")
-        print(f"  - You'd need ${max_losing_streak * abs(daily_loss_limit):,.0f} to survive worst streak")
-        print(f"  - Typical recovery: {abs(daily_loss_limit)/avg_win:.1f} winning days")
+        lines += [
+            f"\nWith a ${abs(daily_loss_limit):.0f} daily loss limit:",
+            f"  - Max consecutive losing days: {max_losing_streak}",
+            f"  - You'd need ${max_losing_streak * abs(daily_loss_limit):,.0f} to survive worst streak",
+            f"  - Typical recovery: {abs(daily_loss_limit)/avg_win:.1f} winning days",
+        ]
     else:
-        print(f"\nWith a ${abs(daily_loss_limit):.0f} daily loss limit:")
-        print(f"  - Max consecutive losing days: {max_losing_streak}")
-        print(f"  - Worst case drawdown: ${max_losing_streak * abs(daily_loss_limit):,.0f}")
-        print(f"  - But you recover because win rate is {100*win_rate:.0f}%")
+        lines += [
+            f"\nWith a ${abs(daily_loss_limit):.0f} daily loss limit:",
+            f"  - Max consecutive losing days: {max_losing_streak}",
+            f"  - Worst case drawdown: ${max_losing_streak * abs(daily_loss_limit):,.0f}",
+            f"  - But you recover because win rate is {100*win_rate:.0f}%",
+        ]
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -5,185 +5,236 @@ Test Rithmic API connection and account balance query.
 Run with credentials in .env:
     PYTHONPATH=. python testing/test_rithmic_balance.py
 
+Which direct client queries succeed is cached for a week per async_rithmic
+version, system, user and account (returned values are never stored);
+pass --refresh to run the probes again.
+
 Expected .env variables:
     RITHMIC_USER=your_username
     RITHMIC_PASSWORD=your_password
     RITHMIC_ACCOUNT_ID=your_account_id (optional)
 """
 
+import argparse
 import asyncio
+import hashlib
+import inspect
+import json
 import os
 import sys
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, Optional
 
-# Load environment
 from dotenv import load_dotenv
-load_dotenv()
-
 
-async def test_with_adapter():
+# Cached results of the direct-client probes
+CAPS_CACHE_DIR = Path.home() / ".cache" / "tradebot"
+CAPS_MAX_AGE = 7 * 24 * 3600  # Seconds
+
+
+@dataclass(slots=True)
+class RithmicEnv:
+    """Rithmic connection settings read from the environment."""
+    user: Optional[str]
+    password: Optional[str]
+    account_id: Optional[str]
+    server: str
+    system_name: str
+
+    @classmethod
+    def load(cls) -> "RithmicEnv":
+        """Read the settings, loading .env only if they aren't exported."""
+        if os.getenv("RITHMIC_USER") is None:
+            load_dotenv()
+        return cls(
+            user=os.getenv("RITHMIC_USER"),
+            password=os.getenv("RITHMIC_PASSWORD"),
+            account_id=os.getenv("RITHMIC_ACCOUNT_ID"),
+            server=os.getenv("RITHMIC_SERVER", "rituz00100.rithmic.com:443"),
+            system_name=os.getenv("RITHMIC_SYSTEM_NAME", "Rithmic Paper Trading"),
+        )
+
+
+async def test_with_adapter(adapter, env: RithmicEnv):
     """Test balance query using our RithmicAdapter wrapper."""
     print("\n" + "=" * 60)
     print("Testing via RithmicAdapter")
     print("=" * 60)
 
-    from src.data.adapters.rithmic import RithmicAdapter
-
-    user = os.getenv("RITHMIC_USER")
-    password = os.getenv("RITHMIC_PASSWORD")
-    account_id = os.getenv("RITHMIC_ACCOUNT_ID")
-
-    if not user or not password:
-        print("ERROR: RITHMIC_USER and RITHMIC_PASSWORD required in .env")
-        return None
-
-    print(f"User: {user}")
-    print(f"Account ID: {account_id or '(will auto-detect)'}")
-
-    adapter = RithmicAdapter(
-        user=user,
-        password=password,
-        system_name="Rithmic Paper Trading",  # or "Rithmic Test"
-        account_id=account_id,
-    )
-
-    print("\nConnecting to Rithmic...")
-    connected = await adapter.connect()
-
-    if not connected:
-        print("ERROR: Failed to connect to Rithmic")
-        return None
-
-    print("Connected successfully!")
-
     # Query balance
     print("\nQuerying account balance...")
-    balance = await adapter.get_account_balance(account_id)
+    balance = await adapter.get_account_balance(env.account_id)
 
     if balance is not None:
         print(f"\n✓ Account Balance: ${balance:,.2f}")
     else:
         print("\n✗ Could not retrieve balance (method may not be supported)")
 
-    # Clean up
-    await adapter.disconnect()
-
     return balance
 
 
-async def test_direct_client():
-    """Test directly with async_rithmic to discover available methods."""
-    print("\n" + "=" * 60)
-    print("Testing direct async_rithmic client")
-    print("=" * 60)
+def capability_manifest_path(env: RithmicEnv) -> Path:
+    """Path of the cached probe outcomes for this SDK version, system and login."""
+    try:
+        from importlib.metadata import version
+        sdk_version = version("async_rithmic")
+    except Exception:
+        sdk_version = "unknown"
+    identity = f"{sdk_version}|{env.system_name}|{env.user}|{env.account_id}"
+    key = hashlib.sha1(identity.encode()).hexdigest()[:16]
+    return CAPS_CACHE_DIR / f"rithmic_caps_{key}.json"
+
 
+def load_capability_manifest(path: Path) -> Optional[dict]:
+    """Load a cached capability manifest, or None if missing or stale."""
     try:
-        from async_rithmic import RithmicClient
-    except ImportError:
-        print("ERROR: async_rithmic not installed")
-        print("Install with: pip install async-rithmic")
+        if time.time() - path.stat().st_mtime > CAPS_MAX_AGE:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
         return None
 
-    user = os.getenv("RITHMIC_USER")
-    password = os.getenv("RITHMIC_PASSWORD")
-    account_id = os.getenv("RITHMIC_ACCOUNT_ID")
-    server = os.getenv("RITHMIC_SERVER", "rituz00100.rithmic.com:443")
-    system_name = os.getenv("RITHMIC_SYSTEM_NAME", "Rithmic Paper Trading")
 
-    if not user or not password:
-        print("ERROR: RITHMIC_USER and RITHMIC_PASSWORD required in .env")
-        return None
+def save_capability_manifest(path: Path, manifest: dict) -> None:
+    """Write a capability manifest, replacing any previous one atomically."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Probe again next run
+
+
+async def probe_client(client, methods, account_id) -> Dict[str, str]:
+    """
+    Try the account/balance methods the client exposes.
+
+    Returns each probed method's outcome, "supported" or "raised <error
+    type>". Returned values are only printed, never kept.
+    """
+    outcomes = {}
+
+    # Try get_account_list
+    if 'get_account_list' in methods:
+        print("\nTrying get_account_list()...")
+        try:
+            accounts = await client.get_account_list()
+            print(f"  Accounts: {accounts}")
+            outcomes['get_account_list'] = "supported"
+        except Exception as e:
+            outcomes['get_account_list'] = f"raised {type(e).__name__}"
+            print(f"  Error: {e}")
+
+    # Try get_account_balance
+    if 'get_account_balance' in methods:
+        print("\nTrying get_account_balance()...")
+        try:
+            balance = await client.get_account_balance(account_id)
+            print(f"  Balance: {balance}")
+            outcomes['get_account_balance'] = "supported"
+        except Exception as e:
+            outcomes['get_account_balance'] = f"raised {type(e).__name__}"
+            print(f"  Error: {e}")
+
+    # Try get_pnl_position_updates
+    if 'get_pnl_position_updates' in methods:
+        print("\nTrying get_pnl_position_updates()...")
+        try:
+            pnl = await client.get_pnl_position_updates()
+            print(f"  PnL data: {pnl}")
+            outcomes['get_pnl_position_updates'] = "supported"
+        except Exception as e:
+            outcomes['get_pnl_position_updates'] = f"raised {type(e).__name__}"
+            print(f"  Error: {e}")
+
+    # Try subscribe to account updates
+    if 'subscribe_to_account_updates' in methods:
+        print("\nTrying subscribe_to_account_updates()...")
+        # Wake on the first update instead of always sleeping the full
+        # window, when the client exposes an account update event
+        update_received = asyncio.Event()
+
+        async def on_account_update(data):
+            update_received.set()
+
+        has_event = hasattr(client, 'on_account_update')
+        if has_event:
+            client.on_account_update += on_account_update
+        try:
+            await client.subscribe_to_account_updates(account_id)
+            print("  Subscribed to account updates")
+            outcomes['subscribe_to_account_updates'] = "supported"
+            # Wait briefly for any updates
+            if has_event:
+                started = time.perf_counter()
+                try:
+                    await asyncio.wait_for(update_received.wait(), timeout=2.0)
+                    print(f"  First update after {(time.perf_counter() - started) * 1000:.0f} ms")
+                except asyncio.TimeoutError:
+                    print("  No update within 2 s")
+            else:
+                await asyncio.sleep(2)
+        except Exception as e:
+            print(f"  Error: {e}")
+            outcomes['subscribe_to_account_updates'] = f"raised {type(e).__name__}"
+        finally:
+            if has_event:
+                client.on_account_update -= on_account_update
 
-    print(f"User: {user}")
-    print(f"Server: {server}")
-    print(f"System: {system_name}")
-    print(f"Account ID: {account_id or '(will auto-detect)'}")
+    return outcomes
 
-    client = RithmicClient(
-        user=user,
-        password=password,
-        system_name=system_name,
-        app_name="BalanceTest",
-        app_version="1.0",
-        url=server,
-    )
 
-    print("\nConnecting...")
+async def test_direct_client(client, env: RithmicEnv, refresh=False):
+    """Test directly with async_rithmic to discover available methods."""
+    print("\n" + "=" * 60)
+    print("Testing direct async_rithmic client")
+    print("=" * 60)
 
     try:
-        await client.connect()
-        print("Connected!")
-
-        # Discover available methods
+        # Discover available methods once; the checks below test membership.
+        # getattr_static avoids running property getters on the client.
         print("\n--- Available client methods ---")
-        methods = [m for m in dir(client) if not m.startswith('_') and callable(getattr(client, m, None))]
+        methods = frozenset(
+            m for m in dir(client)
+            if not m.startswith('_') and callable(inspect.getattr_static(client, m, None))
+        )
         for m in sorted(methods):
             print(f"  {m}")
 
-        # Try common account/balance methods
-        print("\n--- Attempting balance queries ---")
-
-        # Try get_account_list
-        if hasattr(client, 'get_account_list'):
-            print("\nTrying get_account_list()...")
-            try:
-                accounts = await client.get_account_list()
-                print(f"  Accounts: {accounts}")
-            except Exception as e:
-                print(f"  Error: {e}")
-
-        # Try get_account_balance
-        if hasattr(client, 'get_account_balance'):
-            print("\nTrying get_account_balance()...")
-            try:
-                balance = await client.get_account_balance(account_id)
-                print(f"  Balance: {balance}")
-            except Exception as e:
-                print(f"  Error: {e}")
-
-        # Try get_pnl_position_updates
-        if hasattr(client, 'get_pnl_position_updates'):
-            print("\nTrying get_pnl_position_updates()...")
-            try:
-                pnl = await client.get_pnl_position_updates()
-                print(f"  PnL data: {pnl}")
-            except Exception as e:
-                print(f"  Error: {e}")
-
-        # Try subscribe to account updates
-        if hasattr(client, 'subscribe_to_account_updates'):
-            print("\nTrying subscribe_to_account_updates()...")
-            try:
-                await client.subscribe_to_account_updates(account_id)
-                print("  Subscribed to account updates")
-                # Wait briefly for any updates
-                await asyncio.sleep(2)
-            except Exception as e:
-                print(f"  Error: {e}")
+        # Which queries work rarely changes between runs of the same SDK
+        # version and login, so reuse the last outcomes unless --refresh is
+        # given. Only the outcomes are cached, never the returned values.
+        manifest_path = capability_manifest_path(env)
+        manifest = None if refresh else load_capability_manifest(manifest_path)
+        if manifest is not None and manifest.get("methods") == sorted(methods):
+            print("\n--- Balance queries (cached outcomes, --refresh to re-run) ---")
+            for name, outcome in manifest["outcomes"].items():
+                print(f"  {name}(): {outcome}")
+        else:
+            print("\n--- Attempting balance queries ---")
+            outcomes = await probe_client(client, methods, env.account_id)
+            save_capability_manifest(
+                manifest_path, {"methods": sorted(methods), "outcomes": outcomes}
+            )
 
     except Exception as e:
-        print(f"Connection error: {e}")
-        return None
-    finally:
-        try:
-            await client.disconnect()
-            print("\nDisconnected.")
-        except:
-            pass
+        print(f"Error: {e}")
 
     return None
 
 
-async def main():
+async def main(env: RithmicEnv, refresh: bool = False):
     print("=" * 60)
     print("Rithmic Balance Test")
     print("=" * 60)
 
     # Check for credentials
-    user = os.getenv("RITHMIC_USER")
-    password = os.getenv("RITHMIC_PASSWORD")
-
-    if not user or not password:
+    if not env.user or not env.password:
         print("\nERROR: Missing Rithmic credentials!")
         print("\nSet these in your .env file:")
         print("  RITHMIC_USER=your_username")
@@ -191,11 +242,45 @@ async def main():
         print("  RITHMIC_ACCOUNT_ID=your_account_id (optional)")
         sys.exit(1)
 
-    # Test direct client first to discover API
-    await test_direct_client()
+    try:
+        import async_rithmic  # noqa: F401
+    except ImportError:
+        print("ERROR: async_rithmic not installed")
+        print("Install with: pip install async-rithmic")
+        sys.exit(1)
+
+    from src.data.adapters.rithmic import RithmicAdapter
+
+    print(f"User: {env.user}")
+    print(f"Server: {env.server}")
+    print(f"System: {env.system_name}")
+    print(f"Account ID: {env.account_id or '(will auto-detect)'}")
+
+    # One session serves both phases: the adapter logs in once and the
+    # direct phase probes the same underlying RithmicClient
+    adapter = RithmicAdapter(
+        user=env.user,
+        password=env.password,
+        system_name=env.system_name,
+        app_name="BalanceTest",
+        server_url=env.server,
+        account_id=env.account_id,
+    )
+
+    print("\nConnecting to Rithmic...")
+    if not await adapter.connect():
+        print("ERROR: Failed to connect to Rithmic")
+        sys.exit(1)
+    print("Connected successfully!")
 
-    # Then test our adapter
-    balance = await test_with_adapter()
+    try:
+        # Run the phases one after the other: they share one connection,
+        # and the direct phase issues the same queries the adapter does
+        await test_direct_client(adapter.client, env, refresh)
+        balance = await test_with_adapter(adapter, env)
+    finally:
+        await adapter.disconnect()
+        print("\nDisconnected.")
 
     print("\n" + "=" * 60)
     print("Test Complete")
@@ -208,4 +293,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Test Rithmic connection and balance query")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Re-run the direct client probes instead of using cached results")
+    args = parser.parse_args()
+    asyncio.run(main(RithmicEnv.load(), refresh=args.refresh))
@@ -0,0 +1,74 @@
+"""
+Benchmarks for the tick processing path.
+
+Needs pytest-benchmark (in the dev extras); skipped without it. Save a
+baseline and compare later runs against it with:
+
+    pytest tests/test_benchmarks.py --benchmark-autosave
+    pytest tests/test_benchmarks.py --benchmark-compare --benchmark-compare-fail=median:10%
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.data.aggregator import FootprintAggregator
+from src.data.tick_cache import ticks_to_arrays
+from src.analysis.engine import OrderFlowEngine
+from tests.test_order_flow import generate_test_ticks
+
+TICK_COUNTS = [500, 5000, 50000]
+ENGINE_CONFIG = {"symbol": "MES", "timeframe": 60, "imbalance_min_volume": 5}
+
+
+def aggregate(ticks):
+    """Aggregate a tick list one tick at a time."""
+    aggregator = FootprintAggregator(timeframe_seconds=60)
+    for tick in ticks:
+        aggregator.process_tick(tick)
+    return aggregator
+
+
+def aggregate_arrays(arrays):
+    """Aggregate TickArrays in one batch."""
+    aggregator = FootprintAggregator(timeframe_seconds=60)
+    aggregator.process_arrays(arrays.ts_ns, arrays.price, arrays.volume, arrays.side, arrays.symbol)
+    return aggregator
+
+
+def run_engine(ticks):
+    """Run a fresh engine over a tick list."""
+    engine = OrderFlowEngine(ENGINE_CONFIG)
+    for tick in ticks:
+        engine.process_tick(tick)
+    return engine
+
+
+@pytest.mark.parametrize("count", TICK_COUNTS)
+def test_aggregator_benchmark(benchmark, count):
+    """Per-tick footprint aggregation."""
+    ticks = generate_test_ticks(count=count)
+    aggregator = benchmark(aggregate, ticks)
+    assert aggregator.current_bar is not None
+
+
+@pytest.mark.parametrize("count", TICK_COUNTS)
+def test_aggregator_arrays_benchmark(benchmark, count):
+    """Batch footprint aggregation."""
+    arrays = ticks_to_arrays(generate_test_ticks(count=count))
+    aggregator = benchmark(aggregate_arrays, arrays)
+    assert aggregator.current_bar is not None
+
+
+@pytest.mark.parametrize("count", TICK_COUNTS)
+def test_order_flow_engine_benchmark(benchmark, count):
+    """Full engine, tick by tick."""
+    ticks = generate_test_ticks(count=count)
+    engine = benchmark(run_engine, ticks)
+    assert engine.get_state()["tick_count"] == count
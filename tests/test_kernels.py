@@ -0,0 +1,172 @@
+"""Tests for the backtest simulation kernels."""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from src.execution.kernels import (
+    EXIT_END,
+    EXIT_STOP,
+    EXIT_TARGET,
+    first_band_cross,
+    first_band_cross_np,
+    simulate_brackets,
+    simulate_brackets_np,
+)
+
+
+TICK_SIZE = 0.25  # MES
+SLIPPAGE = 0.25
+STOP_DIST = 2.0
+TARGET_DIST = 3.0
+
+
+def random_walk(count: int, seed: int = 0) -> np.ndarray:
+    """Tick-grid price walk around 5000."""
+    rng = np.random.default_rng(seed)
+    return 5000.0 + np.cumsum(rng.integers(-1, 2, size=count)) * TICK_SIZE
+
+
+def random_signals(count: int, n_signals: int, seed: int = 0) -> tuple:
+    """Sorted signal ticks (repeats allowed) and +1/-1 directions."""
+    rng = np.random.default_rng(seed)
+    idx = np.sort(rng.integers(0, count, size=n_signals)).astype(np.int64)
+    direction = rng.choice(np.array([-1, 1], dtype=np.int8), size=n_signals)
+    return idx, direction
+
+
+def reference_brackets(prices, signal_idx, signal_dir, slippage, stop_dist, target_dist):
+    """
+    Walk every tick in order, as a live session would.
+
+    At each tick the open trade (if any) is checked for an exit, stop
+    before target, and then the tick's signals may open a new one.
+    """
+    n = len(prices)
+    trades = []
+    open_trade = None
+    j = 0
+    for t in range(n):
+        price = prices[t]
+        if open_trade is not None and t > open_trade["tick"]:
+            long = open_trade["dir"] > 0
+            stop, target = open_trade["stop"], open_trade["target"]
+            if (price <= stop) if long else (price >= stop):
+                trades.append((open_trade["j"], t, EXIT_STOP, open_trade["entry"], stop, target, stop))
+                open_trade = None
+            elif (price >= target) if long else (price <= target):
+                trades.append((open_trade["j"], t, EXIT_TARGET, open_trade["entry"], stop, target, target))
+                open_trade = None
+
+        while j < len(signal_idx) and signal_idx[j] == t:
+            if open_trade is None:
+                sign = 1 if signal_dir[j] > 0 else -1
+                entry = price + sign * slippage
+                open_trade = {
+                    "j": j,
+                    "tick": t,
+                    "dir": sign,
+                    "entry": entry,
+                    "stop": entry - sign * stop_dist,
+                    "target": entry + sign * target_dist,
+                }
+            j += 1
+
+    if open_trade is not None:
+        trades.append((
+            open_trade["j"], n - 1, EXIT_END, open_trade["entry"],
+            open_trade["stop"], open_trade["target"], prices[n - 1],
+        ))
+    return trades
+
+
+def as_rows(ints: np.ndarray, floats: np.ndarray) -> list:
+    """Kernel output as (j, exit tick, reason, entry, stop, target, exit) rows."""
+    return [tuple(i) + tuple(f) for i, f in zip(ints.tolist(), floats.tolist())]
+
+
+def test_first_band_cross():
+    """Test first_band_cross and its NumPy version agree."""
+    prices = random_walk(5000)
+
+    # Narrow bands exit early, wide ones cross the doubling windows or never hit
+    for start in (0, 17, 1023, 4999, 5000):
+        for half_width in (0.5, 5.0, 50.0, 1000.0):
+            mid = prices[min(start, len(prices) - 1)]
+            low, high = mid - half_width, mid + half_width
+            expected = first_band_cross(prices, start, len(prices), low, high)
+            assert first_band_cross_np(prices, start, len(prices), low, high) == expected
+
+    # Boundary prices count as crossing
+    edge = np.array([1.0, 2.0, 3.0])
+    assert first_band_cross(edge, 0, 3, 1.0, 3.0) == 0
+    assert first_band_cross_np(edge, 1, 3, 1.0, 3.0) == 2
+    assert first_band_cross_np(edge, 1, 2, 1.0, 3.0) == 2  # stop when nothing crosses
+
+    print("first_band_cross: PASS")
+
+
+def test_simulate_brackets():
+    """Test both bracket kernels against a per-tick reference."""
+    prices = random_walk(20000, seed=1)
+    for seed, n_signals in [(0, 1), (1, 50), (2, 2000)]:
+        idx, direction = random_signals(len(prices), n_signals, seed=seed)
+        expected = reference_brackets(prices, idx, direction, SLIPPAGE, STOP_DIST, TARGET_DIST)
+
+        jit = as_rows(*simulate_brackets(prices, idx, direction, SLIPPAGE, STOP_DIST, TARGET_DIST))
+        numpy = as_rows(*simulate_brackets_np(prices, idx, direction, SLIPPAGE, STOP_DIST, TARGET_DIST))
+        assert jit == expected
+        assert numpy == expected
+
+    print(f"simulate_brackets: PASS ({len(expected)} trades)")
+
+
+def test_simulate_brackets_edges():
+    """Test stop-before-target, slot reuse at the exit tick and END exits."""
+    # One tick jumps through both the stop and target of a short: stop wins
+    prices = np.array([100.0, 100.0, 200.0, 100.0])
+    idx = np.array([0], dtype=np.int64)
+    short = np.array([-1], dtype=np.int8)
+    for simulate in (simulate_brackets, simulate_brackets_np):
+        ints, floats = simulate(prices, idx, short, 0.0, 1.0, 1.0)
+        assert ints.tolist() == [[0, 2, EXIT_STOP]]
+        assert floats[0, 3] == 101.0
+
+    # A long exits at tick 2; the signal at tick 2 opens the next trade, the
+    # one at tick 1 is skipped, and the last trade runs out at the final tick
+    prices = np.array([100.0, 100.5, 102.0, 102.5, 102.25])
+    idx = np.array([0, 1, 2], dtype=np.int64)
+    long = np.array([1, 1, 1], dtype=np.int8)
+    for simulate in (simulate_brackets, simulate_brackets_np):
+        ints, floats = simulate(prices, idx, long, 0.0, 5.0, 2.0)
+        assert ints.tolist() == [[0, 2, EXIT_TARGET], [2, 4, EXIT_END]]
+        assert floats[:, 3].tolist() == [102.0, 102.25]
+
+    # No signals, no trades
+    none_idx = np.empty(0, dtype=np.int64)
+    none_dir = np.empty(0, dtype=np.int8)
+    for simulate in (simulate_brackets, simulate_brackets_np):
+        ints, floats = simulate(prices, none_idx, none_dir, 0.0, 1.0, 1.0)
+        assert ints.shape == (0, 3) and floats.shape == (0, 4)
+
+    print("simulate_brackets edges: PASS")
+
+
+def run_all_tests():
+    """Run all tests."""
+    rule = "=" * 50
+    sys.stdout.write(f"{rule}\nKERNEL TESTS\n{rule}\n\n")
+
+    test_first_band_cross()
+    test_simulate_brackets()
+    test_simulate_brackets_edges()
+
+    sys.stdout.write(f"\n{rule}\nALL TESTS PASSED\n{rule}\n")
+
+
+if __name__ == "__main__":
+    run_all_tests()
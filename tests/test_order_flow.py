@@ -6,11 +6,12 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from datetime import datetime, timedelta
-import random
+from datetime import datetime, timedelta, timezone
+import numpy as np
 
 from src.core.types import Tick, PriceLevel, FootprintBar, SignalPattern
 from src.data.aggregator import FootprintAggregator, CumulativeDelta, VolumeProfile
+from src.data.tick_cache import ticks_to_arrays
 from src.analysis.detectors import (
     ImbalanceDetector,
     ExhaustionDetector,
@@ -21,34 +22,111 @@ from src.analysis.detectors import (
 from src.analysis.engine import OrderFlowEngine
 
 
+TICK_SIZE = 0.25  # MES
+
+# Random walk step choices (in ticks) and aggressor sides for generate_test_ticks
+_TICK_STEPS = np.array([-1, 0, 1])
+_SIDES = ("BID", "ASK")
+
+# Fixture bars, built once and shared by the tests; tests must not modify them
+_BAR_START = datetime(2024, 1, 1, 14, 30)
+_BAR_END = _BAR_START + timedelta(minutes=5)
+
+FOOTPRINT_BAR = FootprintBar(
+    symbol="MES",
+    start_time=_BAR_START,
+    end_time=_BAR_END,
+    timeframe=300,
+    open_price=5000.0,
+    high_price=5002.0,
+    low_price=4998.0,
+    close_price=5001.0,
+    levels={
+        5000.0: PriceLevel(5000.0, bid_volume=50, ask_volume=100),
+        5000.25: PriceLevel(5000.25, bid_volume=30, ask_volume=80),
+        5000.50: PriceLevel(5000.50, bid_volume=20, ask_volume=60),
+    }
+)
+
+# Clear buy imbalance
+BUY_IMBALANCE_BAR = FootprintBar(
+    symbol="MES",
+    start_time=_BAR_START,
+    end_time=_BAR_END,
+    timeframe=300,
+    open_price=5000.0,
+    high_price=5001.0,
+    low_price=5000.0,
+    close_price=5001.0,
+    levels={
+        5000.0: PriceLevel(5000.0, bid_volume=10, ask_volume=5),
+        5000.25: PriceLevel(5000.25, bid_volume=8, ask_volume=50),  # 50/10 = 500%
+        5000.50: PriceLevel(5000.50, bid_volume=5, ask_volume=40),
+        5000.75: PriceLevel(5000.75, bid_volume=3, ask_volume=35),
+        5001.0: PriceLevel(5001.0, bid_volume=2, ask_volume=30),
+    }
+)
+
+# Buying exhaustion at the top
+BUYING_EXHAUSTION_BAR = FootprintBar(
+    symbol="MES",
+    start_time=_BAR_START,
+    end_time=_BAR_END,
+    timeframe=300,
+    open_price=5000.0,
+    high_price=5002.0,
+    low_price=5000.0,
+    close_price=5001.0,
+    levels={
+        5000.0: PriceLevel(5000.0, bid_volume=50, ask_volume=100),
+        5000.5: PriceLevel(5000.5, bid_volume=40, ask_volume=80),
+        5001.0: PriceLevel(5001.0, bid_volume=30, ask_volume=60),
+        5001.5: PriceLevel(5001.5, bid_volume=20, ask_volume=30),  # Declining
+        5002.0: PriceLevel(5002.0, bid_volume=10, ask_volume=10),  # Exhaustion
+    }
+)
+
+
 def generate_test_ticks(
     symbol: str = "MES",
     count: int = 100,
     base_price: float = 5000.0,
-    start_time: datetime = None
+    start_time: datetime = None,
+    seed: int = 0
 ) -> list:
-    """Generate synthetic tick data for testing."""
+    """
+    Generate synthetic tick data for testing.
+
+    Ticks start at a fixed time unless start_time is given, and the same
+    seed always gives the same ticks, so test runs (and timings) repeat.
+    """
     if start_time is None:
-        start_time = datetime.now()
+        start_time = _BAR_START
+
+    rng = np.random.default_rng(seed)
 
-    ticks = []
-    price = base_price
+    # Random walk, snapped to tick each step. Once on the tick grid a step
+    # only moves the price when the snapped step is non-zero, so the walk
+    # is summed in whole ticks and scaled to a price once at the end.
+    steps = np.rint(rng.choice(_TICK_STEPS, size=count) * rng.random(count)).astype(np.int64)
+    price_ticks = round(base_price / TICK_SIZE) + np.cumsum(steps)
+    prices = price_ticks * TICK_SIZE
 
-    for i in range(count):
-        # Random walk
-        price += random.choice([-0.25, 0, 0.25]) * random.random()
-        price = round(price / 0.25) * 0.25  # Snap to tick
+    volumes = rng.integers(1, 11, size=count)
+    sides = rng.integers(0, 2, size=count)
 
-        tick = Tick(
+    return [
+        Tick(
             timestamp=start_time + timedelta(seconds=i),
             price=price,
-            volume=random.randint(1, 10),
-            side=random.choice(["BID", "ASK"]),
+            volume=volume,
+            side=_SIDES[side],
             symbol=symbol
         )
-        ticks.append(tick)
-
-    return ticks
+        for i, (price, volume, side) in enumerate(
+            zip(prices.tolist(), volumes.tolist(), sides.tolist())
+        )
+    ]
 
 
 def test_price_level():
@@ -62,21 +140,7 @@ def test_price_level():
 
 def test_footprint_bar():
     """Test FootprintBar calculations."""
-    bar = FootprintBar(
-        symbol="MES",
-        start_time=datetime.now(),
-        end_time=datetime.now() + timedelta(minutes=5),
-        timeframe=300,
-        open_price=5000.0,
-        high_price=5002.0,
-        low_price=4998.0,
-        close_price=5001.0,
-        levels={
-            5000.0: PriceLevel(5000.0, bid_volume=50, ask_volume=100),
-            5000.25: PriceLevel(5000.25, bid_volume=30, ask_volume=80),
-            5000.50: PriceLevel(5000.50, bid_volume=20, ask_volume=60),
-        }
-    )
+    bar = FOOTPRINT_BAR
 
     assert bar.total_volume == 340
     assert bar.delta == 140  # (100+80+60) - (50+30+20)
@@ -94,13 +158,10 @@ def test_aggregator():
     """Test FootprintAggregator."""
     aggregator = FootprintAggregator(timeframe_seconds=60)  # 1 minute bars
 
-    ticks = generate_test_ticks(count=200)
-    completed_bars = []
-
-    for tick in ticks:
-        bar = aggregator.process_tick(tick)
-        if bar:
-            completed_bars.append(bar)
+    ticks = ticks_to_arrays(generate_test_ticks(count=200))
+    completed_bars = aggregator.process_arrays(
+        ticks.ts_ns, ticks.price, ticks.volume, ticks.side, ticks.symbol
+    )
 
     assert len(completed_bars) >= 1
     assert aggregator.current_bar is not None
@@ -111,25 +172,7 @@ def test_aggregator():
 def test_imbalance_detector():
     """Test ImbalanceDetector."""
     detector = ImbalanceDetector(threshold=3.0, min_volume=10)
-
-    # Create bar with clear buy imbalance
-    bar = FootprintBar(
-        symbol="MES",
-        start_time=datetime.now(),
-        end_time=datetime.now() + timedelta(minutes=5),
-        timeframe=300,
-        open_price=5000.0,
-        high_price=5001.0,
-        low_price=5000.0,
-        close_price=5001.0,
-        levels={
-            5000.0: PriceLevel(5000.0, bid_volume=10, ask_volume=5),
-            5000.25: PriceLevel(5000.25, bid_volume=8, ask_volume=50),  # 50/10 = 500%
-            5000.50: PriceLevel(5000.50, bid_volume=5, ask_volume=40),
-            5000.75: PriceLevel(5000.75, bid_volume=3, ask_volume=35),
-            5001.0: PriceLevel(5001.0, bid_volume=2, ask_volume=30),
-        }
-    )
+    bar = BUY_IMBALANCE_BAR
 
     signals = detector.detect(bar)
     assert len(signals) > 0
@@ -143,25 +186,7 @@ def test_imbalance_detector():
 def test_exhaustion_detector():
     """Test ExhaustionDetector."""
     detector = ExhaustionDetector(min_levels=3, min_decline_pct=0.30)
-
-    # Create bar with buying exhaustion at top
-    bar = FootprintBar(
-        symbol="MES",
-        start_time=datetime.now(),
-        end_time=datetime.now() + timedelta(minutes=5),
-        timeframe=300,
-        open_price=5000.0,
-        high_price=5002.0,
-        low_price=5000.0,
-        close_price=5001.0,
-        levels={
-            5000.0: PriceLevel(5000.0, bid_volume=50, ask_volume=100),
-            5000.5: PriceLevel(5000.5, bid_volume=40, ask_volume=80),
-            5001.0: PriceLevel(5001.0, bid_volume=30, ask_volume=60),
-            5001.5: PriceLevel(5001.5, bid_volume=20, ask_volume=30),  # Declining
-            5002.0: PriceLevel(5002.0, bid_volume=10, ask_volume=10),  # Exhaustion
-        }
-    )
+    bar = BUYING_EXHAUSTION_BAR
 
     signals = detector.detect(bar)
     print(f"ExhaustionDetector: PASS ({len(signals)} exhaustion signals)")
@@ -189,19 +214,50 @@ def test_order_flow_engine():
 
     state = engine.get_state()
 
-    print(f"OrderFlowEngine: PASS")
-    print(f"  - Ticks processed: {state['tick_count']}")
-    print(f"  - Bars completed: {state['bar_count']}")
-    print(f"  - Signals generated: {len(signals_received)}")
-    print(f"  - Cumulative delta: {state['cumulative_delta']}")
+    sys.stdout.write(
+        "OrderFlowEngine: PASS\n"
+        f"  - Ticks processed: {state['tick_count']}\n"
+        f"  - Bars completed: {state['bar_count']}\n"
+        f"  - Signals generated: {len(signals_received)}\n"
+        f"  - Cumulative delta: {state['cumulative_delta']}\n"
+    )
+
+
+def test_engine_process_ticks():
+    """Test batch process_ticks matches per-tick processing."""
+    config = {"symbol": "MES", "timeframe": 60, "imbalance_min_volume": 5}
+    ticks = generate_test_ticks(
+        count=500, start_time=datetime(2024, 8, 1, 13, 30, tzinfo=timezone.utc)
+    )
+
+    per_tick = OrderFlowEngine(config)
+    per_tick_bars = []
+    per_tick.on_bar(per_tick_bars.append)
+    for tick in ticks:
+        per_tick.process_tick(tick)
+
+    batch = OrderFlowEngine(config)
+    batch_bars = []
+    batch.on_bar(batch_bars.append)
+    arrays = ticks_to_arrays(ticks)
+    # Uneven chunks so batches start mid-bar
+    for lo, hi in [(0, 7), (7, 130), (130, 500)]:
+        batch.process_ticks(
+            arrays.ts_ns[lo:hi], arrays.price[lo:hi], arrays.volume[lo:hi], arrays.side[lo:hi],
+            arrays.symbol,
+        )
+
+    assert batch_bars == per_tick_bars
+    assert batch.aggregator.current_bar == per_tick.aggregator.current_bar
+    assert batch.get_state() == per_tick.get_state()
+
+    print(f"OrderFlowEngine.process_ticks: PASS ({len(batch_bars)} bars)")
 
 
 def run_all_tests():
     """Run all tests."""
-    print("=" * 50)
-    print("ORDER FLOW SYSTEM TESTS")
-    print("=" * 50)
-    print()
+    rule = "=" * 50
+    sys.stdout.write(f"{rule}\nORDER FLOW SYSTEM TESTS\n{rule}\n\n")
 
     test_price_level()
     test_footprint_bar()
@@ -209,11 +265,9 @@ def run_all_tests():
     test_imbalance_detector()
     test_exhaustion_detector()
     test_order_flow_engine()
+    test_engine_process_ticks()
 
-    print()
-    print("=" * 50)
-    print("ALL TESTS PASSED")
-    print("=" * 50)
+    sys.stdout.write(f"\n{rule}\nALL TESTS PASSED\n{rule}\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+"""Tests for tick cache serialization."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.core.types import Tick
+from src.data.tick_cache import (
+    _iso_to_ns,
+    binary_path,
+    datetime_to_ns,
+    ensure_binary_cache,
+    map_tick_arrays,
+    records_to_arrays,
+    ticks_to_records,
+    write_json,
+)
+
+
+EDT = timezone(timedelta(hours=-4))
+EST = timezone(timedelta(hours=-5))
+
+
+def make_ticks(count: int = 50) -> list:
+    """Ticks across the 2024 DST change, so the session mixes -04:00 and -05:00."""
+    start = datetime(2024, 11, 3, 1, 59, 50, tzinfo=EDT)
+    return [
+        Tick(
+            timestamp=(start + timedelta(seconds=i, microseconds=i * 1001)).astimezone(
+                EST if i >= 10 else EDT
+            ),
+            price=5000.0 + (i % 7) * 0.25,
+            volume=1 + i % 5,
+            side="ASK" if i % 3 else "BID",
+            symbol="MESZ4",
+        )
+        for i in range(count)
+    ]
+
+
+def test_iso_to_ns():
+    """Test _iso_to_ns with mixed offsets, naive stamps and nanosecond fractions."""
+    # Mixed offsets: the same instants written in EDT and EST
+    instant = datetime(2024, 11, 3, 5, 59, 59, 123456, tzinfo=timezone.utc)
+    expected = datetime_to_ns(instant)
+    stamps = [instant.astimezone(EDT).isoformat(), instant.astimezone(EST).isoformat()]
+    assert stamps[0] != stamps[1]
+    assert _iso_to_ns(stamps).tolist() == [expected, expected]
+
+    # A single offset for the whole column
+    stamps = [(instant + timedelta(seconds=i)).astimezone(EDT).isoformat() for i in range(3)]
+    assert _iso_to_ns(stamps).tolist() == [expected + i * 1_000_000_000 for i in range(3)]
+
+    # UTC written as "+00:00"
+    assert _iso_to_ns([instant.isoformat()]).tolist() == [expected]
+
+    # Naive stamps are read as local time, like datetime.timestamp()
+    naive = datetime(2024, 8, 1, 9, 30, 0, 250000)
+    assert _iso_to_ns([naive.isoformat()]).tolist() == [datetime_to_ns(naive)]
+
+    # Nanosecond fractions survive the fast path
+    stamps = ["2024-08-01T09:30:00.123456789-04:00", "2024-08-01T09:30:00.000000001-05:00"]
+    base = datetime_to_ns(datetime(2024, 8, 1, 13, 30, tzinfo=timezone.utc))
+    assert _iso_to_ns(stamps).tolist() == [base + 123_456_789, base + 3_600_000_000_000 + 1]
+
+    print("_iso_to_ns: PASS")
+
+
+def test_binary_cache_round_trip():
+    """Test ensure_binary_cache/map_tick_arrays against the parsed JSON."""
+    records = ticks_to_records(make_ticks())
+    expected = records_to_arrays(records)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "MESZ4_2024-11-03_0930_1600.json")
+        assert map_tick_arrays(json_path) is None  # Not cached
+
+        write_json(json_path, records)
+        bin_path = ensure_binary_cache(json_path)
+        assert bin_path == binary_path(json_path)
+
+        arrays = map_tick_arrays(json_path)
+        assert arrays.symbol == expected.symbol
+        assert np.array_equal(arrays.ts_ns, expected.ts_ns)
+        assert np.array_equal(arrays.price, expected.price)
+        assert np.array_equal(arrays.volume, expected.volume)
+        assert np.array_equal(arrays.side, expected.side)
+        assert not arrays.price.flags.writeable
+
+        # A current .bin is reused rather than rebuilt
+        mtime = os.path.getmtime(bin_path)
+        assert ensure_binary_cache(json_path) == bin_path
+        assert os.path.getmtime(bin_path) == mtime
+        del arrays
+
+        # A newer JSON rebuilds it
+        write_json(json_path, records[:5])
+        os.utime(json_path, (mtime + 10, mtime + 10))
+        assert len(map_tick_arrays(json_path).ts_ns) == 5
+
+    print("Binary cache round trip: PASS")
+
+
+def test_binary_cache_empty_session():
+    """Test an empty session maps to empty columns."""
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "MESZ4_2024-11-28_0930_1600.json")
+        write_json(json_path, [])
+
+        arrays = map_tick_arrays(json_path)
+        assert arrays.symbol == ""
+        for column in (arrays.ts_ns, arrays.price, arrays.volume, arrays.side):
+            assert len(column) == 0
+
+    print("Binary cache empty session: PASS")
+
+
+def run_all_tests():
+    """Run all tests."""
+    rule = "=" * 50
+    sys.stdout.write(f"{rule}\nTICK CACHE TESTS\n{rule}\n\n")
+
+    test_iso_to_ns()
+    test_binary_cache_round_trip()
+    test_binary_cache_empty_session()
+
+    sys.stdout.write(f"\n{rule}\nALL TESTS PASSED\n{rule}\n")
+
+
+if __name__ == "__main__":
+    run_all_tests()